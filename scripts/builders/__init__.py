@@ -3,11 +3,33 @@ Package builders - Scripts de construction de contenu.
 
 Ce package contient les classes responsables de la construction
 des différents types de contenu du site statique.
+
+Les classes exportées sont importées à la première utilisation
+(PEP 562) : le builder de galerie, par exemple, charge Pillow.
 """
 
-from .gallery_builder import GalleryBuilder
-from .glossary_builder import GlossaryBuilder
-from .page_builder import PageBuilder
-from .post_builder import PostBuilder
+import importlib
+from typing import Any, List
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "PostBuilder": "post_builder",
+    "PageBuilder": "page_builder",
+    "GlossaryBuilder": "glossary_builder",
+    "GalleryBuilder": "gallery_builder",
+}
 
 __all__ = ["PostBuilder", "PageBuilder", "GlossaryBuilder", "GalleryBuilder"]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,10 @@
 import logging
 import os
 from pathlib import Path
+from typing import List, Optional
 
+from core.build_graph import BuildGraph
+from core.output_store import OutputStore
 from jinja2 import Environment
 from utils.gallery_utils import (
     copy_images,
@@ -9,6 +12,7 @@ from utils.gallery_utils import (
     find_images_dir,
     generate_resized_images,
 )
+from utils.image_processor import ImageProcessor
 
 
 class GalleryBuilder:
@@ -19,12 +23,24 @@ class GalleryBuilder:
         jinja_env: Environment,
         site_config: dict,
         translations: dict,
+        build_graph: Optional[BuildGraph] = None,
+        image_processor: Optional[ImageProcessor] = None,
+        output_store: Optional[OutputStore] = None,
     ):
         self.src_path = src_path
         self.dist_path = dist_path
         self.jinja_env = jinja_env
         self.site_config = site_config
         self.translations = translations
+        self.build_graph = (
+            build_graph if build_graph is not None else BuildGraph.disabled()
+        )
+        self.image_processor = image_processor
+        self.output_store = (
+            output_store if output_store is not None else self.build_graph.store
+        )
+        self._manifest = None
+        self._copied: List[Path] = []
         self.gallery_template = self.site_config.get(
             "gallery_template", "pages/gallery.html"
         )
@@ -33,7 +49,18 @@ class GalleryBuilder:
         ]
         self.unilingual = len(self.languages) == 1
 
-    def build_gallery(self):
+    def build_gallery(self, process_images: bool = True) -> List[Path]:
+        """
+        Copy and resize the gallery images, then render the gallery pages.
+
+        Args:
+            process_images: When False, reuse the images and variant
+                manifest of the previous call (images unchanged since).
+
+        Returns:
+            The original images copied to dist/ (variants are reported by
+            the ImageProcessor, pages by the OutputStore).
+        """
         candidate = self.src_path / "assets/gallery_images"
         if candidate.exists():
             images_dir = candidate
@@ -42,12 +69,24 @@ class GalleryBuilder:
 
         if images_dir is None:
             logging.warning("No gallery images directory found, skipping gallery build")
-            return
+            return []
 
-        copy_images(images_dir, self.dist_path)
-        generate_resized_images(images_dir, self.dist_path)
+        if process_images or self._manifest is None:
+            self._copied = copy_images(images_dir, self.dist_path)
+            self._manifest = generate_resized_images(
+                images_dir, self.dist_path, processor=self.image_processor
+            )
+        manifest = self._manifest
 
         images = find_image_files(images_dir)
+        # Formats generated per image and size, e.g. {"small": ["jpeg", "webp"]}
+        variants = {
+            image: {
+                size: [variant.format.lower() for variant in size_variants]
+                for size, size_variants in manifest.get(image, {}).items()
+            }
+            for image in images
+        }
 
         if self.unilingual:
             lang = self.languages[0]
@@ -59,6 +98,7 @@ class GalleryBuilder:
             output_gallery_dir.mkdir(parents=True, exist_ok=True)
             context = {
                 "gallery": images,
+                "variants": variants,
                 "lang": lang,
                 "prefix": prefix,
                 "url": gallery_url,
@@ -72,14 +112,9 @@ class GalleryBuilder:
                     ),
                 },
             }
-            rendered = self.jinja_env.get_template(self.gallery_template).render(
-                **context
-            )
-            output_index = output_gallery_dir / "index.html"
-            output_index.parent.mkdir(parents=True, exist_ok=True)
-            output_index.write_text(rendered, encoding="utf-8")
+            self._render_gallery_index(output_gallery_dir, lang, context)
             self._render_image_pages(
-                output_gallery_dir, images_dir, images, prefix, context["page"]
+                output_gallery_dir, images, variants, prefix, context["page"]
             )
         else:
             for lang in self.languages:
@@ -89,6 +124,7 @@ class GalleryBuilder:
                 output_gallery_dir.mkdir(parents=True, exist_ok=True)
                 context = {
                     "gallery": images,
+                    "variants": variants,
                     "lang": lang,
                     "prefix": prefix,
                     "url": gallery_url,
@@ -102,15 +138,27 @@ class GalleryBuilder:
                         ),
                     },
                 }
-                rendered = self.jinja_env.get_template(self.gallery_template).render(
-                    **context
-                )
-                output_index = output_gallery_dir / "index.html"
-                output_index.parent.mkdir(parents=True, exist_ok=True)
-                output_index.write_text(rendered, encoding="utf-8")
+                self._render_gallery_index(output_gallery_dir, lang, context)
                 self._render_image_pages(
-                    output_gallery_dir, images_dir, images, prefix, context["page"]
+                    output_gallery_dir, images, variants, prefix, context["page"]
                 )
+        return self._copied
+
+    def _render_gallery_index(self, output_gallery_dir, lang, context):
+        """
+        Rendu de la page index de la galerie, sauf si ses entrées n'ont pas changé.
+        """
+        output_index = output_gallery_dir / "index.html"
+        tracked = {k: v for k, v in context.items() if k not in ("t", "site")}
+        if self.build_graph.is_fresh(
+            output_index, self.gallery_template, lang, context=tracked
+        ):
+            return
+        rendered = self.jinja_env.get_template(self.gallery_template).render(
+            **context
+        )
+        self.output_store.write_text(output_index, rendered)
+        self.build_graph.record(output_index)
 
     def _get_gallery_output(self):
         """
@@ -147,12 +195,10 @@ class GalleryBuilder:
             site=self.site_config,
             t=self.translations.get(page_info["lang"], {}),
         )
-        output_file = output_gallery_dir / "index.html"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(gallery_html)
+        self.output_store.write_text(output_gallery_dir / "index.html", gallery_html)
 
     def _render_image_pages(
-        self, output_gallery_dir, images_dir, image_files, prefix, page_info
+        self, output_gallery_dir, image_files, variants, prefix, page_info
     ):
         """
         Génère une page HTML pour chaque image.
@@ -160,7 +206,6 @@ class GalleryBuilder:
         template = self.jinja_env.get_template("pages/image.html")
         for image in image_files:
             image_stem = os.path.splitext(image)[0]
-            logging.info("Création de la page pour l'image: %s", image)
             image_url = f"{prefix}{image}"
             image_versions = {
                 "small": f"{prefix}small/{image}",
@@ -168,20 +213,35 @@ class GalleryBuilder:
                 "large": f"{prefix}large/{image}",
                 "original": image_url,
             }
+            image_formats = variants.get(image, {}).get("large", [])
+            output_file = output_gallery_dir / f"{image_stem}.html"
+            if self.build_graph.is_fresh(
+                output_file,
+                "pages/image.html",
+                page_info["lang"],
+                context={
+                    "image": image_url,
+                    "image_versions": image_versions,
+                    "image_formats": image_formats,
+                    "page": page_info,
+                },
+            ):
+                continue
+            logging.info("Création de la page pour l'image: %s", image)
             image_html = template.render(
                 image=image_url,
                 image_name=image_stem,
                 image_versions=image_versions,
+                image_formats=image_formats,
                 page=page_info,
                 site=self.site_config,
                 t=self.translations.get(page_info["lang"], {}),
                 prefix=prefix,
             )
-            output_file = output_gallery_dir / f"{image_stem}.html"
             logging.info("Écriture de la page dans : %s", output_file)
             try:
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(image_html)
+                self.output_store.write_text(output_file, image_html)
+                self.build_graph.record(output_file)
             except (OSError, IOError) as e:
                 logging.error("Erreur lors de l'écriture de %s: %s", output_file, e)
 
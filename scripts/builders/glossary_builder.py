@@ -2,9 +2,11 @@ import logging
 import math
 from typing import Any, Dict, List
 
+from core.build_graph import BuildGraph
+from core.content_index import ContentIndex
 from core.context import BuildContext
-from utils.frontmatter_parser import parse_frontmatter
-from utils.utils import build_page, slugify
+from core.render_queue import RenderQueue
+from utils.utils import slugify
 
 
 class GlossaryBuilder:
@@ -23,6 +25,28 @@ class GlossaryBuilder:
         self.translations = context.translations
         self.jinja_env = context.jinja_env
         self.projects = context.projects
+        self.content_index = (
+            context.content_index
+            if context.content_index is not None
+            else ContentIndex()
+        )
+        self.build_graph = (
+            context.build_graph
+            if context.build_graph is not None
+            else BuildGraph.disabled()
+        )
+        self.renderer = (
+            context.renderer
+            if context.renderer is not None
+            else RenderQueue(
+                self.jinja_env,
+                self.src_path / "templates",
+                self.site_config,
+                self.translations,
+                self.projects,
+                build_graph=self.build_graph,
+            )
+        )
         self.glossary_url = self.site_config.get("glossary_url", "/glossaire/").strip(
             "/"
         )
@@ -39,9 +63,8 @@ class GlossaryBuilder:
         terms: List[Dict[str, Any]] = []
         terms_dir = self.src_path / "locales" / lang / "glossaire"
         if terms_dir.exists():
-            for term_file in terms_dir.glob("*.md"):
-                content = term_file.read_text(encoding="utf-8")
-                metadata, _ = parse_frontmatter(content)
+            for term_file in self.content_index.list_dir(terms_dir):
+                metadata = self.content_index.metadata(term_file)
                 slug = metadata.get("slug", term_file.stem)
                 term_data = {
                     "title": metadata.get("title", "Terme sans titre"),
@@ -96,29 +119,27 @@ class GlossaryBuilder:
         return paginated
 
     def _build_individual_term(self, term_file, lang):
-        content = term_file.read_text(encoding="utf-8")
-        metadata, _ = parse_frontmatter(content)
-        slug = metadata.get("slug", term_file.stem)
-        output = build_page(
-            content,
-            self.term_template,
-            lang,
-            custom_url=None,
-            is_post=True,
-            slug=slug,
-            translations=self.translations[lang],
-            site_config=self.site_config,
-            projects=self.projects,
-            jinja_env=self.jinja_env,
-        )
+        slug = self.content_index.metadata(term_file).get("slug", term_file.stem)
         if self.unilingual:
             output_path = self.dist_path / self.glossary_url / slug / "index.html"
         else:
             output_path = (
                 self.dist_path / lang / self.glossary_url / slug / "index.html"
             )
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output, encoding="utf-8")
+        if self.build_graph.is_fresh(
+            output_path, self.term_template, lang, sources=[term_file]
+        ):
+            return
+        entry = self.content_index.get(term_file)
+        self.renderer.render_content(
+            output_path,
+            self.term_template,
+            lang,
+            raw=entry.raw,
+            front_matter=entry.front_matter,
+            body=entry.body,
+            slug=slug,
+        )
 
     def _build_paginated_pages(self, terms, lang):
         paginated = self.paginate_terms(terms, lang)
@@ -133,13 +154,6 @@ class GlossaryBuilder:
                     else f"/{lang}/{self.glossary_url}/"
                 ),
             }
-            output = self.jinja_env.get_template(self.glossary_template).render(
-                pagination=page,
-                page=page_metadata,
-                t=self.translations[lang],
-                site=self.site_config,
-                projects=self.projects,
-            )
             if page["current_page"] == 1:
                 if self.unilingual:
                     output_path = self.dist_path / self.glossary_url / "index.html"
@@ -165,8 +179,19 @@ class GlossaryBuilder:
                         / str(page["current_page"])
                         / "index.html"
                     )
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(output, encoding="utf-8")
+            if self.build_graph.is_fresh(
+                output_path,
+                self.glossary_template,
+                lang,
+                context={"pagination": page, "page": page_metadata},
+            ):
+                continue
+            self.renderer.render_template(
+                output_path,
+                self.glossary_template,
+                lang,
+                {"pagination": page, "page": page_metadata},
+            )
 
     def build_tag_pages(self, terms_by_lang: Dict[str, List[Dict[str, Any]]]) -> None:
         tag_dict: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
@@ -184,8 +209,6 @@ class GlossaryBuilder:
 
         for tag_slug, terms_by_language in tag_dict.items():
             for lang, terms in terms_by_language.items():
-                logging.info(f"🔖 Génération de la page du tag: {tag_slug}")
-
                 tag_metadata = {
                     "title": f"Tag: {tag_slug.replace('-', ' ')}",
                     "description": f"Tous les termes liés à {tag_slug}",
@@ -193,14 +216,6 @@ class GlossaryBuilder:
                     "url": f"/{self.glossary_url}/tags/{tag_slug}/",
                 }
 
-                output = self.jinja_env.get_template("pages/glossary-tag.html").render(
-                    terms=terms,
-                    page=tag_metadata,
-                    t=self.translations[lang],
-                    site=self.site_config,
-                    projects=self.projects,
-                )
-
                 if self.unilingual:
                     output_path = (
                         self.dist_path
@@ -219,10 +234,24 @@ class GlossaryBuilder:
                         / "index.html"
                     )
 
-                logging.info(f"📄 Page du tag générée : {output_path}")
+                if self.build_graph.is_fresh(
+                    output_path,
+                    "pages/glossary-tag.html",
+                    lang,
+                    context={"terms": terms, "page": tag_metadata},
+                ):
+                    continue
+
+                logging.info(f"🔖 Génération de la page du tag: {tag_slug}")
 
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(output, encoding="utf-8")
+                self.renderer.render_template(
+                    output_path,
+                    "pages/glossary-tag.html",
+                    lang,
+                    {"terms": terms, "page": tag_metadata},
+                )
+
+                logging.info(f"📄 Page du tag générée : {output_path}")
 
     def build_terms(self) -> List[Dict[str, Any]]:
         all_terms: List[Dict[str, Any]] = []
@@ -235,7 +264,7 @@ class GlossaryBuilder:
                 all_terms.extend(terms)
         for lang, terms in terms_by_lang.items():
             terms_dir = self.src_path / "locales" / lang / "glossaire"
-            for term_file in terms_dir.glob("*.md"):
+            for term_file in self.content_index.list_dir(terms_dir):
                 self._build_individual_term(term_file, lang)
             self._build_paginated_pages(terms, lang)
 
@@ -6,10 +6,11 @@ from pathlib import Path
 scripts_dir = Path(__file__).parent
 sys.path.insert(0, str(scripts_dir))
 
-import frontmatter
+from core.build_graph import BuildGraph
+from core.content_index import ContentIndex
 from core.context import BuildContext
-from utils import markdown_filter  # type: ignore
-from utils.metadata import extract_metadata
+from core.render_queue import RenderQueue
+from utils.metadata import validate_extracted_metadata
 
 
 class PageBuilder:
@@ -24,6 +25,28 @@ class PageBuilder:
         self.translations = context.translations
         self.jinja_env = context.jinja_env
         self.projects = context.projects
+        self.content_index = (
+            context.content_index
+            if context.content_index is not None
+            else ContentIndex()
+        )
+        self.build_graph = (
+            context.build_graph
+            if context.build_graph is not None
+            else BuildGraph.disabled()
+        )
+        self.renderer = (
+            context.renderer
+            if context.renderer is not None
+            else RenderQueue(
+                self.jinja_env,
+                self.src_path / "templates",
+                self.site_config,
+                self.translations,
+                self.projects,
+                build_graph=self.build_graph,
+            )
+        )
         self.post_builder = post_builder
         self.blog_slug = self.site_config.get("blog_url", "blog").strip("/")
 
@@ -35,9 +58,10 @@ class PageBuilder:
         for lang in self.site_config["languages"]:
             pages_dir = self.src_path / "locales" / lang / "pages"
             if pages_dir.exists():
-                for page_file in pages_dir.glob("*.md"):
-                    content = page_file.read_text(encoding="utf-8")
-                    metadata = extract_metadata(content)
+                for page_file in self.content_index.list_dir(pages_dir):
+                    metadata = validate_extracted_metadata(
+                        self.content_index.metadata(page_file)
+                    )
                     tid = str(metadata.get("translation_id", page_file.stem))
                     slug_override = metadata.get("slug")
                     slug_value = (
@@ -59,12 +83,13 @@ class PageBuilder:
     ) -> None:
         """Rend une page en fonction de son type (blog ou standard)."""
         try:
-            content = page_file.read_text(encoding="utf-8")
+            raw_metadata = self.content_index.metadata(page_file)
         except Exception as e:
             logging.error(f"Erreur lors de la lecture de {page_file}: {e}")
             return
 
-        metadata = extract_metadata(content)
+        metadata = validate_extracted_metadata(raw_metadata)
+
         template_name = metadata.get("template", "pages/home.html")
         tid = str(metadata.get("translation_id", page_file.stem))
         page_trans = page_translations.get(tid, {})
@@ -94,8 +119,6 @@ class PageBuilder:
                 custom_url = f"/{lang}/{slug_value}"
 
         # Rendu de la page
-        translations_static = self.translations.get(lang, {})
-
         if slug_value == self.blog_slug:
             posts = self.load_posts(lang)
             pagination = {"posts": posts}
@@ -110,16 +133,12 @@ class PageBuilder:
                 **metadata,
                 "content_translations": page_trans,
             }
-            rendered = self.jinja_env.get_template(template_name).render(
-                content=content,
-                page=page_metadata,
-                lang=lang,
-                custom_url=custom_url,
-                t=translations_static,
-                site=self.site_config,
-                projects=self.projects,
-                pagination=pagination,
-            )
+            context = {
+                "page": page_metadata,
+                "lang": lang,
+                "custom_url": custom_url,
+                "pagination": pagination,
+            }
         elif page_file.stem == "home":
             # Home page needs recent_posts for the template
             posts = self.load_posts(lang)
@@ -130,14 +149,7 @@ class PageBuilder:
                 "content_translations": page_trans,
                 **metadata,
             }
-            rendered = self.jinja_env.get_template(template_name).render(
-                content=markdown_filter(frontmatter.loads(content).content),
-                page=page_metadata,
-                t=translations_static,
-                site=self.site_config,
-                projects=self.projects,
-                recent_posts=recent_posts,
-            )
+            context = {"page": page_metadata, "recent_posts": recent_posts}
         else:
             page_metadata = {
                 "lang": lang,
@@ -145,16 +157,22 @@ class PageBuilder:
                 "content_translations": page_trans,
                 **metadata,
             }
-            rendered = self.jinja_env.get_template(template_name).render(
-                content=markdown_filter(frontmatter.loads(content).content),
-                page=page_metadata,
-                t=translations_static,
-                site=self.site_config,
-                projects=self.projects,
-            )
+            context = {"page": page_metadata}
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(rendered, encoding="utf-8")
+        if self.build_graph.is_fresh(
+            output_path, template_name, lang, sources=[page_file], context=context
+        ):
+            return
+
+        entry = self.content_index.get(page_file)
+        if slug_value == self.blog_slug:
+            self.renderer.render_template(
+                output_path, template_name, lang, {"content": entry.raw, **context}
+            )
+        else:
+            self.renderer.render_template(
+                output_path, template_name, lang, context, markdown=entry.body
+            )
 
     def build_pages(self) -> None:
         """Construit l'ensemble des pages du site."""
@@ -164,7 +182,7 @@ class PageBuilder:
         for lang in self.site_config["languages"]:
             pages_dir = self.src_path / "locales" / lang / "pages"
             if pages_dir.exists():
-                for page_file in pages_dir.glob("*.md"):
+                for page_file in self.content_index.list_dir(pages_dir):
                     self._render_page(
                         page_file, lang, page_translation_map, is_unilingual
                     )
@@ -188,7 +206,7 @@ class PageBuilder:
 </body>
 </html>
 """
-        (self.dist_path / "index.html").write_text(redirection_html, encoding="utf-8")
+        self.renderer.store.write_text(self.dist_path / "index.html", redirection_html)
 
     def build_taxonomy_pages(
         self, taxonomy_type: str, taxonomy_dict: dict, template_name: str
@@ -227,16 +245,25 @@ class PageBuilder:
                     "taxonomy": taxonomy_name,
                 }
 
-                rendered = self.jinja_env.get_template(template_name).render(
-                    posts=posts_in_lang,
-                    taxonomy_name=taxonomy_name,
-                    page=page_metadata,
-                    site=self.site_config,
-                    t=self.translations.get(lang, {}),
-                )
+                if self.build_graph.is_fresh(
+                    output_path,
+                    template_name,
+                    lang,
+                    context={"posts": posts_in_lang, "page": page_metadata},
+                ):
+                    continue
 
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(rendered, encoding="utf-8")
+                self.renderer.render_template(
+                    output_path,
+                    template_name,
+                    lang,
+                    {
+                        "posts": posts_in_lang,
+                        "taxonomy_name": taxonomy_name,
+                        "page": page_metadata,
+                    },
+                    shared=("site", "t"),
+                )
 
     def build_category_pages(self, categories: dict) -> None:
         """Construit les pages de catégories."""
@@ -3,9 +3,10 @@ import math
 from pathlib import Path
 from typing import Dict, Optional
 
+from core.build_graph import BuildGraph
+from core.content_index import ContentIndex
 from core.context import BuildContext
-from utils.frontmatter_parser import parse_frontmatter
-from utils.utils import build_page
+from core.render_queue import RenderQueue
 
 
 class PostBuilder:
@@ -24,6 +25,28 @@ class PostBuilder:
         self.translations = context.translations
         self.jinja_env = context.jinja_env
         self.projects = context.projects
+        self.content_index = (
+            context.content_index
+            if context.content_index is not None
+            else ContentIndex()
+        )
+        self.build_graph = (
+            context.build_graph
+            if context.build_graph is not None
+            else BuildGraph.disabled()
+        )
+        self.renderer = (
+            context.renderer
+            if context.renderer is not None
+            else RenderQueue(
+                self.jinja_env,
+                self.src_path / "templates",
+                self.site_config,
+                self.translations,
+                self.projects,
+                build_graph=self.build_graph,
+            )
+        )
         self.blog_url = self.site_config.get("blog_url", "blog").strip("/")
         self.post_base_path = (
             self.site_config.get("post_base_url", self.blog_url).strip("/")
@@ -47,9 +70,8 @@ class PostBuilder:
         posts = []
         posts_dir = self._get_posts_dir(lang)
         if posts_dir:
-            for post_file in posts_dir.glob("*.md"):
-                content = post_file.read_text(encoding="utf-8")
-                metadata, _ = parse_frontmatter(content)
+            for post_file in self.content_index.list_dir(posts_dir):
+                metadata = self.content_index.metadata(post_file)
                 slug = metadata.get("slug", post_file.stem)
                 tid = str(metadata.get("translation_id", slug))
                 summary = metadata.get("summary") or metadata.get("description", "")
@@ -143,27 +165,33 @@ class PostBuilder:
     def _build_individual_post(
         self, post_file: Path, lang: str, translation_map: dict
     ) -> None:
-        content = post_file.read_text(encoding="utf-8")
-        metadata, _ = parse_frontmatter(content)
+        metadata = self.content_index.metadata(post_file)
         slug = metadata.get("slug", post_file.stem)
         tid = str(metadata.get("translation_id", slug))
         content_translations = translation_map.get(tid, {})
-        output = build_page(
-            content,
+        output_path = self._build_post_output_path(slug, lang)
+        if self.build_graph.is_fresh(
+            output_path,
             self.post_template,
             lang,
-            custom_url=None,
-            is_post=True,
+            sources=[post_file],
+            context={
+                "url": self._build_post_url(slug, lang),
+                "content_translations": content_translations,
+            },
+        ):
+            return
+        entry = self.content_index.get(post_file)
+        self.renderer.render_content(
+            output_path,
+            self.post_template,
+            lang,
+            raw=entry.raw,
+            front_matter=entry.front_matter,
+            body=entry.body,
             slug=slug,
-            translations=self.translations[lang],
-            site_config=self.site_config,
-            projects=self.projects,
-            jinja_env=self.jinja_env,
             content_translations=content_translations,
         )
-        output_path = self._build_post_output_path(slug, lang)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output, encoding="utf-8")
 
     def _build_paginated_pages(self, posts: list, lang: str) -> None:
         paginated = self.paginate_posts(posts, lang)
@@ -182,24 +210,25 @@ class PostBuilder:
                 "url": page["base_url"],
                 "pagination": page,
             }
-            logging.info(
-                f"📢 Génération de la page {page['current_page']} avec {len(page['posts'])} articles"
-            )
-            output = self.jinja_env.get_template(self.blog_template).render(
-                pagination=page,
-                page=page_metadata,
-                t=self.translations[lang],
-                site=self.site_config,
-                projects=self.projects,
-            )
             if page["current_page"] == 1:
                 output_path = self._build_output_path(*list_segments)
             else:
                 output_path = self._build_output_path(
                     *(list_segments + ["page", str(page["current_page"])])
                 )
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(output, encoding="utf-8")
+            if self.build_graph.is_fresh(
+                output_path, self.blog_template, lang, context={"page": page_metadata}
+            ):
+                continue
+            logging.info(
+                f"📢 Génération de la page {page['current_page']} avec {len(page['posts'])} articles"
+            )
+            self.renderer.render_template(
+                output_path,
+                self.blog_template,
+                lang,
+                {"pagination": page, "page": page_metadata},
+            )
 
     def get_recent_posts(self, posts: list, count: int = 3) -> list:
         """Retourne les posts récents (par défaut, les 3 premiers)."""
@@ -242,8 +271,7 @@ class PostBuilder:
             if self.unilingual
             else self.dist_path / lang / "index.html"
         )
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output, encoding="utf-8")
+        self.renderer.store.write_text(output_path, output)
 
     def build_posts(self) -> list:
         all_posts = []
@@ -265,7 +293,7 @@ class PostBuilder:
         for lang, posts in posts_by_lang.items():
             posts_dir = self._get_posts_dir(lang)
             if posts_dir:
-                for post_file in posts_dir.glob("*.md"):
+                for post_file in self.content_index.list_dir(posts_dir):
                     self._build_individual_post(post_file, lang, translation_map)
                 self._build_paginated_pages(posts, lang)
 
@@ -6,10 +6,32 @@ la configuration et les managers de fichiers statiques.
 
 Note: SiteBuilder is not exported here to avoid circular imports.
 Import directly: from core.build import SiteBuilder
+
+Exported names are imported on first use (PEP 562), so that importing
+one core module does not load the others.
 """
 
-from .config_loader import ConfigLoader
-from .context import BuildContext
-from .static_file_manager import StaticFileManager
+import importlib
+from typing import Any, List
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "ConfigLoader": "config_loader",
+    "StaticFileManager": "static_file_manager",
+    "BuildContext": "context",
+}
 
 __all__ = ["ConfigLoader", "StaticFileManager", "BuildContext"]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
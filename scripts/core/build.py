@@ -2,19 +2,29 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 # Add scripts directory to Python path
-scripts_dir = Path(__file__).parent.parent
+scripts_dir = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(scripts_dir))
 
-from builders.gallery_builder import GalleryBuilder
-from builders.glossary_builder import GlossaryBuilder
-from builders.post_builder import PostBuilder
-from core.config_loader import ConfigLoader
-from core.context import BuildContext
-from core.static_file_manager import StaticFileManager
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from utils.utils import format_date_filter, markdown_filter, slugify
+# Builders, Jinja2, Markdown and Pillow are imported by SiteBuilder, not
+# here: `--help` and `idoine check` do not pay for them
+from core.build_profiler import BuildProfiler
+from utils.constants import (
+    BUILD_GRAPH_FILE,
+    CACHE_DIR,
+    FILE_HASHES_FILE,
+    IMAGE_VARIANTS_DIR,
+    MARKDOWN_CACHE_FILE,
+    OUTPUT_MANIFEST_FILE,
+    PROFILE_REPORT_FILE,
+    PROFILE_TRACE_FILE,
+    TEMPLATE_BYTECODE_DIR,
+)
+
+if TYPE_CHECKING:
+    from core.output_store import OutputStore
 
 # UTF-8 encoding configuration removed due to linter compatibility
 
@@ -24,41 +34,141 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+# Source directories scanned at the start of a full build. Assets are left
+# to StaticFileManager, which compares them with their copies, and styles
+# and scripts to the frontend build
+SCANNED_SOURCE_DIRS = ("locales", "templates", "config", "data")
+
 ICON_START = "🚀"
+ICON_SCAN = "🔎"
 ICON_CLEAN = "🧹"
 ICON_COPY = "📋"
 ICON_BUILD = "📝"
 ICON_GLOSSARY = "📖"
 ICON_CATEGORY = "📂"
 ICON_REDIRECT = "🔀"
+ICON_PROFILE = "⏱️"
 ICON_SUCCESS = "✨"
 ICON_ERROR = "❌"
 
 
 class SiteBuilder:
-    def __init__(self):
-        self.base_path = Path(__file__).parent.parent.parent
+    def __init__(
+        self,
+        incremental: bool = False,
+        jobs: int = 1,
+        output_store: Optional["OutputStore"] = None,
+        precompile: bool = False,
+        profile: bool = False,
+        profile_top: int = 10,
+        base_path: Optional[Path] = None,
+    ):
+        from builders.gallery_builder import GalleryBuilder
+        from builders.glossary_builder import GlossaryBuilder
+        from builders.post_builder import PostBuilder
+        from core.build_graph import BuildGraph
+        from core.build_manifest import BuildManifest
+        from core.config_loader import ConfigLoader
+        from core.content_index import ContentIndex
+        from core.context import BuildContext
+        from core.output_store import OutputStore
+        from core.render_queue import RenderQueue
+        from core.static_file_manager import StaticFileManager
+        from core.template_renderer import create_jinja_environment
+        from utils.file_cache import FileCache
+        from utils.image_processor import ImageProcessor
+        from utils.markdown_renderer import set_html_cache, set_markdown_engine
+
+        # Project root holding src/, dist/ and the caches (benchmarks build
+        # generated sites elsewhere)
+        self.base_path = (
+            Path(base_path) if base_path is not None else scripts_dir.parent
+        )
         self.src_path = self.base_path / "src"
         self.dist_path = self.base_path / "dist"
+        self.incremental = incremental
+        # Time spent per phase, template and page (--profile)
+        self.profiler = BuildProfiler(enabled=profile, root=self.dist_path)
+        self.profile_top = profile_top
+        # Files emitted into dist/, so that a build removes only its orphans.
+        # A caller-provided store owns its pages: nothing is tracked then.
+        if output_store is None:
+            self.manifest = BuildManifest(
+                self.base_path / CACHE_DIR / OUTPUT_MANIFEST_FILE, self.dist_path
+            )
+            output_store = OutputStore(self.dist_path, manifest=self.manifest)
+        else:
+            self.manifest = BuildManifest.disabled()
+        # Rendered pages go here; static files and images always go to dist/
+        self.output_store = output_store
 
         config_loader = ConfigLoader(self.src_path)
         self.translations = config_loader.load_translations()
         self.projects = config_loader.load_projects()
         self.site_config = config_loader.load_site_config()
 
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.src_path / "templates")),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
-        self.jinja_env.filters["date"] = format_date_filter
-        self.jinja_env.filters["markdown"] = markdown_filter
-        self.jinja_env.filters["slugify"] = slugify
-
         self.is_multilingual = len(self.site_config.get("languages", [])) > 1
-        self.jinja_env.globals["is_multilingual"] = self.is_multilingual
-        self.jinja_env.globals["is_unilingual"] = not self.is_multilingual
+        # Compiled templates survive across builds and are shared with the
+        # render workers; only edited templates are compiled again
+        self.jinja_env = create_jinja_environment(
+            self.src_path / "templates",
+            self.is_multilingual,
+            self.base_path / CACHE_DIR / TEMPLATE_BYTECODE_DIR,
+        )
+        self.precompile = precompile
 
-        self.static_manager = StaticFileManager(self.src_path, self.dist_path)
+        # Digests of sources and static copies, shared by the source scan,
+        # the build graph and the static file manager
+        self.file_cache = FileCache(self.base_path / CACHE_DIR, FILE_HASHES_FILE)
+        self.static_manager = StaticFileManager(
+            self.src_path,
+            self.dist_path,
+            file_cache=self.file_cache,
+            copy_mode=self.site_config.get("static_copy_mode", "copy"),
+            images_alias=self.site_config.get("legacy_images_alias", "copy"),
+        )
+        self.image_processor = ImageProcessor(
+            sizes=self.site_config.get("image_sizes"),
+            quality=self.site_config.get("image_quality"),
+            cache_dir=self.base_path / CACHE_DIR / IMAGE_VARIANTS_DIR,
+            jobs=jobs,
+            file_cache=self.file_cache,
+        )
+        # Converted Markdown survives across builds: a template change
+        # re-renders pages without converting their bodies again
+        self.html_cache = set_html_cache(
+            self.base_path / CACHE_DIR / MARKDOWN_CACHE_FILE
+        )
+        set_markdown_engine(self.site_config.get("markdown_engine", "python-markdown"))
+        self.content_index = ContentIndex()
+        # Whether the content index and build graph hold a previous build
+        self._warm = False
+        # An in-memory store starts empty: persisting its graph would only
+        # describe pages that are gone
+        self.build_graph = BuildGraph(
+            None
+            if self.output_store.in_memory
+            else self.base_path / CACHE_DIR / BUILD_GRAPH_FILE,
+            self.dist_path,
+            jinja_env=self.jinja_env,
+            site_config=self.site_config,
+            translations=self.translations,
+            projects=self.projects,
+            code_dir=scripts_dir,
+            store=self.output_store,
+            file_cache=self.file_cache,
+        )
+        self.renderer = RenderQueue(
+            self.jinja_env,
+            self.src_path / "templates",
+            self.site_config,
+            self.translations,
+            self.projects,
+            build_graph=self.build_graph,
+            jobs=jobs,
+            store=self.output_store,
+            profiler=self.profiler,
+        )
 
         ctx = BuildContext(
             src_path=self.src_path,
@@ -67,6 +177,9 @@ class SiteBuilder:
             translations=self.translations,
             jinja_env=self.jinja_env,
             projects=self.projects,
+            content_index=self.content_index,
+            build_graph=self.build_graph,
+            renderer=self.renderer,
         )
 
         # Initialize builders with BuildContext
@@ -80,30 +193,134 @@ class SiteBuilder:
             ctx,
             post_builder=self.post_builder,
         )
+        self.gallery_builder = GalleryBuilder(
+            self.src_path,
+            self.dist_path,
+            self.jinja_env,
+            self.site_config,
+            self.translations,
+            build_graph=self.build_graph,
+            image_processor=self.image_processor,
+            output_store=self.output_store,
+        )
 
-    def build(self):
+    def requires_reload(self, changed: Iterable[Path]) -> bool:
+        """
+        Tell whether changed files include configuration read at construction.
+
+        Site configuration, translations and projects are loaded once by
+        __init__; a change to them needs a new SiteBuilder.
+        """
+        config_dirs = [self.src_path / "config", self.src_path / "data"]
+        return any(
+            config_dir in Path(path).absolute().parents
+            for path in changed
+            for config_dir in config_dirs
+        )
+
+    def build(self, changed: Optional[Iterable[Path]] = None) -> bool:
+        """
+        Build the site.
+
+        Args:
+            changed: Files changed since the previous build of this instance.
+                When given, the build is incremental: only those files are
+                re-read, and static files and gallery images are processed
+                only if something under src/assets changed.
+
+        Returns:
+            True if the build succeeded.
+        """
+        changed_paths = (
+            None if changed is None else {Path(p).absolute() for p in changed}
+        )
+        phase = self.profiler.phase
+        self.profiler.begin_build()
         try:
             logging.info(f"{ICON_START} Début de la construction du site...")
-            logging.info(f"{ICON_CLEAN} Nettoyage du dossier de sortie...")
-            self.static_manager.setup_output_dir()
-            logging.info(f"{ICON_COPY} Copie des fichiers statiques...")
-            self.static_manager.copy_static_files()
-
-            gallery_builder = GalleryBuilder(
-                self.src_path,
-                self.dist_path,
-                self.jinja_env,
-                self.site_config,
-                self.translations,
+            if self.precompile:
+                from core.template_renderer import precompile_templates
+
+                with phase("precompile_templates"):
+                    count = precompile_templates(self.jinja_env)
+                logging.info(f"{ICON_BUILD} {count} template(s) précompilé(s)")
+                self.precompile = False
+            invalidated = changed_paths
+            # A warm builder may reuse HTML converted by its previous build
+            # without looking it up in the Markdown cache
+            cold = not self._warm
+            if changed_paths is None:
+                # Hash only what changed since the previous build; the build
+                # graph then reuses these digests instead of reading sources
+                with phase("scan_sources"):
+                    changes = self.file_cache.scan(
+                        self.src_path / name
+                        for name in SCANNED_SOURCE_DIRS
+                        if (self.src_path / name).is_dir()
+                    )
+                logging.info(
+                    f"{ICON_SCAN} Sources : {len(changes.added)} ajoutée(s), "
+                    f"{len(changes.modified)} modifiée(s), "
+                    f"{len(changes.deleted)} supprimée(s)"
+                )
+                # A warm builder forgets only what the scan found changed
+                invalidated = changes.changed if self._warm else None
+            if invalidated is None:
+                self.content_index.clear()
+            else:
+                for path in invalidated:
+                    self.content_index.invalidate(path)
+            self.build_graph.begin_build(invalidated)
+            self._warm = True
+            self.manifest.begin_build()
+            self.output_store.reset_stats()
+            incremental = self.incremental or changed_paths is not None
+            session = self.html_cache.begin_session()
+            prune_html_cache = False
+            if incremental and self.dist_path.exists():
+                logging.info(
+                    f"{ICON_BUILD} Construction incrémentale "
+                    f"({len(self.build_graph)} sorties connues)..."
+                )
+            else:
+                logging.info(f"{ICON_BUILD} Construction complète...")
+                self.dist_path.mkdir(parents=True, exist_ok=True)
+                self.build_graph.reset()
+                # Every page is rendered: Markdown this build did not use is
+                # stale
+                prune_html_cache = cold and changed_paths is None
+            assets_dir = self.src_path / "assets"
+            assets_changed = changed_paths is None or any(
+                assets_dir in path.parents for path in changed_paths
             )
-            gallery_builder.build_gallery()
+            if assets_changed:
+                logging.info(f"{ICON_COPY} Copie des fichiers statiques...")
+                with phase("copy_static_files"):
+                    self.manifest.add_all(self.static_manager.copy_static_files())
+                    if self.site_config.get("optimize_images", False):
+                        self.image_processor.submit_directory(
+                            assets_dir / "images",
+                            self.dist_path / "assets" / "images",
+                        )
+
+            with phase("gallery_builder"):
+                self.manifest.add_all(
+                    self.gallery_builder.build_gallery(process_images=assets_changed)
+                )
+            # Images queued without a gallery to flush them
+            with phase("images"):
+                self.image_processor.flush()
+                self.manifest.add_all(self.image_processor.take_outputs())
 
             logging.info(f"{ICON_BUILD} Génération des pages...")
-            self.page_builder.build_pages()
+            with phase("page_builder"):
+                self.page_builder.build_pages()
             logging.info(f"{ICON_BUILD} Génération des posts...")
-            posts = self.post_builder.build_posts()
+            with phase("post_builder"):
+                posts = self.post_builder.build_posts()
             logging.info(f"{ICON_GLOSSARY} Génération du glossaire...")
-            self.glossary_builder.build_terms()
+            with phase("glossary_builder"):
+                self.glossary_builder.build_terms()
             logging.info(
                 f"{ICON_CATEGORY} Regroupement des posts pour les catégories et mots-clés..."
             )
@@ -119,29 +336,148 @@ class SiteBuilder:
                     tags.setdefault(tag, []).append(post)
 
             logging.info(f"{ICON_CATEGORY} Génération des pages pour les catégories...")
-            self.page_builder.build_category_pages(categories)
+            with phase("category_pages"):
+                self.page_builder.build_category_pages(categories)
             logging.info(f"{ICON_CATEGORY} Génération des pages pour les mots-clés...")
-            self.page_builder.build_keyword_pages(keywords)
+            with phase("keyword_pages"):
+                self.page_builder.build_keyword_pages(keywords)
             logging.info(f"{ICON_CATEGORY} Génération des pages pour les tags...")
-            self.page_builder.build_tag_pages(tags)
+            with phase("tag_pages"):
+                self.page_builder.build_tag_pages(tags)
+            # With --jobs, waits for the pages still rendering in workers
+            with phase("render_drain"):
+                self.renderer.drain()
             logging.info(f"{ICON_REDIRECT} Création de la redirection racine...")
             if self.is_multilingual:
                 self.page_builder.build_root_redirect()
+            with phase("sweep"):
+                removed = self.build_graph.sweep()
+                if removed:
+                    logging.info(
+                        f"{ICON_CLEAN} {len(removed)} sortie(s) obsolète(s) "
+                        "supprimée(s)"
+                    )
+                # Pages kept in place were not written; the graph lists them all
+                self.manifest.add_all(self.build_graph.outputs())
+                if changed_paths is None:
+                    orphans = self.manifest.sweep()
+                    for path in orphans:
+                        self.file_cache.remove(path)
+                    if orphans:
+                        logging.info(
+                            f"{ICON_CLEAN} {len(orphans)} fichier(s) orphelin(s) "
+                            "supprimé(s)"
+                        )
+                self.manifest.save(complete=changed_paths is None)
+                if prune_html_cache:
+                    pruned = self.html_cache.prune(session)
+                    if pruned:
+                        logging.info(
+                            f"{ICON_CLEAN} {pruned} entrée(s) obsolète(s) "
+                            "supprimée(s) du cache Markdown"
+                        )
+            stats = self.output_store.stats
+            logging.info(
+                f"{ICON_BUILD} Pages : {stats.written} écrite(s), "
+                f"{stats.unchanged} inchangée(s), {stats.deleted} supprimée(s)"
+            )
             logging.info(f"{ICON_SUCCESS} Site construit avec succès!")
+            return True
         except Exception as e:
             logging.error(
                 f"{ICON_ERROR} Erreur durant la construction du site: {e}",
                 exc_info=True,
             )
+            return False
+        finally:
+            self.renderer.close()
+            self.build_graph.save()
+            self.file_cache.save()
+            if self.profiler.enabled:
+                self._write_profile()
 
+    def _write_profile(self) -> None:
+        """Write the --profile report and trace, and log the summary."""
+        self.profiler.end_build()
+        report_path = self.base_path / CACHE_DIR / PROFILE_REPORT_FILE
+        trace_path = self.base_path / CACHE_DIR / PROFILE_TRACE_FILE
+        self.profiler.write_report(report_path, top=self.profile_top)
+        self.profiler.write_trace(trace_path)
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Site Builder CLI options")
+        report = self.profiler.report(top=self.profile_top)
+        total = report["total"]
+        logging.info(
+            f"{ICON_PROFILE} Profil : {total['wall_s']:.2f}s "
+            f"({total['cpu_s']:.2f}s CPU), {total['pages']} page(s) rendue(s)"
+        )
+        for entry in sorted(report["phases"], key=lambda p: p["wall_s"], reverse=True):
+            logging.info(
+                f"{ICON_PROFILE}   {entry['name']:<22} {entry['wall_s']:8.3f}s "
+                f"{entry['cpu_s']:8.3f}s CPU"
+            )
+        for page in report["slowest_pages"]:
+            logging.info(
+                f"{ICON_PROFILE}   {page['wall_s'] * 1000:8.1f}ms "
+                f"{page['output']} ({page['template']})"
+            )
+        logging.info(f"{ICON_PROFILE} Rapport : {report_path}")
+        logging.info(f"{ICON_PROFILE} Trace Chrome : {trace_path}")
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    """Build the site from the command line; return the exit status."""
+    parser = argparse.ArgumentParser(prog=prog, description="Site Builder CLI options")
     parser.add_argument("--build", action="store_true", help="Build the site")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep dist/ and re-render only outputs whose inputs changed",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Render pages and encode gallery images in N worker processes "
+            "(0 = one per CPU, default: 1)"
+        ),
+    )
+    parser.add_argument(
+        "--precompile-templates",
+        action="store_true",
+        help="Compile every template into the bytecode cache before building",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Time each phase, template and page; write a JSON report and a "
+            "Chrome trace to .idoine_cache/"
+        ),
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of slowest pages listed by --profile (default: 10)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     if args.build:
-        builder = SiteBuilder()
-        builder.build()
-    else:
-        parser.print_help()
+        builder = SiteBuilder(
+            incremental=args.incremental,
+            jobs=args.jobs,
+            precompile=args.precompile_templates,
+            profile=args.profile,
+            profile_top=args.profile_top,
+        )
+        return 0 if builder.build() else 1
+    parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
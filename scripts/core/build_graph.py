@@ -0,0 +1,554 @@
+"""
+Persistent dependency graph for incremental builds.
+
+Records, for every generated output file, the inputs it was rendered
+from: source files, the template and its include/extends/import chain,
+the site configuration keys and translation entries the templates read,
+and the builder-provided render context. A later build re-renders an
+output only when one of those inputs changed, and deletes outputs whose
+sources disappeared.
+
+What each template references is stored too, keyed by the digest of its
+source, so that a build where no template changed parses none of them.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from jinja2 import Environment, TemplateNotFound, meta, nodes
+
+from core.output_store import OutputStore
+from utils.file_cache import FileCache
+
+logger = logging.getLogger(__name__)
+
+# Template variables whose key-level accesses are tracked
+TRACKED_VARIABLES = ("site", "t", "projects")
+
+# Marker recorded when a template uses a whole mapping (or a dynamic name)
+WILDCARD = "*"
+
+_MAPPING_METHODS = ("items", "keys", "values")
+
+# Site configuration keys read by the builders themselves (routing,
+# pagination, template selection): a change invalidates every output.
+_BUILDER_CONFIG_KEYS = (
+    "languages",
+    "unilingual",
+    "lang",
+    "multilang",
+    "markdown_engine",
+)
+_BUILDER_CONFIG_SUFFIXES = ("_url", "_template", "_per_page")
+
+
+def _stable_digest(value: Any) -> str:
+    """Hash an arbitrary JSON-like value deterministically."""
+    try:
+        payload = json.dumps(value, sort_keys=True, default=str)
+    except TypeError:
+        # Mixed-type dict keys cannot be sorted; fall back to repr
+        payload = repr(value)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _code_digest(code_dir: Optional[Path]) -> str:
+    """Hash the generator's own sources so code changes invalidate the graph."""
+    if code_dir is None or not code_dir.exists():
+        return ""
+    hasher = hashlib.sha256()
+    for path in sorted(code_dir.rglob("*.py")):
+        hasher.update(path.relative_to(code_dir).as_posix().encode("utf-8"))
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+class TemplateAnalysis:
+    """Static dependencies of a template and everything it pulls in."""
+
+    def __init__(self) -> None:
+        self.templates: Set[str] = set()
+        self.keys: Dict[str, Set[str]] = {name: set() for name in TRACKED_VARIABLES}
+
+
+class BuildGraph:
+    """
+    Output → inputs graph persisted between builds.
+
+    Usage from a builder::
+
+        if self.build_graph.is_fresh(output_path, template, lang, sources, ctx):
+            return
+        ...render and write output_path...
+        self.build_graph.record(output_path)
+
+    A disabled graph (BuildGraph.disabled()) never reports an output as
+    fresh and records nothing, so builders need no special casing.
+    """
+
+    GRAPH_VERSION = "1"
+
+    def __init__(
+        self,
+        graph_path: Optional[Path],
+        dist_path: Path,
+        jinja_env: Optional[Environment] = None,
+        site_config: Optional[Dict[str, Any]] = None,
+        translations: Optional[Dict[str, Any]] = None,
+        projects: Any = None,
+        code_dir: Optional[Path] = None,
+        store: Optional[OutputStore] = None,
+        file_cache: Optional[FileCache] = None,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the BuildGraph.
+
+        Args:
+            graph_path: JSON file persisting the graph. None keeps it in
+                memory only.
+            dist_path: Output root; outputs are stored relative to it.
+            jinja_env: Environment used to load and analyse templates.
+            site_config: Site configuration passed to templates as `site`.
+            translations: Translations keyed by language, passed as `t`.
+            projects: Project data passed to templates as `projects`.
+            code_dir: Generator sources; any change invalidates the graph.
+            store: Where outputs are checked for and swept from.
+                Default: OutputStore(dist_path).
+            file_cache: Digest store for Markdown and YAML sources; files
+                whose stat() is unchanged are then not read again.
+            enabled: False for a graph that never skips anything.
+        """
+        self.graph_path = Path(graph_path) if graph_path else None
+        self.dist_path = Path(dist_path)
+        self.store = store if store is not None else OutputStore(self.dist_path)
+        self.file_cache = file_cache
+        self.jinja_env = jinja_env
+        self.site_config = site_config or {}
+        self.translations = translations or {}
+        self.projects = projects
+        self.enabled = enabled
+        self.code_digest = _code_digest(code_dir) if self.enabled else ""
+
+        self._outputs: Dict[str, Dict[str, Any]] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._seen: Set[str] = set()
+        self._changed: List[str] = []
+        self._analyses: Dict[str, TemplateAnalysis] = {}
+        # Per-template parse results: source digest, references, keys
+        self._parsed: Dict[str, Dict[str, Any]] = {}
+        self._template_digests: Dict[str, str] = {}
+        self._template_fingerprints: Dict[Tuple[str, str], str] = {}
+        self._source_digests: Dict[Path, str] = {}
+        self._dirty = False
+
+        if self.enabled:
+            self._load()
+
+    @classmethod
+    def disabled(cls) -> "BuildGraph":
+        """Return a graph that never skips and never persists anything."""
+        return cls(None, Path("."), enabled=False)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        """Load the graph from disk, starting fresh on any mismatch."""
+        if self.graph_path is None or not self.graph_path.exists():
+            return
+        try:
+            with open(self.graph_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load build graph: {e}")
+            return
+
+        if data.get("version") != self.GRAPH_VERSION:
+            logger.info("Build graph version mismatch, starting fresh")
+            return
+        if data.get("code") != self.code_digest:
+            logger.info("Generator code changed, starting fresh build graph")
+            return
+        self._outputs = data.get("outputs", {})
+        self._parsed = data.get("templates", {})
+        logger.debug(f"Loaded {len(self._outputs)} build graph entries")
+
+    def save(self) -> None:
+        """Persist the graph to disk."""
+        if not self.enabled or not self._dirty or self.graph_path is None:
+            return
+        try:
+            self.graph_path.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "version": self.GRAPH_VERSION,
+                "code": self.code_digest,
+                "updated_at": datetime.now().isoformat(),
+                "outputs": self._outputs,
+                "templates": self._parsed,
+            }
+            tmp_path = self.graph_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.graph_path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Could not save build graph: {e}")
+
+    def reset(self) -> None:
+        """Forget every recorded output (used for clean builds)."""
+        self._outputs.clear()
+        self._pending.clear()
+        self._seen.clear()
+        self._dirty = True
+
+    def begin_build(self, changed: Optional[Iterable[Path]] = None) -> None:
+        """
+        Drop per-build caches; call at the start of every build.
+
+        Args:
+            changed: Files known to have changed since the previous build of
+                this instance. When given, digests of the other sources are
+                kept, and template caches survive unless a non-Markdown file
+                changed.
+        """
+        self._pending.clear()
+        self._seen.clear()
+        self._changed.clear()
+        if changed is None:
+            self._source_digests.clear()
+        else:
+            changed = [Path(p) for p in changed]
+            for path in changed:
+                self._source_digests.pop(path, None)
+            if all(path.suffix.lower() in (".md", ".markdown") for path in changed):
+                return
+        self._analyses.clear()
+        self._template_digests.clear()
+        self._template_fingerprints.clear()
+
+    # ------------------------------------------------------------------
+    # Template analysis
+    # ------------------------------------------------------------------
+
+    def _template_source(self, name: str) -> Optional[str]:
+        if self.jinja_env is None or self.jinja_env.loader is None:
+            return None
+        try:
+            source, _, _ = self.jinja_env.loader.get_source(self.jinja_env, name)
+        except TemplateNotFound:
+            return None
+        return source
+
+    def _template_digest(self, name: str) -> str:
+        digest = self._template_digests.get(name)
+        if digest is None:
+            source = self._template_source(name)
+            digest = (
+                hashlib.sha256(source.encode("utf-8")).hexdigest()
+                if source is not None
+                else ""
+            )
+            self._template_digests[name] = digest
+        return digest
+
+    def _template_dependencies(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the templates one template references and the keys it reads.
+
+        Parsed once per version of the template: the result is kept with
+        the digest of its source and persisted with the graph.
+        """
+        digest = self._template_digest(name)
+        if not digest or self.jinja_env is None:
+            return None
+        parsed = self._parsed.get(name)
+        if parsed is not None and parsed.get("digest") == digest:
+            return parsed
+
+        try:
+            ast = self.jinja_env.parse(self._template_source(name))
+        except Exception as e:
+            logger.warning(f"Could not parse template {name}: {e}")
+            return None
+        keys: Dict[str, Set[str]] = {var: set() for var in TRACKED_VARIABLES}
+        self._collect_keys(ast, None, keys)
+        parsed = {
+            "digest": digest,
+            "refs": [
+                WILDCARD if ref is None else ref
+                for ref in meta.find_referenced_templates(ast)
+            ],
+            "keys": {var: sorted(found) for var, found in keys.items()},
+        }
+        self._parsed[name] = parsed
+        self._dirty = True
+        return parsed
+
+    def analyse_template(self, name: str) -> TemplateAnalysis:
+        """
+        Compute the include/extends/import closure of a template and the
+        `site`, `t` and `projects` keys read anywhere in that closure.
+
+        Dynamic template names and whole-mapping uses are recorded as
+        WILDCARD so the dependency stays conservative.
+        """
+        cached = self._analyses.get(name)
+        if cached is not None:
+            return cached
+
+        analysis = TemplateAnalysis()
+        queue = [name]
+        while queue:
+            current = queue.pop()
+            if current in analysis.templates:
+                continue
+            analysis.templates.add(current)
+            parsed = self._template_dependencies(current)
+            if parsed is None:
+                continue
+            for ref in parsed["refs"]:
+                if ref == WILDCARD:
+                    analysis.templates.add(WILDCARD)
+                else:
+                    queue.append(ref)
+            for var, keys in parsed["keys"].items():
+                analysis.keys[var].update(keys)
+
+        self._analyses[name] = analysis
+        return analysis
+
+    def _collect_keys(
+        self, node: nodes.Node, parent: Optional[nodes.Node], keys: Dict[str, Set[str]]
+    ) -> None:
+        if isinstance(node, (nodes.Getattr, nodes.Getitem)) and isinstance(
+            node.node, nodes.Name
+        ):
+            var = node.node.name
+            if var in keys:
+                keys[var].add(self._accessed_key(node, parent))
+                if isinstance(node, nodes.Getitem):
+                    self._collect_keys(node.arg, node, keys)
+                return
+        if isinstance(node, nodes.Name) and node.name in keys and node.ctx == "load":
+            keys[node.name].add(WILDCARD)
+            return
+        for child in node.iter_child_nodes():
+            self._collect_keys(child, node, keys)
+
+    @staticmethod
+    def _accessed_key(node: nodes.Node, parent: Optional[nodes.Node]) -> str:
+        if isinstance(node, nodes.Getitem):
+            if isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
+                return node.arg.value
+            return WILDCARD
+        attr = node.attr  # type: ignore[attr-defined]
+        if attr == "get":
+            if (
+                isinstance(parent, nodes.Call)
+                and parent.node is node
+                and parent.args
+                and isinstance(parent.args[0], nodes.Const)
+            ):
+                return str(parent.args[0].value)
+            return WILDCARD
+        if attr in _MAPPING_METHODS:
+            return WILDCARD
+        return attr
+
+    # ------------------------------------------------------------------
+    # Fingerprints
+    # ------------------------------------------------------------------
+
+    def _source_digest(self, path: Path) -> str:
+        path = Path(path)
+        digest = self._source_digests.get(path)
+        if digest is None:
+            try:
+                if path.suffix.lower() not in (".md", ".markdown", ".yaml", ".yml"):
+                    stat = path.stat()
+                    digest = f"{stat.st_size}:{stat.st_mtime_ns}"
+                elif self.file_cache is not None:
+                    digest = self.file_cache.digest(path)
+                else:
+                    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                digest = ""
+            self._source_digests[path] = digest
+        return digest
+
+    @staticmethod
+    def _select(mapping: Any, keys: Set[str]) -> Any:
+        if mapping is None:
+            return None
+        if WILDCARD in keys or not isinstance(mapping, dict):
+            return mapping
+        return {key: mapping.get(key) for key in sorted(keys)}
+
+    def _template_fingerprint(self, template_name: str, lang: str) -> str:
+        key = (template_name, lang)
+        fingerprint = self._template_fingerprints.get(key)
+        if fingerprint is None:
+            analysis = self.analyse_template(template_name)
+            templates = sorted(analysis.templates)
+            if WILDCARD in analysis.templates and self.jinja_env is not None:
+                templates = sorted(set(templates) | set(self.jinja_env.list_templates()))
+            globals_ = {}
+            if self.jinja_env is not None:
+                globals_ = {
+                    k: v
+                    for k, v in self.jinja_env.globals.items()
+                    if isinstance(v, (bool, int, float, str))
+                }
+            fingerprint = _stable_digest(
+                {
+                    "templates": {
+                        n: self._template_digest(n) for n in templates if n != WILDCARD
+                    },
+                    "site": self._select(self.site_config, analysis.keys["site"]),
+                    "t": self._select(
+                        self.translations.get(lang, {}), analysis.keys["t"]
+                    ),
+                    "projects": self._select(self.projects, analysis.keys["projects"])
+                    if analysis.keys["projects"]
+                    else None,
+                    "globals": globals_,
+                    "builder_config": {
+                        k: v
+                        for k, v in self.site_config.items()
+                        if k in _BUILDER_CONFIG_KEYS
+                        or k.endswith(_BUILDER_CONFIG_SUFFIXES)
+                    },
+                }
+            )
+            self._template_fingerprints[key] = fingerprint
+        return fingerprint
+
+    def _output_key(self, output_path: Path) -> str:
+        output_path = Path(output_path)
+        try:
+            return output_path.relative_to(self.dist_path).as_posix()
+        except ValueError:
+            return output_path.as_posix()
+
+    # ------------------------------------------------------------------
+    # Builder API
+    # ------------------------------------------------------------------
+
+    def is_fresh(
+        self,
+        output_path: Path,
+        template_name: str,
+        lang: str,
+        sources: Iterable[Path] = (),
+        context: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Tell whether an output can be kept as is.
+
+        Args:
+            output_path: File the builder is about to write.
+            template_name: Template used to render it.
+            lang: Language whose translations are passed as `t`.
+            sources: Source files read to produce the output.
+            context: Render context other than `site`, `t` and `projects`.
+
+        Returns:
+            True if the output exists and none of its inputs changed.
+        """
+        if not self.enabled:
+            return False
+        key = self._output_key(output_path)
+        self._seen.add(key)
+        source_list = sorted(str(Path(p)) for p in sources)
+        analysis = self.analyse_template(template_name)
+        fingerprint = _stable_digest(
+            {
+                "template": self._template_fingerprint(template_name, lang),
+                "sources": {s: self._source_digest(Path(s)) for s in source_list},
+                "context": context or {},
+                "lang": lang,
+            }
+        )
+        self._pending[key] = {
+            "fingerprint": fingerprint,
+            "sources": source_list,
+            "templates": sorted(analysis.templates),
+            "site_keys": sorted(analysis.keys["site"]),
+            "translation_keys": sorted(analysis.keys["t"]),
+            "lang": lang,
+        }
+        previous = self._outputs.get(key)
+        return (
+            previous is not None
+            and previous.get("fingerprint") == fingerprint
+            and self.store.exists(output_path)
+        )
+
+    def record(self, output_path: Path) -> None:
+        """Commit the fingerprint computed by is_fresh() once the output is written."""
+        if not self.enabled:
+            return
+        key = self._output_key(output_path)
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            self._outputs[key] = pending
+            self._changed.append(key)
+            self._dirty = True
+
+    def outputs(self) -> List[Path]:
+        """Return every output currently recorded in the graph."""
+        return [self.dist_path / key for key in self._outputs]
+
+    def changed_outputs(self) -> List[Path]:
+        """Return the outputs written or deleted since begin_build()."""
+        return [self.dist_path / key for key in dict.fromkeys(self._changed)]
+
+    def outputs_depending_on(self, path: Path) -> List[Path]:
+        """Return the recorded outputs that read the given source or template."""
+        needle = str(Path(path))
+        name = Path(path).as_posix()
+        result = []
+        for key, entry in self._outputs.items():
+            if needle in entry.get("sources", ()) or any(
+                name.endswith("/" + t) or name == t for t in entry.get("templates", ())
+            ):
+                result.append(self.dist_path / key)
+        return result
+
+    def sweep(self) -> List[Path]:
+        """
+        Delete outputs recorded by a previous build but not produced by this one.
+
+        Only call after a successful build: an output left unseen because a
+        builder crashed would otherwise be removed.
+
+        Returns:
+            The deleted output paths.
+        """
+        if not self.enabled:
+            return []
+        removed = []
+        for key in [k for k in self._outputs if k not in self._seen]:
+            path = self.dist_path / key
+            try:
+                self.store.remove(path)
+                removed.append(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove stale output {path}: {e}")
+                continue
+            del self._outputs[key]
+            self._changed.append(key)
+            self._dirty = True
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._outputs)
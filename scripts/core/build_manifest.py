@@ -0,0 +1,196 @@
+"""
+Manifest of the files a build emitted into dist/.
+
+Every producer (page store, static copy, gallery, image variants) reports
+the files it wrote or left in place. After a complete build, files listed
+by the previous build but not emitted by this one are orphans and are
+deleted; everything else in dist/ is left alone, including files the
+frontend build (Grunt) writes there. Without a previous manifest (a dist/
+built before manifests existed) nothing can be told apart, so the first
+sweep only warns about the files it cannot account for.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class BuildManifest:
+    """
+    Set of output files emitted by the current and the previous build.
+
+    Usage from SiteBuilder::
+
+        manifest.begin_build()
+        ...producers call manifest.add(path)...
+        manifest.sweep()       # complete builds only
+        manifest.save(complete=True)
+
+    A disabled manifest (BuildManifest.disabled()) records nothing and
+    never deletes anything.
+    """
+
+    MANIFEST_VERSION = "1"
+
+    def __init__(self, manifest_path: Optional[Path], dist_path: Path):
+        """
+        Initialize the BuildManifest.
+
+        Args:
+            manifest_path: JSON file persisting the manifest. None disables it.
+            dist_path: Output root; entries are stored relative to it.
+        """
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.dist_path = Path(dist_path)
+        self.enabled = self.manifest_path is not None
+        # Producers may report paths below the resolved or unresolved root
+        self._roots = {
+            os.path.abspath(self.dist_path) + os.sep,
+            os.path.realpath(self.dist_path) + os.sep,
+        }
+        self._previous: Set[str] = set()
+        self._current: Set[str] = set()
+        # Whether a previous build's entries were loaded
+        self._loaded = False
+        if self.enabled:
+            self._load()
+
+    @classmethod
+    def disabled(cls) -> "BuildManifest":
+        """Return a manifest that records and deletes nothing."""
+        return cls(None, Path("."))
+
+    def _load(self) -> None:
+        """Load the previous build's entries, starting empty on any mismatch."""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load output manifest: {e}")
+            return
+        if data.get("version") != self.MANIFEST_VERSION:
+            logger.info("Output manifest version mismatch, starting fresh")
+            return
+        self._previous = set(data.get("files", []))
+        self._loaded = True
+
+    def save(self, complete: bool = True) -> None:
+        """
+        Persist the files emitted by this build.
+
+        Args:
+            complete: Whether every producer ran. A partial build keeps the
+                previous entries of the producers it skipped.
+        """
+        if not self.enabled or self.manifest_path is None:
+            return
+        files = self._current if complete else self._previous | self._current
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "version": self.MANIFEST_VERSION,
+                "updated_at": datetime.now().isoformat(),
+                "files": sorted(files),
+            }
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.manifest_path)
+            self._previous = set(files)
+            self._loaded = True
+        except Exception as e:
+            logger.warning(f"Could not save output manifest: {e}")
+
+    def begin_build(self) -> None:
+        """Start recording a new build."""
+        self._current = set()
+
+    def _key(self, path: Path) -> Optional[str]:
+        path = os.path.abspath(path)
+        for root in self._roots:
+            if path.startswith(root):
+                return Path(path[len(root) :]).as_posix()
+        return None
+
+    def add(self, path: Path) -> None:
+        """Record a file written or kept in place by this build."""
+        if not self.enabled:
+            return
+        key = self._key(path)
+        if key is not None:
+            self._current.add(key)
+
+    def add_all(self, paths: Iterable[Path]) -> None:
+        """Record several files."""
+        for path in paths:
+            self.add(path)
+
+    def sweep(self) -> List[Path]:
+        """
+        Delete the orphans and the directories they leave empty.
+
+        Only call after a complete, successful build: a producer that did
+        not run would otherwise lose all of its files.
+
+        Returns:
+            The deleted paths.
+        """
+        if not self.enabled:
+            return []
+        if not self._loaded:
+            self._warn_unaccounted()
+            return []
+        removed = []
+        real_dist = os.path.realpath(self.dist_path)
+        for key in sorted(self._previous - self._current):
+            path = self.dist_path / key
+            # A directory now replaced by a symlink (e.g. the /images alias)
+            # would lead the deletion outside of the orphan's own location
+            expected = os.path.join(real_dist, *Path(key).parent.parts)
+            if os.path.realpath(path.parent) != expected:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"Could not remove orphaned output {path}: {e}")
+                # Keep it listed so that the next build retries
+                self._current.add(key)
+                continue
+            removed.append(path)
+            self._remove_empty_parents(path.parent)
+        return removed
+
+    def _warn_unaccounted(self) -> None:
+        """Tell the user to clean a dist/ that no manifest describes, once."""
+        unaccounted = 0
+        for root, _, files in os.walk(self.dist_path):
+            for name in files:
+                key = self._key(Path(root) / name)
+                if key is not None and key not in self._current:
+                    unaccounted += 1
+        if unaccounted:
+            logger.warning(
+                f"No output manifest from a previous build: {unaccounted} file(s) "
+                f"in {self.dist_path} were not emitted by this build and are kept "
+                "(stale outputs of an older build, or frontend files). Delete "
+                f"{self.dist_path} once and rebuild to remove stale files; later "
+                "builds remove them automatically."
+            )
+
+    def _remove_empty_parents(self, directory: Path) -> None:
+        dist = self.dist_path.resolve()
+        while directory.resolve() != dist and dist in directory.resolve().parents:
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
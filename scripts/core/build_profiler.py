@@ -0,0 +1,307 @@
+"""
+Build profiler for the IDOINE static site generator.
+
+Records timed spans while the site builds: one per build phase (static
+copy, gallery, each builder, taxonomy pages, ...), and, for every page
+rendered through the RenderQueue, its Markdown conversion, its template
+render and the page as a whole. Page spans are measured where the page
+is rendered, including in --jobs worker processes, and sent back with
+the rendered content.
+
+Wall time comes from time.perf_counter() (comparable across processes).
+CPU time is the build process's for phases (all threads, not workers)
+and the rendering thread's for page spans.
+
+The report is written as JSON (totals per phase and template, the
+slowest pages) and as a Chrome trace-event file that chrome://tracing
+or https://ui.perfetto.dev open as a timeline.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Span categories
+PHASE = "phase"
+MARKDOWN = "markdown"
+TEMPLATE = "template"
+PAGE = "page"
+
+
+class Span(NamedTuple):
+    """One timed interval; plain values, so workers can pickle it."""
+
+    category: str
+    name: str
+    start: float
+    wall: float
+    cpu: float
+    pid: int
+    tid: int
+    output: str = ""
+
+
+class Stopwatch:
+    """
+    Times the steps of one page render.
+
+    Used inside RenderQueue tasks; spans are appended to a list that the
+    build process hands to BuildProfiler.extend().
+    """
+
+    def __init__(self, spans: Optional[List[Span]], output: str):
+        """
+        Initialize the Stopwatch.
+
+        Args:
+            spans: List receiving the spans. None times nothing.
+            output: Output file the steps belong to.
+        """
+        self.spans = spans
+        self.output = output
+
+    @contextmanager
+    def __call__(self, category: str, name: str) -> Iterator[None]:
+        if self.spans is None:
+            yield
+            return
+        start, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.spans.append(
+                Span(
+                    category,
+                    name,
+                    start,
+                    time.perf_counter() - start,
+                    time.thread_time() - cpu,
+                    os.getpid(),
+                    threading.get_native_id(),
+                    self.output,
+                )
+            )
+
+
+class BuildProfiler:
+    """
+    Collects the spans of one build and reports them.
+
+    Usage from SiteBuilder::
+
+        profiler.begin_build()
+        with profiler.phase("posts"):
+            ...
+        profiler.end_build()
+        profiler.write_report(report_path)
+        profiler.write_trace(trace_path)
+
+    A disabled profiler (BuildProfiler.disabled()) records nothing, and
+    page renders are not timed at all.
+    """
+
+    REPORT_VERSION = "1"
+
+    def __init__(self, enabled: bool = True, root: Optional[Path] = None):
+        """
+        Initialize the BuildProfiler.
+
+        Args:
+            enabled: Whether to record anything.
+            root: Output root; page paths are reported relative to it.
+        """
+        self.enabled = enabled
+        self.root = Path(root) if root is not None else None
+        self.spans: List[Span] = []
+        self._origin = time.perf_counter()
+        self._origin_cpu = time.process_time()
+        self._build: Optional[Span] = None
+
+    @classmethod
+    def disabled(cls) -> "BuildProfiler":
+        """Return a profiler that records nothing."""
+        return cls(enabled=False)
+
+    def begin_build(self) -> None:
+        """Forget the previous build and start timing a new one."""
+        self.spans = []
+        self._build = None
+        self._origin = time.perf_counter()
+        self._origin_cpu = time.process_time()
+
+    def end_build(self) -> None:
+        """Close the span covering the whole build."""
+        if not self.enabled:
+            return
+        self._build = Span(
+            PHASE,
+            "build",
+            self._origin,
+            time.perf_counter() - self._origin,
+            time.process_time() - self._origin_cpu,
+            os.getpid(),
+            threading.get_native_id(),
+        )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a build phase."""
+        if not self.enabled:
+            yield
+            return
+        start, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.spans.append(
+                Span(
+                    PHASE,
+                    name,
+                    start,
+                    time.perf_counter() - start,
+                    time.process_time() - cpu,
+                    os.getpid(),
+                    threading.get_native_id(),
+                )
+            )
+
+    def sink(self) -> Optional[List[Span]]:
+        """Return the list page spans go to, or None when not profiling."""
+        return self.spans if self.enabled else None
+
+    def extend(self, spans: List[Span]) -> None:
+        """Add spans measured elsewhere (render workers)."""
+        if self.enabled:
+            self.spans.extend(spans)
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def _relative(self, output: str) -> str:
+        if self.root is None or not output:
+            return output
+        try:
+            return Path(output).relative_to(self.root).as_posix()
+        except ValueError:
+            return output
+
+    def report(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Summarize the spans.
+
+        Args:
+            top: Number of slowest pages to list.
+
+        Returns:
+            JSON-serializable report: totals, phases in order, templates,
+            Markdown conversion, every page and the slowest ones.
+        """
+        phases = [s for s in self.spans if s.category == PHASE]
+        templates: Dict[str, Dict[str, Any]] = {}
+        markdown = {"count": 0, "wall_s": 0.0, "cpu_s": 0.0}
+        pages: Dict[str, Dict[str, Any]] = {}
+
+        for span in self.spans:
+            if span.category == TEMPLATE:
+                entry = templates.setdefault(
+                    span.name,
+                    {"name": span.name, "count": 0, "wall_s": 0.0, "cpu_s": 0.0},
+                )
+                entry["count"] += 1
+                entry["wall_s"] += span.wall
+                entry["cpu_s"] += span.cpu
+                pages.setdefault(span.output, {})["template"] = span.name
+            elif span.category == MARKDOWN:
+                markdown["count"] += 1
+                markdown["wall_s"] += span.wall
+                markdown["cpu_s"] += span.cpu
+                pages.setdefault(span.output, {})["markdown_s"] = span.wall
+            elif span.category == PAGE:
+                pages.setdefault(span.output, {}).update(
+                    wall_s=span.wall, cpu_s=span.cpu
+                )
+
+        page_list = sorted(
+            (
+                {
+                    "output": self._relative(output),
+                    "template": page.get("template", ""),
+                    "wall_s": page.get("wall_s", 0.0),
+                    "cpu_s": page.get("cpu_s", 0.0),
+                    "markdown_s": page.get("markdown_s", 0.0),
+                }
+                for output, page in pages.items()
+            ),
+            key=lambda page: page["wall_s"],
+            reverse=True,
+        )
+        build = self._build
+        return {
+            "version": self.REPORT_VERSION,
+            "total": {
+                "wall_s": build.wall if build else 0.0,
+                "cpu_s": build.cpu if build else 0.0,
+                "pages": len(page_list),
+            },
+            "phases": [
+                {"name": s.name, "wall_s": s.wall, "cpu_s": s.cpu} for s in phases
+            ],
+            "templates": sorted(
+                templates.values(), key=lambda t: t["wall_s"], reverse=True
+            ),
+            "markdown": markdown,
+            "slowest_pages": page_list[:top],
+            "pages": page_list,
+        }
+
+    def trace_events(self) -> List[Dict[str, Any]]:
+        """Return the spans as Chrome trace events ("X" complete events)."""
+        spans = list(self.spans)
+        if self._build is not None:
+            spans.append(self._build)
+        events = []
+        for span in spans:
+            args: Dict[str, Any] = {"cpu_ms": round(span.cpu * 1000, 3)}
+            if span.output:
+                args["output"] = self._relative(span.output)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round((span.start - self._origin) * 1e6, 1),
+                    "dur": round(span.wall * 1e6, 1),
+                    "pid": span.pid,
+                    "tid": span.tid,
+                    "args": args,
+                }
+            )
+        return events
+
+    def write_report(self, path: Path, top: int = 10) -> None:
+        """Write report() as JSON."""
+        self._write_json(path, self.report(top))
+
+    def write_trace(self, path: Path) -> None:
+        """Write the Chrome trace-event file."""
+        self._write_json(
+            path, {"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}
+        )
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        path = Path(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+        except OSError as e:
+            logger.warning(f"Could not write profile {path}: {e}")
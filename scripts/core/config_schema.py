@@ -5,7 +5,7 @@ Validates site_config.yaml to ensure all required fields
 are present and have correct types.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -47,6 +47,38 @@ class SiteConfig(BaseModel):
     keyword_template: str = Field(default="pages/keyword.html")
     gallery_template: str = Field(default="pages/gallery.html")
 
+    # Images
+    optimize_images: bool = Field(
+        default=False,
+        description="Generate responsive variants of assets/images",
+    )
+    image_sizes: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Variant size names to max widths",
+    )
+    image_quality: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Encoder quality per format (jpeg, webp, avif)",
+    )
+
+    # Static files
+    static_copy_mode: Literal["copy", "hardlink"] = Field(
+        default="copy",
+        description="How assets reach dist/: copied, or hard-linked when possible",
+    )
+    legacy_images_alias: Literal[
+        "copy", "hardlink", "symlink", "redirect", "none"
+    ] = Field(
+        default="copy",
+        description="How /images serves /assets/images for old links",
+    )
+
+    # Markdown
+    markdown_engine: Literal["python-markdown", "markdown-it"] = Field(
+        default="python-markdown",
+        description="Markdown engine: python-markdown, or markdown-it (CommonMark)",
+    )
+
     # Feature flags
     unilingual: Optional[bool] = Field(
         default=None,
@@ -0,0 +1,184 @@
+"""
+Build-scoped content index for the IDOINE static site generator.
+
+Reads and parses every Markdown source at most once per build and
+shares the result (metadata, raw body, rendered HTML) between builders.
+Listing passes only need metadata: metadata() reads the frontmatter
+alone, and the body is read when a page is actually rendered.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import frontmatter
+import yaml
+
+from core.content_processor import ContentProcessor, ProcessedContent
+from utils.frontmatter_parser import normalize_metadata, read_frontmatter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ContentEntry:
+    """Parsed representation of a single Markdown source file."""
+
+    path: Path
+    raw: str
+    front_matter: Dict[str, Any]
+    metadata: Dict[str, Any]
+    body: str
+    _html: Optional[str] = field(default=None, repr=False)
+
+
+class ContentIndex:
+    """
+    Cache of parsed Markdown sources keyed by file path.
+
+    Builders share one index through the BuildContext so that a file
+    listed by PostBuilder.load_posts, rendered by _build_individual_post
+    and listed again by PageBuilder is opened and parsed only once.
+    Call clear() at the start of each build.
+    """
+
+    def __init__(self, content_processor: Optional[ContentProcessor] = None):
+        """
+        Initialize the ContentIndex.
+
+        Args:
+            content_processor: Processor used for Markdown conversion.
+                               Default: ContentProcessor().
+        """
+        self.processor = content_processor or ContentProcessor()
+        self._entries: Dict[Path, ContentEntry] = {}
+        self._metadata: Dict[Path, Dict[str, Any]] = {}
+        self._listings: Dict[Path, List[Path]] = {}
+
+    def get(self, path: Path) -> ContentEntry:
+        """
+        Return the parsed entry for a file, reading it on first access.
+
+        Args:
+            path: Markdown source path.
+
+        Returns:
+            The cached ContentEntry.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        path = Path(path)
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = self._load(path)
+            self._entries[path] = entry
+        return entry
+
+    def _load(self, path: Path) -> ContentEntry:
+        raw = path.read_text(encoding="utf-8")
+        try:
+            parsed = frontmatter.loads(raw)
+            front_matter = dict(parsed.metadata or {})
+            body = parsed.content
+        except Exception as e:
+            logger.error(f"Erreur lors du parsing du front matter: {e}")
+            front_matter, body = {}, raw
+        return ContentEntry(
+            path=path,
+            raw=raw,
+            front_matter=front_matter,
+            metadata=normalize_metadata(front_matter),
+            body=body,
+        )
+
+    def metadata(self, path: Path) -> Dict[str, Any]:
+        """
+        Return the normalized metadata of a file, reading only its header.
+
+        Same value as get(path).metadata.
+
+        Args:
+            path: Markdown source path.
+
+        Returns:
+            The cached metadata.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        path = Path(path)
+        entry = self._entries.get(path)
+        if entry is not None:
+            return entry.metadata
+        metadata = self._metadata.get(path)
+        if metadata is None:
+            # As in get(): unreadable files raise, invalid frontmatter is empty
+            try:
+                front_matter = read_frontmatter(path)
+            except (yaml.YAMLError, ValueError) as e:
+                logger.error(f"Erreur lors du parsing du front matter: {e}")
+                front_matter = {}
+            metadata = normalize_metadata(front_matter)
+            self._metadata[path] = metadata
+        return metadata
+
+    def html(self, path: Path) -> str:
+        """Return the rendered HTML body of a file, converting it once."""
+        entry = self.get(path)
+        if entry._html is None:
+            entry._html = self.processor.markdown_to_html(entry.body)
+        return entry._html
+
+    def processed(self, path: Path) -> ProcessedContent:
+        """Return the file as a ProcessedContent, as ContentProcessor.parse would."""
+        entry = self.get(path)
+        return ProcessedContent(
+            metadata=dict(entry.front_matter),
+            markdown=entry.body,
+            html=self.html(path),
+        )
+
+    def list_dir(self, directory: Path, pattern: str = "*.md") -> List[Path]:
+        """
+        List the sources of a directory, globbing it once per build.
+
+        Args:
+            directory: Directory to list.
+            pattern: Glob pattern. Default: "*.md".
+
+        Returns:
+            Matching paths, in glob order.
+        """
+        directory = Path(directory)
+        key = directory / pattern
+        listing = self._listings.get(key)
+        if listing is None:
+            listing = list(directory.glob(pattern)) if directory.exists() else []
+            self._listings[key] = listing
+        return listing
+
+    def entries(self, directory: Path, pattern: str = "*.md") -> List[ContentEntry]:
+        """Return the parsed entries of a directory, in glob order."""
+        return [self.get(p) for p in self.list_dir(directory, pattern)]
+
+    def invalidate(self, path: Path) -> None:
+        """Drop a single file (and listings of its directory) from the index."""
+        path = Path(path)
+        self._entries.pop(path, None)
+        self._metadata.pop(path, None)
+        for key in [k for k in self._listings if k.parent == path.parent]:
+            del self._listings[key]
+
+    def clear(self) -> None:
+        """Drop every cached entry and directory listing."""
+        self._entries.clear()
+        self._metadata.clear()
+        self._listings.clear()
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, Path) and path in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -9,7 +9,8 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import frontmatter
-import markdown
+
+from utils.markdown_renderer import markdown_to_html
 
 
 @dataclass
@@ -63,13 +64,16 @@ class ContentProcessor:
         """
         Convert Markdown text to HTML.
 
+        Reuses this thread's parser and, when enabled, the persistent
+        HTML cache (utils.markdown_renderer).
+
         Args:
             text: Markdown formatted string.
 
         Returns:
             HTML string.
         """
-        return markdown.markdown(text, extensions=self.extensions)
+        return markdown_to_html(text, self.extensions)
 
     def extract_metadata(self, content: str) -> Dict[str, Any]:
         """
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from core.build_graph import BuildGraph
+    from core.content_index import ContentIndex
+    from core.render_queue import RenderQueue
 
 
 @dataclass
@@ -13,3 +18,6 @@ class BuildContext:
     translations: Dict[str, Any]
     jinja_env: Any
     projects: Any
+    content_index: Optional[ContentIndex] = None
+    build_graph: Optional[BuildGraph] = None
+    renderer: Optional[RenderQueue] = None
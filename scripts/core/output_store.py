@@ -0,0 +1,232 @@
+"""
+Output stores for the IDOINE static site generator.
+
+Rendered pages are handed to an OutputStore rather than written with
+write_text() by each builder. OutputStore writes them under dist/, leaving
+files whose content did not change untouched (same mtime, so deploy syncs
+skip them); MemoryOutputStore keeps them in memory for the development server, and
+can defer rendering each page until it is first requested.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.build_manifest import BuildManifest
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteStats:
+    """Counts of what an OutputStore did during one build."""
+
+    written: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+
+class OutputStore:
+    """
+    Writes build outputs to the filesystem.
+
+    An output is only rewritten when its bytes differ from the file on
+    disk, through a temporary file renamed over it, so readers never see
+    a partial page. Removing an output also removes the directories it
+    leaves empty, up to the store root.
+    """
+
+    # Whether outputs live in memory instead of under root
+    in_memory = False
+    # Whether defer() postpones rendering until the output is read
+    lazy = False
+
+    def __init__(self, root: Path, manifest: Optional[BuildManifest] = None):
+        """
+        Initialize the OutputStore.
+
+        Args:
+            root: Output directory (dist/).
+            manifest: Build manifest every written page is reported to.
+        """
+        self.root = Path(root)
+        self.manifest = manifest if manifest is not None else BuildManifest.disabled()
+        self.stats = WriteStats()
+
+    def reset_stats(self) -> WriteStats:
+        """Start counting anew; return the counts so far."""
+        stats, self.stats = self.stats, WriteStats()
+        return stats
+
+    def write_text(self, path: Path, content: str) -> None:
+        """
+        Write a text output unless the file already holds this content.
+
+        Args:
+            path: Output file.
+            content: Rendered content, encoded as UTF-8.
+        """
+        path = Path(path)
+        # Same bytes as Path.write_text(), which translates newlines
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        data = content.encode("utf-8")
+        self.manifest.add(path)
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                self.stats.unchanged += 1
+                return
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self.stats.written += 1
+
+    def defer(self, path: Path, render: Callable[[], str]) -> None:
+        """
+        Store an output produced by render(); eager stores render at once.
+
+        Args:
+            path: Output file.
+            render: Callable returning the rendered content.
+        """
+        self.write_text(path, render())
+
+    def exists(self, path: Path) -> bool:
+        """Tell whether an output is present."""
+        return Path(path).exists()
+
+    def remove(self, path: Path) -> None:
+        """
+        Delete an output and the directories it leaves empty.
+
+        Raises:
+            FileNotFoundError: If the output does not exist.
+            OSError: If it cannot be deleted.
+        """
+        path = Path(path)
+        path.unlink()
+        self.stats.deleted += 1
+        self._remove_empty_parents(path.parent)
+
+    def _remove_empty_parents(self, directory: Path) -> None:
+        root = self.root.resolve()
+        while directory.resolve() != root and root in directory.resolve().parents:
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
+
+
+class MemoryOutputStore(OutputStore):
+    """
+    Keeps build outputs in memory, keyed by absolute path.
+
+    Used by the development server: pages are served from here and never
+    written to dist/. With lazy=True, defer() only records how to render
+    a page, and the first get() for it renders it.
+    """
+
+    in_memory = True
+
+    def __init__(self, root: Path, lazy: bool = False):
+        """
+        Initialize the MemoryOutputStore.
+
+        Args:
+            root: Output directory the paths are relative to (dist/).
+            lazy: Render deferred outputs on first read instead of at once.
+        """
+        super().__init__(root)
+        self.lazy = lazy
+        self._files: Dict[str, Tuple[int, bytes]] = {}
+        self._deferred: Dict[str, Callable[[], str]] = {}
+        self._revision = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    def _store(self, key: str, content: str) -> Tuple[int, bytes]:
+        self._revision += 1
+        entry = (self._revision, content.encode("utf-8"))
+        self._files[key] = entry
+        return entry
+
+    def write_text(self, path: Path, content: str) -> None:
+        key = self._key(path)
+        with self._lock:
+            self._deferred.pop(key, None)
+            self._store(key, content)
+            self.stats.written += 1
+
+    def defer(self, path: Path, render: Callable[[], str]) -> None:
+        if not self.lazy:
+            self.write_text(path, render())
+            return
+        key = self._key(path)
+        with self._lock:
+            self._files.pop(key, None)
+            self._deferred[key] = render
+
+    def get(self, path: Path) -> Optional[Tuple[int, bytes]]:
+        """
+        Return an output, rendering it first if it was deferred.
+
+        Args:
+            path: Output file.
+
+        Returns:
+            (revision, content), or None if the store has no such output.
+            The revision changes whenever the output is replaced.
+        """
+        key = self._key(path)
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None:
+                return entry
+            render = self._deferred.pop(key, None)
+            if render is None:
+                return None
+            logger.debug(f"Rendering on demand: {path}")
+            return self._store(key, render())
+
+    def exists(self, path: Path) -> bool:
+        key = self._key(path)
+        with self._lock:
+            return key in self._files or key in self._deferred
+
+    def remove(self, path: Path) -> None:
+        key = self._key(path)
+        with self._lock:
+            found = self._files.pop(key, None) is not None
+            found = self._deferred.pop(key, None) is not None or found
+        if not found:
+            raise FileNotFoundError(path)
+        self.stats.deleted += 1
+
+    def clear(self) -> None:
+        """Drop every output."""
+        with self._lock:
+            self._files.clear()
+            self._deferred.clear()
+
+    def paths(self) -> List[Path]:
+        """Return every stored output, rendered or deferred."""
+        with self._lock:
+            return sorted(Path(key) for key in {*self._files, *self._deferred})
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._files) + len(self._deferred)
@@ -0,0 +1,381 @@
+"""
+Render queue for the IDOINE static site generator.
+
+Builders hand their render work (template + context, or Markdown source
+for build_page) to a RenderQueue instead of rendering inline. With one
+job the work runs immediately in the build process; with more, it is
+spread over a process pool whose workers each build their own Jinja
+Environment through create_jinja_environment(), so output is identical
+to the serial build. Rendered pages are written by the build process
+through an OutputStore; a lazy store only keeps each task, to render it
+when the page is first requested.
+"""
+
+import functools
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from jinja2 import Environment
+
+from core.build_graph import BuildGraph
+from core.build_profiler import (
+    MARKDOWN,
+    PAGE,
+    TEMPLATE,
+    BuildProfiler,
+    Span,
+    Stopwatch,
+)
+from core.content_processor import ContentProcessor, ProcessedContent
+from core.output_store import OutputStore
+from core.template_renderer import create_jinja_environment
+from utils.markdown_renderer import (
+    get_html_cache,
+    get_markdown_engine,
+    set_html_cache,
+    set_markdown_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+# Shared values injected into template contexts by default
+DEFAULT_SHARED = ("t", "site", "projects")
+
+# Per-process render state: (jinja_env, site_config, translations, projects)
+_WORKER_STATE: Optional[Tuple[Environment, Dict[str, Any], Dict[str, Any], Any]] = (
+    None
+)
+# Whether workers time their tasks for the build profiler
+_WORKER_PROFILE = False
+
+
+def _init_worker(
+    templates_path: str,
+    is_multilingual: bool,
+    site_config: Dict[str, Any],
+    translations: Dict[str, Any],
+    projects: Any,
+    markdown_cache: Optional[str] = None,
+    markdown_engine: Optional[str] = None,
+    bytecode_cache_dir: Optional[str] = None,
+    profile: bool = False,
+) -> None:
+    """Process pool initializer: build this worker's Jinja environment once."""
+    global _WORKER_STATE, _WORKER_PROFILE
+    # Spawned workers do not inherit the parent's module state
+    set_html_cache(Path(markdown_cache) if markdown_cache else None)
+    if markdown_engine:
+        set_markdown_engine(markdown_engine)
+    env = create_jinja_environment(
+        Path(templates_path),
+        is_multilingual,
+        Path(bytecode_cache_dir) if bytecode_cache_dir else None,
+    )
+    _WORKER_STATE = (env, site_config, translations, projects)
+    _WORKER_PROFILE = profile
+
+
+def _run_in_worker(task: Tuple[str, str, Dict[str, Any]]) -> Tuple[str, List[Span]]:
+    """Entry point executed in pool workers; returns the page and its spans."""
+    if _WORKER_STATE is None:
+        raise RuntimeError("Render worker used before initialization")
+    spans: List[Span] = []
+    rendered = _execute(_WORKER_STATE, task, spans if _WORKER_PROFILE else None)
+    return rendered, spans
+
+
+def _execute(
+    state: Tuple[Environment, Dict[str, Any], Dict[str, Any], Any],
+    task: Tuple[str, str, Dict[str, Any]],
+    spans: Optional[List[Span]] = None,
+) -> str:
+    """
+    Render one task.
+
+    Shared by the serial path and the pool workers so both produce the
+    same bytes.
+
+    Args:
+        state: (jinja_env, site_config, translations, projects).
+        task: (kind, output path, payload).
+        spans: List receiving the build profiler spans of this task.
+
+    Returns:
+        The rendered content of the task's output file.
+    """
+    watch = Stopwatch(spans, task[1])
+    with watch(PAGE, task[2]["template"]):
+        return _render(state, task, watch)
+
+
+def _render(
+    state: Tuple[Environment, Dict[str, Any], Dict[str, Any], Any],
+    task: Tuple[str, str, Dict[str, Any]],
+    watch: Stopwatch,
+) -> str:
+    env, site_config, translations, projects = state
+    kind, _, payload = task
+
+    if kind == "template":
+        context = dict(payload["context"])
+        lang = payload["lang"]
+        shared = payload["shared"]
+        if payload["markdown"] is not None:
+            with watch(MARKDOWN, payload["template"]):
+                context["content"] = ContentProcessor().markdown_to_html(
+                    payload["markdown"]
+                )
+        if "t" in shared:
+            context["t"] = translations.get(lang, {})
+        if "site" in shared:
+            context["site"] = site_config
+        if "projects" in shared:
+            context["projects"] = projects
+        with watch(TEMPLATE, payload["template"]):
+            template = env.get_template(payload["template"])
+            rendered = template.render(**context)
+    elif kind == "content":
+        # Import here to avoid circular imports
+        from utils.utils import build_page
+
+        with watch(MARKDOWN, payload["template"]):
+            html = ContentProcessor().markdown_to_html(payload["body"])
+        processed = ProcessedContent(
+            metadata=dict(payload["front_matter"]),
+            markdown=payload["body"],
+            html=html,
+        )
+        lang = payload["lang"]
+        with watch(TEMPLATE, payload["template"]):
+            rendered = build_page(
+                payload["raw"],
+                payload["template"],
+                lang,
+                custom_url=payload["custom_url"],
+                is_post=payload["is_post"],
+                slug=payload["slug"],
+                translations=translations[lang],
+                site_config=site_config,
+                projects=projects,
+                jinja_env=env,
+                content_translations=payload["content_translations"],
+                processed=processed,
+            )
+    else:
+        raise ValueError(f"Unknown render task kind: {kind}")
+    return rendered
+
+
+class RenderQueue:
+    """
+    Dispatches render work serially or across a process pool.
+
+    Outputs are written through the OutputStore and recorded in the
+    BuildGraph. A lazy store receives the task itself, so nothing is
+    rendered until the page is read (no worker processes are used then).
+    Call drain()
+    before relying on the files being on disk, and close() at the end of
+    a build to release the worker processes (they are restarted lazily
+    on the next submission).
+    """
+
+    def __init__(
+        self,
+        jinja_env: Environment,
+        templates_path: Path,
+        site_config: Dict[str, Any],
+        translations: Dict[str, Any],
+        projects: Any,
+        build_graph: Optional[BuildGraph] = None,
+        jobs: int = 1,
+        store: Optional[OutputStore] = None,
+        profiler: Optional[BuildProfiler] = None,
+    ):
+        """
+        Initialize the RenderQueue.
+
+        Args:
+            jinja_env: Environment used for serial rendering.
+            templates_path: Templates directory, for worker environments.
+            site_config: Site configuration passed to templates as `site`.
+            translations: Translations keyed by language, passed as `t`.
+            projects: Project data passed to templates as `projects`.
+            build_graph: Graph in which written outputs are recorded.
+            jobs: Worker processes. 1 renders serially; 0 uses one per CPU.
+            store: Destination of the rendered pages. Default: the build
+                graph's store.
+            profiler: Profiler receiving the timings of each page.
+        """
+        self.jinja_env = jinja_env
+        self.templates_path = Path(templates_path)
+        self.site_config = site_config
+        self.translations = translations
+        self.projects = projects
+        self.build_graph = build_graph if build_graph is not None else (
+            BuildGraph.disabled()
+        )
+        self.store = store if store is not None else self.build_graph.store
+        self.profiler = profiler if profiler is not None else (
+            BuildProfiler.disabled()
+        )
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+
+    @property
+    def parallel(self) -> bool:
+        """Whether work is dispatched to worker processes."""
+        return self.jobs > 1 and not self.store.lazy
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            languages = self.site_config.get("languages", [])
+            markdown_cache = get_html_cache()
+            # Workers load the templates the parent already compiled
+            bytecode_cache = getattr(self.jinja_env.bytecode_cache, "directory", None)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_worker,
+                initargs=(
+                    str(self.templates_path),
+                    len(languages) > 1,
+                    self.site_config,
+                    self.translations,
+                    self.projects,
+                    str(markdown_cache.path) if markdown_cache else None,
+                    get_markdown_engine(),
+                    bytecode_cache,
+                    self.profiler.enabled,
+                ),
+            )
+            logger.info(f"Rendu parallèle avec {self.jobs} processus")
+        return self._executor
+
+    def _submit(self, output_path: Path, task: Tuple[str, str, Dict[str, Any]]) -> None:
+        if not self.parallel:
+            state = (self.jinja_env, self.site_config, self.translations, self.projects)
+            self.store.defer(
+                output_path,
+                functools.partial(_execute, state, task, self.profiler.sink()),
+            )
+            self.build_graph.record(output_path)
+            return
+
+        key = task[1]
+        previous = self._futures.pop(key, None)
+        if previous is not None:
+            # Same output written twice: keep the serial "last write wins" order
+            self._complete(key, previous)
+        self._futures[key] = self._pool().submit(_run_in_worker, task)
+
+    def _complete(self, key: str, future: Future) -> None:
+        output_path = Path(key)
+        rendered, spans = future.result()
+        self.profiler.extend(spans)
+        self.store.write_text(output_path, rendered)
+        self.build_graph.record(output_path)
+
+    def render_template(
+        self,
+        output_path: Path,
+        template_name: str,
+        lang: str,
+        context: Dict[str, Any],
+        markdown: Optional[str] = None,
+        shared: Iterable[str] = DEFAULT_SHARED,
+    ) -> None:
+        """
+        Render a template to output_path.
+
+        Args:
+            output_path: File to write.
+            template_name: Template to render.
+            lang: Language whose translations are injected as `t`.
+            context: Template variables other than the shared ones.
+            markdown: Optional Markdown body converted and passed as `content`.
+            shared: Which of `t`, `site` and `projects` to inject.
+        """
+        task = (
+            "template",
+            str(output_path),
+            {
+                "template": template_name,
+                "lang": lang,
+                "context": context,
+                "markdown": markdown,
+                "shared": tuple(shared),
+            },
+        )
+        self._submit(output_path, task)
+
+    def render_content(
+        self,
+        output_path: Path,
+        template_name: str,
+        lang: str,
+        raw: str,
+        front_matter: Dict[str, Any],
+        body: str,
+        slug: Optional[str],
+        is_post: bool = True,
+        custom_url: Optional[str] = None,
+        content_translations: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Render a Markdown source through build_page() to output_path.
+
+        Args:
+            output_path: File to write.
+            template_name: Template to render.
+            lang: Language code.
+            raw: Raw file content.
+            front_matter: Raw front matter of the source.
+            body: Markdown body of the source.
+            slug: URL slug.
+            is_post: Whether the URL is built as a post URL.
+            custom_url: Custom URL override.
+            content_translations: Mapping of language codes to translated URLs.
+        """
+        task = (
+            "content",
+            str(output_path),
+            {
+                "template": template_name,
+                "lang": lang,
+                "raw": raw,
+                "front_matter": front_matter,
+                "body": body,
+                "slug": slug,
+                "is_post": is_post,
+                "custom_url": custom_url,
+                "content_translations": content_translations,
+            },
+        )
+        self._submit(output_path, task)
+
+    def drain(self) -> List[Path]:
+        """
+        Wait for every submitted task and record its output.
+
+        Returns:
+            Outputs written since the last drain (empty in serial mode).
+
+        Raises:
+            Exception: The first error raised by a worker.
+        """
+        written = []
+        futures, self._futures = self._futures, {}
+        for key, future in futures.items():
+            self._complete(key, future)
+            written.append(Path(key))
+        return written
+
+    def close(self) -> None:
+        """Shut the worker pool down, cancelling work that has not started."""
+        self._futures.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
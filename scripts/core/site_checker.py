@@ -0,0 +1,122 @@
+"""
+Source checks for the IDOINE static site generator.
+
+Validates what a build reads, without building anything: the site
+configuration and translations against their schemas, the frontmatter of
+every Markdown file under src/locales, and every template (syntax and
+filters). Problems are returned as messages instead of raised, so that
+one run reports all of them; `idoine check` exits with status 1 if any.
+"""
+
+import logging
+from pathlib import Path
+from typing import List
+
+import frontmatter
+import yaml
+from jinja2 import TemplateError
+
+from core.config_loader import ConfigLoader
+from core.config_schema import validate_site_config, validate_translations
+from core.template_renderer import create_jinja_environment
+from utils.frontmatter_parser import normalize_metadata
+from utils.metadata_schema import (
+    ContentMetadata,
+    GlossaryTermMetadata,
+    PageMetadata,
+    PostMetadata,
+    validate_metadata,
+)
+
+logger = logging.getLogger(__name__)
+
+# Content directory under src/locales/<lang>/ -> frontmatter schema
+CONTENT_SCHEMAS = {
+    "posts": PostMetadata,
+    "glossaire": GlossaryTermMetadata,
+    "pages": PageMetadata,
+}
+
+
+def check_config(src_path: Path) -> List[str]:
+    """Validate site_config.yaml and translations.yaml."""
+    loader = ConfigLoader(src_path)
+    problems = []
+    try:
+        site_config = loader.load_site_config() or {}
+        validate_site_config(site_config)
+    except (OSError, yaml.YAMLError, ValueError) as e:
+        problems.append(f"config/site_config.yaml: {e}")
+        site_config = {}
+    try:
+        translations = loader.load_translations() or {}
+        validate_translations(translations)
+    except (OSError, yaml.YAMLError, ValueError) as e:
+        problems.append(f"data/translations.yaml: {e}")
+        translations = {}
+    for lang in site_config.get("languages") or []:
+        if translations and lang not in translations:
+            problems.append(f"data/translations.yaml: no translations for {lang!r}")
+    return problems
+
+
+def check_content(src_path: Path) -> List[str]:
+    """
+    Validate the frontmatter of every Markdown file under src/locales.
+
+    The `template` of a page must exist under src/templates. Posts and
+    glossary terms are rendered with the configured template whatever
+    their frontmatter says, so theirs is not checked.
+    """
+    locales = src_path / "locales"
+    templates = src_path / "templates"
+    problems = []
+    for path in sorted(locales.glob("*/**/*.md")):
+        relative = path.relative_to(src_path).as_posix()
+        kind = path.relative_to(locales).parts[1]
+        schema = CONTENT_SCHEMAS.get(kind, ContentMetadata)
+        try:
+            post = frontmatter.loads(path.read_text(encoding="utf-8"))
+            metadata = normalize_metadata(post.metadata)
+            if kind != "pages":
+                metadata.pop("template", None)
+            metadata = validate_metadata(metadata, schema, strict=True)
+        except (OSError, UnicodeDecodeError, yaml.YAMLError, ValueError) as e:
+            problems.append(f"{relative}: {e}")
+            continue
+        template = metadata.get("template")
+        if kind == "pages" and template and not (templates / template).is_file():
+            problems.append(f"{relative}: template not found: {template}")
+    return problems
+
+
+def check_templates(src_path: Path) -> List[str]:
+    """Compile every template with the filters and globals of a build."""
+    env = create_jinja_environment(src_path / "templates", is_multilingual=True)
+    problems = []
+    for name in env.list_templates():
+        try:
+            env.get_template(name)
+        except TemplateError as e:
+            problems.append(f"templates/{name}: {e}")
+    return problems
+
+
+def check_site(src_path: Path) -> List[str]:
+    """
+    Run every check on a source tree.
+
+    Args:
+        src_path: Source directory (config/, data/, locales/, templates/).
+
+    Returns:
+        One message per problem, prefixed with the file relative to
+        src_path. Empty if the sources are valid.
+    """
+    src_path = Path(src_path)
+    problems = []
+    for check in (check_config, check_content, check_templates):
+        found = check(src_path)
+        logger.debug(f"{check.__name__}: {len(found)} problem(s)")
+        problems.extend(found)
+    return problems
@@ -2,7 +2,11 @@
 Static file management for the IDOINE static site generator.
 
 Handles copying and managing static assets with incremental builds
-and path validation for security.
+and path validation for security. With a FileCache, unchanged assets are
+recognized from stat() alone; copies are made in the kernel (reflinked on
+copy-on-write filesystems) or, in "hardlink" mode, as hard links. The
+legacy /images alias of /assets/images is mirrored, linked, or left to a
+redirect, depending on the images_alias mode.
 """
 
 import errno
@@ -12,25 +16,126 @@ import os
 import shutil
 import stat
 from pathlib import Path
+from typing import List, Optional
 
+from utils.file_cache import FileCache
 from utils.path_validator import PathValidationError, validate_path_within_base
 
 logger = logging.getLogger(__name__)
 
+# How static files reach dist/
+COPY_MODES = ("copy", "hardlink")
+
+# How the legacy /images alias of /assets/images is served
+IMAGES_ALIAS_MODES = ("copy", "hardlink", "symlink", "redirect", "none")
+
+# Netlify rule sending the legacy image URLs to their current location
+IMAGES_ALIAS_REDIRECT = "/images/*  /assets/images/:splat  301\n"
+
+# copy_file_range errors meaning "not for these files": fall back to read/write
+_COPY_RANGE_UNSUPPORTED = (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP)
+
+
+def _copy_range(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy size bytes between descriptors with os.copy_file_range.
+
+    The data never moves through user space, and filesystems that support
+    it share extents instead of duplicating them.
+
+    Returns:
+        False if copy_file_range is unavailable for these files.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        while size > 0:
+            copied = os.copy_file_range(src_fd, dst_fd, size)
+            if copied == 0:
+                break
+            size -= copied
+    except OSError as e:
+        if e.errno in _COPY_RANGE_UNSUPPORTED:
+            return False
+        raise
+    return True
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy src to dst with its metadata, replacing dst atomically."""
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            if not _copy_range(fsrc.fileno(), fdst.fileno(), size):
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _link_file(src: Path, dst: Path) -> bool:
+    """
+    Make dst a hard link to src, replacing dst atomically.
+
+    Returns:
+        False if the filesystem refused the link (e.g. another device).
+    """
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        os.link(src, tmp)
+    except OSError:
+        return False
+    os.replace(tmp, dst)
+    return True
+
 
 class StaticFileManager:
     """Manages static file operations with security validation."""
 
-    def __init__(self, src_path: Path, dist_path: Path):
+    def __init__(
+        self,
+        src_path: Path,
+        dist_path: Path,
+        file_cache: Optional[FileCache] = None,
+        copy_mode: str = "copy",
+        images_alias: str = "copy",
+    ):
         """
         Initialize the StaticFileManager.
 
         Args:
             src_path: Source directory containing static files.
             dist_path: Destination directory for output.
+            file_cache: Persisted digests of sources and copies. None hashes
+                both files whenever their sizes match.
+            copy_mode: "copy", or "hardlink" to link files into dist/ when it
+                is on the same filesystem (falls back to copying).
+            images_alias: How /images serves /assets/images: "copy" mirrors it
+                with copy_mode, "hardlink" links its files, "symlink" makes
+                dist/images a link to dist/assets/images, "redirect" writes a
+                Netlify _redirects rule instead, and "none" drops the alias.
         """
+        if copy_mode not in COPY_MODES:
+            raise ValueError(
+                f"Unknown copy mode {copy_mode!r}; expected one of {COPY_MODES}"
+            )
+        if images_alias not in IMAGES_ALIAS_MODES:
+            raise ValueError(
+                f"Unknown images alias {images_alias!r}; "
+                f"expected one of {IMAGES_ALIAS_MODES}"
+            )
         self.src_path = Path(src_path).resolve()
         self.dist_path = Path(dist_path).resolve()
+        self.file_cache = file_cache
+        self.copy_mode = copy_mode
+        self.images_alias = images_alias
 
     def handle_remove_readonly(self, func, path, exc_info):
         exc_value = exc_info[1]
@@ -53,12 +158,21 @@ class StaticFileManager:
         return h.hexdigest()
 
     def _needs_copy(self, src_file: Path, dst_file: Path) -> bool:
-        if not dst_file.exists():
+        try:
+            dst_stat = dst_file.stat()
+        except FileNotFoundError:
             return True
-        if src_file.stat().st_size != dst_file.stat().st_size:
+        src_stat = src_file.stat()
+        if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+            return False  # Hard link to the source
+        if src_stat.st_size != dst_stat.st_size:
             return True
         # If sizes equal, compare checksums to avoid unnecessary copies
         try:
+            if self.file_cache is not None:
+                return self.file_cache.digest(src_file) != self.file_cache.digest(
+                    dst_file
+                )
             return self._file_checksum(src_file) != self._file_checksum(dst_file)
         except (OSError, IOError) as e:
             # Fallback to mtime comparison on checksum error
@@ -67,13 +181,35 @@ class StaticFileManager:
             )
             return src_file.stat().st_mtime > dst_file.stat().st_mtime
 
-    def copy_static_files(self):
+    def _copy(
+        self, src_file: Path, dst_file: Path, link: Optional[bool] = None
+    ) -> None:
+        """
+        Bring dst_file up to date with src_file.
+
+        Args:
+            link: Hard-link instead of copying; None follows copy_mode.
+        """
+        if link is None:
+            link = self.copy_mode == "hardlink"
+        if link and _link_file(src_file, dst_file):
+            return
+        _copy_file(src_file, dst_file)
+        if self.file_cache is not None:
+            # Same content as the source: no need to hash the copy later
+            self.file_cache.update(dst_file, self.file_cache.digest(src_file))
+
+    def copy_static_files(self) -> List[Path]:
         """
         Incremental copy: copy only non-processed assets that changed since last build.
 
         Leaves styles and scripts to the frontend build (Grunt).
         Validates all paths to prevent path traversal attacks.
+
+        Returns:
+            Every destination file, whether copied or already up to date.
         """
+        outputs = []
         static_dirs = ["assets"]
         for dir_name in static_dirs:
             src_dir = self.src_path / dir_name
@@ -108,20 +244,125 @@ class StaticFileManager:
                         continue
 
                     if self._needs_copy(src_file, dst_file):
-                        shutil.copy2(src_file, dst_file)
+                        self._copy(src_file, dst_file)
+                    outputs.append(dst_file)
 
-        self._create_legacy_images_alias()
+        outputs.extend(self._create_legacy_images_alias())
+        if self.file_cache is not None:
+            # Entries of deleted files are dropped by FileCache.scan() for
+            # sources and by the build's orphan sweep for copies
+            self.file_cache.save()
+        return outputs
 
-    def _create_legacy_images_alias(self) -> None:
+    def _create_legacy_images_alias(self) -> List[Path]:
         """
-        Mirror images under /assets/images to /images for backward compatibility.
+        Serve images under /assets/images at /images for backward compatibility.
+
+        In "copy" and "hardlink" modes only changed images are brought up to
+        date; files removed from the source are left for the build manifest
+        to sweep. An alias left by a build in another mode is replaced.
+
+        Returns:
+            The files making up the alias: the mirrored images, the symlink,
+            or the _redirects file when it holds the /images rule only.
         """
         src_images = self.src_path / "assets" / "images"
+        dst_images = self.dist_path / "images"
+        mode = self.images_alias
         if not src_images.exists():
-            return
+            return []
 
-        dst_images = self.dist_path / "images"
-        if dst_images.exists():
+        if mode == "symlink":
+            if self._link_images_dir(dst_images):
+                return [dst_images]
+            logger.warning(
+                "Lien symbolique impossible pour /images, copie des fichiers"
+            )
+            mode = "copy"
+        elif dst_images.is_symlink():
+            dst_images.unlink()
+
+        if mode == "redirect":
+            return self._add_images_redirect()
+        self._remove_images_redirect()
+        if mode == "none":
+            return []
+
+        # "copy" follows copy_mode; "hardlink" links even in copy mode
+        link = True if mode == "hardlink" else None
+        outputs = []
+        for root, _, files in os.walk(src_images):
+            out_root = dst_images / Path(root).relative_to(src_images)
+            out_root.mkdir(parents=True, exist_ok=True)
+            for fname in files:
+                src_file = Path(root) / fname
+                dst_file = out_root / fname
+                if self._needs_copy(src_file, dst_file):
+                    self._copy(src_file, dst_file, link)
+                outputs.append(dst_file)
+        return outputs
+
+    def _link_images_dir(self, dst_images: Path) -> bool:
+        """
+        Make dst_images a relative symlink to dist/assets/images.
+
+        Returns:
+            False if the platform refused the symlink (e.g. Windows without
+            the privilege).
+        """
+        target = Path("assets") / "images"
+        if dst_images.is_symlink():
+            if Path(os.readlink(dst_images)) == target:
+                return True
+            dst_images.unlink()
+        elif dst_images.is_dir():
+            # Mirror written by a previous build in copy or hardlink mode
             shutil.rmtree(dst_images, onerror=self.handle_remove_readonly)
+        try:
+            os.symlink(target, dst_images, target_is_directory=True)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _is_images_redirect(line: str) -> bool:
+        return line.split() == IMAGES_ALIAS_REDIRECT.split()
+
+    def _add_images_redirect(self) -> List[Path]:
+        """
+        Add the rule sending /images/* to /assets/images/ to Netlify's _redirects.
+
+        Other rules in the file are kept, and a file that already has the
+        rule is not rewritten.
 
-        shutil.copytree(src_images, dst_images)
+        Returns:
+            The _redirects file if it holds the /images rule only (the
+            build owns it), else nothing: other rules belong to whoever
+            wrote them, and the manifest must not sweep them.
+        """
+        redirects = self.dist_path / "_redirects"
+        text = redirects.read_text(encoding="utf-8") if redirects.exists() else ""
+        lines = text.splitlines()
+        if not any(self._is_images_redirect(line) for line in lines):
+            if text and not text.endswith("\n"):
+                text += "\n"
+            text += IMAGES_ALIAS_REDIRECT
+            redirects.write_text(text, encoding="utf-8")
+            lines.append(IMAGES_ALIAS_REDIRECT)
+        if all(self._is_images_redirect(line) for line in lines if line.strip()):
+            return [redirects]
+        return []
+
+    def _remove_images_redirect(self) -> None:
+        """Drop the /images rule left in _redirects by a build in redirect mode."""
+        redirects = self.dist_path / "_redirects"
+        if not redirects.exists():
+            return
+        lines = redirects.read_text(encoding="utf-8").splitlines(keepends=True)
+        kept = [line for line in lines if not self._is_images_redirect(line)]
+        if len(kept) == len(lines):
+            return
+        if any(line.strip() for line in kept):
+            redirects.write_text("".join(kept), encoding="utf-8")
+        else:
+            redirects.unlink()
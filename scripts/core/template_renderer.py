@@ -8,11 +8,86 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from jinja2 import Environment, TemplateNotFound
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateError,
+    TemplateNotFound,
+    select_autoescape,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def create_jinja_environment(
+    templates_path: Path,
+    is_multilingual: bool,
+    bytecode_cache_dir: Optional[Path] = None,
+) -> Environment:
+    """
+    Create the Jinja2 Environment used to render the site.
+
+    Every process that renders pages (the main build and each render
+    worker) must build its environment here so that output is identical.
+
+    Args:
+        templates_path: Directory containing the templates.
+        is_multilingual: Whether the site has more than one language.
+        bytecode_cache_dir: Directory keeping compiled templates across
+            processes and builds. Jinja stores a checksum of each template
+            source with its code, so an edited template is compiled again.
+
+    Returns:
+        Environment with the custom date/markdown/slugify filters and the
+        is_multilingual/is_unilingual globals registered.
+    """
+    # Import here to avoid circular imports
+    from utils.utils import format_date_filter, markdown_filter, slugify
+
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+    env = Environment(
+        loader=FileSystemLoader(str(templates_path)),
+        autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=bytecode_cache,
+    )
+    env.filters["date"] = format_date_filter
+    env.filters["markdown"] = markdown_filter
+    env.filters["slugify"] = slugify
+    env.globals["is_multilingual"] = is_multilingual
+    env.globals["is_unilingual"] = not is_multilingual
+    return env
+
+
+def precompile_templates(env: Environment) -> int:
+    """
+    Compile every template of the environment's loader.
+
+    Fills the bytecode cache, if any, so that later builds and render
+    workers load compiled code instead of parsing templates. A template
+    that does not compile is logged and skipped: it only fails the build
+    if a page renders it.
+
+    Args:
+        env: Environment from create_jinja_environment().
+
+    Returns:
+        The number of templates compiled.
+    """
+    compiled = 0
+    for name in env.list_templates():
+        try:
+            env.get_template(name)
+        except TemplateError as e:
+            logger.warning(f"Could not compile template {name}: {e}")
+            continue
+        compiled += 1
+    return compiled
+
+
 class TemplateRenderer:
     """
     Renders Jinja2 templates with content and context.
@@ -5,171 +5,378 @@ Development server with hot reload for IDOINE.
 Provides a standalone Python development server with:
 - HTTP server for serving the dist directory
 - File watching with automatic rebuild on changes
-- Live reload support via WebSocket
+- Live reload pushed to the browser over Server-Sent Events
 
 Usage:
-    python scripts/dev_server.py [--port 8000] [--no-reload]
+    python scripts/dev_server.py [--port 8000] [--no-reload] [--in-memory]
 """
 
 import argparse
+import fnmatch
+import functools
+import hashlib
 import http.server
+import json
 import logging
 import os
-import socketserver
-import subprocess
+import queue
 import sys
 import threading
 import time
 from pathlib import Path
-from typing import Callable, List, Optional, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 # Add scripts directory to path
 scripts_dir = Path(__file__).parent
 sys.path.insert(0, str(scripts_dir))
 
+from core.output_store import MemoryOutputStore
 from utils.logger import setup_logging
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional: fall back to polling
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None
+
+if TYPE_CHECKING:
+    from core.build import SiteBuilder
+
 logger = logging.getLogger(__name__)
 
 
+# Injected before </body> of every HTML page
+LIVE_RELOAD_SCRIPT = """
+<script>
+(function() {
+    if (!window.EventSource) {
+        return;
+    }
+
+    function normalize(path) {
+        return path.replace(/index\\.html$/, '');
+    }
+
+    var source = new EventSource('/__livereload');
+
+    source.addEventListener('build', function(event) {
+        var data = JSON.parse(event.data);
+        var current = normalize(decodeURI(location.pathname));
+        var changed = !data.urls || data.urls.some(function(url) {
+            return normalize(url) === current;
+        });
+        if (changed) {
+            console.log('[LiveReload] Page rebuilt, reloading...');
+            location.reload();
+        }
+    });
+
+    source.addEventListener('css', function() {
+        console.log('[LiveReload] Stylesheets changed, swapping...');
+        var links = document.querySelectorAll('link[rel="stylesheet"]');
+        Array.prototype.forEach.call(links, function(link) {
+            var url = new URL(link.href);
+            url.searchParams.set('livereload', Date.now());
+            link.href = url.toString();
+        });
+    });
+
+    console.log('[LiveReload] Active');
+})();
+</script>
+"""
+
+
+class LiveReloadBroker:
+    """
+    Fans live reload events out to every connected browser tab.
+
+    Each Server-Sent Events connection subscribes a queue; publish()
+    pushes the event to all of them.
+    """
+
+    def __init__(self):
+        self._clients: Set["queue.Queue[Optional[str]]"] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> "queue.Queue[Optional[str]]":
+        """Register a client and return the queue it reads events from."""
+        client: "queue.Queue[Optional[str]]" = queue.Queue()
+        with self._lock:
+            self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client: "queue.Queue[Optional[str]]") -> None:
+        """Forget a disconnected client."""
+        with self._lock:
+            self._clients.discard(client)
+
+    def publish(self, event: str, data: Dict[str, Any]) -> int:
+        """
+        Send an event to every connected client.
+
+        Args:
+            event: SSE event name ("build" or "css").
+            data: JSON-serializable payload.
+
+        Returns:
+            Number of clients the event was queued for.
+        """
+        message = f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.put(message)
+        return len(clients)
+
+    def close(self) -> None:
+        """Ask every client stream to end."""
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.put(None)
+
+
+class PageCache:
+    """
+    In-memory cache of HTML pages with the live reload script injected.
+
+    Entries are keyed by absolute file path and checked against the file's
+    (mtime_ns, size) on each request, so a page written by another process
+    is never served stale. DevServer drops the pages a rebuild rewrote.
+    Pages found in the memory store are served from it instead of dist/.
+    """
+
+    def __init__(
+        self,
+        script: str = LIVE_RELOAD_SCRIPT,
+        store: Optional[MemoryOutputStore] = None,
+    ):
+        self.script = script
+        self.store = store
+        self._pages: Dict[str, Tuple[Tuple[int, int], bytes, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Tuple[bytes, str]:
+        """
+        Return a page with the script injected, and its ETag.
+
+        Args:
+            path: HTML file to serve.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        key = os.path.abspath(path)
+        stored = self.store.get(key) if self.store is not None else None
+        if stored is not None:
+            # Negative marker: memory revisions never match a file stamp
+            stamp = (-1, stored[0])
+        else:
+            stat = os.stat(key)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._pages.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1], entry[2]
+
+        if stored is not None:
+            content = stored[1].decode("utf-8")
+        else:
+            with open(key, "r", encoding="utf-8") as f:
+                content = f.read()
+        # Inject live reload script before </body>
+        if "</body>" in content:
+            content = content.replace("</body>", self.script + "</body>")
+        elif "</html>" in content:
+            content = content.replace("</html>", self.script + "</html>")
+
+        body = content.encode("utf-8")
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        with self._lock:
+            self._pages[key] = (stamp, body, etag)
+        return body, etag
+
+    def invalidate(self, paths: Optional[Iterable[Path]] = None) -> None:
+        """
+        Drop cached pages.
+
+        Args:
+            paths: Files to forget. None clears the whole cache.
+        """
+        with self._lock:
+            if paths is None:
+                self._pages.clear()
+                return
+            for path in paths:
+                self._pages.pop(os.path.abspath(path), None)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
 class LiveReloadHandler(http.server.SimpleHTTPRequestHandler):
-    """HTTP handler that serves files and injects live reload script."""
+    """
+    HTTP handler that serves files and injects the live reload script.
+
+    Browsers are notified of rebuilds through the Server-Sent Events stream
+    at /__livereload. Responses carry an ETag and must be revalidated, so
+    unchanged pages and assets cost a 304 instead of a full transfer.
+    """
+
+    EVENTS_PATH = "/__livereload"
+    # Seconds between keep-alive comments, to detect closed connections
+    KEEPALIVE = 15.0
 
     def __init__(
         self,
         *args,
         directory: Optional[str] = None,
         inject_reload: bool = True,
+        broker: Optional[LiveReloadBroker] = None,
+        page_cache: Optional[PageCache] = None,
         **kwargs,
     ):
         self.inject_reload = inject_reload
+        self.broker = broker
+        self.page_cache = page_cache if page_cache is not None else PageCache()
+        self._etag: Optional[str] = None
         super().__init__(*args, directory=directory, **kwargs)
 
     def end_headers(self):
-        # Add CORS headers for development
-        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-        self.send_header("Pragma", "no-cache")
-        self.send_header("Expires", "0")
+        # Browsers may keep copies but must revalidate them on every use
+        self.send_header("Cache-Control", "no-cache")
+        if self._etag is not None:
+            self.send_header("ETag", self._etag)
         super().end_headers()
 
+    def send_head(self):
+        """Answer 304 for unchanged files, else serve them with an ETag."""
+        self._etag = None
+        path = self.translate_path(self.path)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            if self._not_modified(etag):
+                return None
+            self._etag = etag
+        return super().send_head()
+
+    def _not_modified(self, etag: str) -> bool:
+        """Send a 304 if the client already holds this version."""
+        header = self.headers.get("If-None-Match")
+        if header is None:
+            return False
+        tags = {tag.strip() for tag in header.split(",")}
+        if etag not in tags and "*" not in tags:
+            return False
+        self._etag = etag
+        self.send_response(304)
+        self.end_headers()
+        return True
+
     def do_GET(self):
+        if self.path.split("?", 1)[0] == self.EVENTS_PATH:
+            return self._serve_events()
         # Inject live reload script into HTML responses
-        if self.inject_reload and self.path.endswith((".html", "/")):
+        if self.inject_reload and self.path.split("?", 1)[0].endswith((".html", "/")):
             return self._serve_with_reload()
         return super().do_GET()
 
+    def _serve_events(self):
+        """Stream live reload events until the client disconnects."""
+        if self.broker is None:
+            self.send_error(404, "Live reload disabled")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+
+        client = self.broker.subscribe()
+        try:
+            self.wfile.write(b"retry: 1000\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    message = client.get(timeout=self.KEEPALIVE)
+                except queue.Empty:
+                    message = ": keep-alive\n\n"
+                if message is None:
+                    break
+                self.wfile.write(message.encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.broker.unsubscribe(client)
+
     def _serve_with_reload(self):
         """Serve HTML with injected live reload script."""
         # Get the file path
         path = self.translate_path(self.path)
-        if os.path.isdir(path):
+        if path.endswith(os.sep) or os.path.isdir(path):
             path = os.path.join(path, "index.html")
 
-        if not os.path.exists(path):
+        try:
+            encoded, etag = self.page_cache.get(path)
+        except FileNotFoundError:
             self.send_error(404, "File not found")
             return
-
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Inject live reload script before </body>
-            reload_script = """
-<script>
-(function() {
-    var lastCheck = Date.now();
-    var checkInterval = 1000;
-
-    function checkForChanges() {
-        fetch('/__reload_check?t=' + lastCheck)
-            .then(function(r) { return r.json(); })
-            .then(function(data) {
-                if (data.reload) {
-                    console.log('[LiveReload] Changes detected, reloading...');
-                    location.reload();
-                }
-                lastCheck = Date.now();
-            })
-            .catch(function() {})
-            .finally(function() {
-                setTimeout(checkForChanges, checkInterval);
-            });
-    }
-
-    console.log('[LiveReload] Active');
-    setTimeout(checkForChanges, checkInterval);
-})();
-</script>
-"""
-            if "</body>" in content:
-                content = content.replace("</body>", reload_script + "</body>")
-            elif "</html>" in content:
-                content = content.replace("</html>", reload_script + "</html>")
-
-            encoded = content.encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", len(encoded))
-            self.end_headers()
-            self.wfile.write(encoded)
-
         except Exception as e:
             logger.error(f"Error serving {path}: {e}")
             self.send_error(500, str(e))
+            return
 
-    def log_message(self, format, *args):
-        # Suppress default logging, use our logger
-        if "/__reload_check" not in args[0]:
-            logger.debug(f"{self.address_string()} - {format % args}")
-
-
-class ReloadCheckHandler(LiveReloadHandler):
-    """Handler that also responds to reload check requests."""
-
-    last_build_time: float = 0
-
-    def do_GET(self):
-        if self.path.startswith("/__reload_check"):
-            self._handle_reload_check()
-        else:
-            super().do_GET()
-
-    def _handle_reload_check(self):
-        """Handle reload check API request."""
-        import json
-
-        # Check if we should reload
-        should_reload = ReloadCheckHandler.last_build_time > 0
-
+        if self._not_modified(etag):
+            return
+        self._etag = etag
         self.send_response(200)
-        self.send_header("Content-type", "application/json")
+        self.send_header("Content-type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", len(encoded))
         self.end_headers()
+        self.wfile.write(encoded)
 
-        response = json.dumps(
-            {"reload": should_reload, "timestamp": ReloadCheckHandler.last_build_time}
-        )
-
-        # Reset after reporting
-        if should_reload:
-            ReloadCheckHandler.last_build_time = 0
-
-        self.wfile.write(response.encode())
+    def log_message(self, format, *args):
+        # Suppress default logging, use our logger
+        logger.debug(f"{self.address_string()} - {format % args}")
 
 
 class FileWatcher:
     """
-    Watches files for changes and triggers callbacks.
+    Watches files for changes and reports the changed paths.
+
+    Uses watchdog (inotify on Linux, FSEvents on macOS, ReadDirectoryChangesW
+    on Windows) when it is installed: pip install watchdog. Otherwise falls
+    back to polling with one directory walk per interval.
 
-    Uses polling-based watching for cross-platform compatibility.
-    For better performance, install watchdog: pip install watchdog
+    Events are coalesced: the callback runs once the tree has been quiet for
+    `debounce` seconds and receives every path changed, created or deleted
+    since the previous call.
     """
 
+    BACKENDS = ("auto", "watchdog", "polling")
+
     def __init__(
         self,
         paths: List[Path],
         patterns: List[str],
-        callback: Callable[[], None],
-        debounce: float = 0.5,
+        callback: Callable[[Set[Path]], None],
+        debounce: float = 0.25,
+        backend: str = "auto",
+        poll_interval: float = 1.0,
     ):
         """
         Initialize the FileWatcher.
@@ -177,88 +384,162 @@ class FileWatcher:
         Args:
             paths: Directories to watch.
             patterns: Glob patterns to match (e.g., "*.md", "*.html").
-            callback: Function to call when changes detected.
-            debounce: Seconds to wait before triggering callback.
+            callback: Function called with the changed, created and deleted
+                paths when changes are detected.
+            debounce: Seconds without new events before triggering callback.
+            backend: "watchdog", "polling", or "auto" for watchdog when
+                installed.
+            poll_interval: Seconds between scans of the polling backend.
         """
-        self.paths = [Path(p) for p in paths]
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown watcher backend: {backend}")
+        if backend == "auto":
+            backend = "watchdog" if Observer is not None else "polling"
+        elif backend == "watchdog" and Observer is None:
+            raise ValueError("The watchdog backend requires: pip install watchdog")
+        self.paths = [Path(p).absolute() for p in paths]
         self.patterns = patterns
         self.callback = callback
         self.debounce = debounce
+        self.backend = backend
+        self.poll_interval = poll_interval
         self._running = False
-        self._thread: Optional[threading.Thread] = None
-        self._file_times: dict = {}
-        self._last_callback = 0
+        self._threads: List[threading.Thread] = []
+        self._observer = None
+        self._file_times: Dict[Path, Tuple[int, int]] = {}
+        self._pending: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
 
     def start(self):
         """Start watching for changes."""
         self._running = True
-        self._scan_files()  # Initial scan
-        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
-        self._thread.start()
-        logger.info("File watcher started")
+        if self.backend == "watchdog":
+            self._observer = Observer()
+            handler = _WatchdogHandler(self)
+            for path in self.paths:
+                if path.exists():
+                    self._observer.schedule(handler, str(path), recursive=True)
+            self._observer.start()
+        else:
+            self._file_times = self._scan_files()  # Initial scan
+            self._threads.append(
+                threading.Thread(target=self._watch_loop, daemon=True)
+            )
+        self._threads.append(threading.Thread(target=self._dispatch_loop, daemon=True))
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"File watcher started ({self.backend})")
 
     def stop(self):
         """Stop watching for changes."""
         self._running = False
-        if self._thread:
-            self._thread.join(timeout=2)
+        self._wakeup.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+        for thread in self._threads:
+            thread.join(timeout=2)
+        self._threads.clear()
         logger.info("File watcher stopped")
 
-    def _scan_files(self) -> Set[Path]:
-        """Scan all watched files and return the set."""
-        files = set()
-        for base_path in self.paths:
-            if not base_path.exists():
-                continue
-            for pattern in self.patterns:
-                for file_path in base_path.glob(f"**/{pattern}"):
-                    if file_path.is_file():
-                        files.add(file_path)
-        return files
-
-    def _get_file_times(self, files: Set[Path]) -> dict:
-        """Get modification times for all files."""
-        times = {}
-        for f in files:
+    def _matches(self, path: Path) -> bool:
+        """Whether a path matches one of the watched patterns."""
+        return any(fnmatch.fnmatch(path.name, pattern) for pattern in self.patterns)
+
+    def notify(self, path: Path, kind: str = "Changed") -> None:
+        """
+        Record a change reported by a backend.
+
+        Args:
+            path: Changed file.
+            kind: "Changed", "Created" or "Deleted", for logging.
+        """
+        path = Path(path)
+        if not self._matches(path):
+            return
+        with self._lock:
+            if path not in self._pending:
+                logger.info(f"{kind}: {path.name}")
+                self._pending.add(path)
+        self._wakeup.set()
+
+    def _dispatch_loop(self):
+        """Run the callback once events stop arriving for `debounce` seconds."""
+        while self._running:
+            self._wakeup.wait()
+            # Trailing-edge debounce: every new event restarts the delay
+            while self._running:
+                self._wakeup.clear()
+                if not self._wakeup.wait(self.debounce):
+                    break
+            if not self._running:
+                return
+            with self._lock:
+                changed, self._pending = self._pending, set()
+            if changed:
+                try:
+                    self.callback(changed)
+                except Exception as e:
+                    logger.error(f"Watch callback error: {e}")
+
+    def _scan_files(self) -> Dict[Path, Tuple[int, int]]:
+        """Walk the watched trees once; return (mtime_ns, size) per file."""
+        times: Dict[Path, Tuple[int, int]] = {}
+        stack = [p for p in self.paths if p.exists()]
+        while stack:
             try:
-                times[f] = f.stat().st_mtime
-            except (OSError, FileNotFoundError):
-                pass
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file() and self._matches(Path(entry.name)):
+                        stat = entry.stat()
+                        times[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
         return times
 
     def _watch_loop(self):
-        """Main watch loop."""
+        """Polling loop used when no event backend is available."""
         while self._running:
             try:
-                files = self._scan_files()
-                new_times = self._get_file_times(files)
-
-                # Check for changes
-                changed = False
-                for f, mtime in new_times.items():
-                    if f not in self._file_times or self._file_times[f] != mtime:
-                        if f in self._file_times:
-                            logger.info(f"Changed: {f.name}")
-                        changed = True
-
-                # Check for deleted files
-                for f in set(self._file_times.keys()) - set(new_times.keys()):
-                    logger.info(f"Deleted: {f.name}")
-                    changed = True
-
+                new_times = self._scan_files()
+                for f, stamp in new_times.items():
+                    previous = self._file_times.get(f)
+                    if previous is None:
+                        self.notify(f, "Created")
+                    elif previous != stamp:
+                        self.notify(f, "Changed")
+                for f in self._file_times.keys() - new_times.keys():
+                    self.notify(f, "Deleted")
                 self._file_times = new_times
-
-                # Trigger callback with debounce
-                if changed:
-                    now = time.time()
-                    if now - self._last_callback > self.debounce:
-                        self._last_callback = now
-                        self.callback()
-
             except Exception as e:
                 logger.error(f"Watch error: {e}")
 
-            time.sleep(0.5)
+            time.sleep(self.poll_interval)
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    """Forwards watchdog file events to a FileWatcher."""
+
+    KINDS = {"created": "Created", "deleted": "Deleted", "modified": "Changed"}
+
+    def __init__(self, watcher: FileWatcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        if event.event_type == "moved":
+            self.watcher.notify(Path(event.src_path), "Deleted")
+            self.watcher.notify(Path(event.dest_path), "Created")
+        elif event.event_type in self.KINDS:
+            self.watcher.notify(Path(event.src_path), self.KINDS[event.event_type])
 
 
 class DevServer:
@@ -275,6 +556,8 @@ class DevServer:
         port: int = 8000,
         host: str = "localhost",
         auto_reload: bool = True,
+        watcher_backend: str = "auto",
+        in_memory: bool = False,
     ):
         """
         Initialize the DevServer.
@@ -285,44 +568,104 @@ class DevServer:
             port: Port number for HTTP server.
             host: Host to bind to.
             auto_reload: Enable automatic rebuild on changes.
+            watcher_backend: FileWatcher backend ("auto", "watchdog", "polling").
+            in_memory: Keep rendered pages in memory, rendering each one on
+                its first request, instead of writing them to dist_path.
         """
         self.src_path = Path(src_path)
         self.dist_path = Path(dist_path)
         self.port = port
         self.host = host
         self.auto_reload = auto_reload
-        self._server: Optional[socketserver.TCPServer] = None
+        self.watcher_backend = watcher_backend
+        self._server: Optional[http.server.ThreadingHTTPServer] = None
         self._watcher: Optional[FileWatcher] = None
+        self._css_watcher: Optional[FileWatcher] = None
+        self.broker = LiveReloadBroker()
+        self.output_store = (
+            MemoryOutputStore(self.dist_path, lazy=True) if in_memory else None
+        )
+        self.page_cache = PageCache(store=self.output_store)
+        self._builder: Optional["SiteBuilder"] = None
+        self._build_lock = threading.Lock()
 
-    def _rebuild(self):
-        """Trigger a rebuild of the site."""
+    def _rebuild(self, changed: Optional[Set[Path]] = None):
+        """
+        Rebuild the site in process.
+
+        A warm SiteBuilder is kept between rebuilds so that only the changed
+        files are re-read and only the outputs depending on them re-rendered.
+        It is recreated when configuration or data files change.
+
+        Args:
+            changed: Paths reported by the watcher. None rebuilds everything.
+        """
         logger.info("🔄 Rebuilding site...")
-        try:
-            # Run the build script
-            build_script = scripts_dir / "core" / "build.py"
-            result = subprocess.run(
-                [sys.executable, str(build_script), "--build"],
-                capture_output=True,
-                text=True,
-                cwd=str(self.src_path.parent),
-            )
+        start = time.perf_counter()
+        with self._build_lock:
+            try:
+                # Import here: loads Jinja, Markdown, Pillow and Babel once
+                from core.build import SiteBuilder
+
+                if (
+                    self._builder is None
+                    or changed is None
+                    or self._builder.requires_reload(changed)
+                ):
+                    if self.output_store is not None:
+                        # A new builder re-renders every page into it
+                        self.output_store.clear()
+                    self._builder = SiteBuilder(
+                        incremental=True, output_store=self.output_store
+                    )
+                success = self._builder.build(changed)
+                outputs = self._builder.build_graph.changed_outputs()
+            except Exception as e:
+                logger.error(f"❌ Build error: {e}")
+                return
+
+        if success:
+            elapsed = time.perf_counter() - start
+            logger.info(f"✅ Rebuild complete ({elapsed:.2f}s)")
+            self.page_cache.invalidate(None if changed is None else outputs)
+            # Only tabs showing a rewritten page reload; a full rebuild
+            # reloads every tab
+            urls = None if changed is None else self._output_urls(outputs)
+            self.broker.publish("build", {"urls": urls})
+        else:
+            logger.error("❌ Build failed")
+
+    def _output_urls(self, outputs: List[Path]) -> List[str]:
+        """
+        Map written or deleted output files to the URLs that serve them.
+
+        Args:
+            outputs: Output files below dist_path.
 
-            if result.returncode == 0:
-                logger.info("✅ Rebuild complete")
-                # Signal live reload
-                ReloadCheckHandler.last_build_time = time.time()
+        Returns:
+            URL paths, with index.html mapped to its directory.
+        """
+        urls = []
+        for output in outputs:
+            rel = output.relative_to(self.dist_path).as_posix()
+            if rel == "index.html":
+                urls.append("/")
+            elif rel.endswith("/index.html"):
+                urls.append("/" + rel[: -len("index.html")])
             else:
-                logger.error(f"❌ Build failed:\n{result.stderr}")
+                urls.append("/" + rel)
+        return urls
 
-        except Exception as e:
-            logger.error(f"❌ Build error: {e}")
+    def _stylesheets_changed(self, changed: Set[Path]):
+        """Tell browsers to swap stylesheets without a full reload."""
+        logger.info("🎨 Stylesheets changed")
+        self.broker.publish("css", {"files": sorted(p.name for p in changed)})
 
     def start(self):
         """Start the development server."""
-        # Ensure dist directory exists
-        if not self.dist_path.exists():
-            logger.info("Running initial build...")
-            self._rebuild()
+        # Bring dist up to date and warm the in-process builder
+        logger.info("Running initial build...")
+        self._rebuild()
 
         # Set up file watcher
         if self.auto_reload:
@@ -338,15 +681,30 @@ class DevServer:
                 paths=watch_paths,
                 patterns=watch_patterns,
                 callback=self._rebuild,
-                debounce=0.5,
+                debounce=0.25,
+                backend=self.watcher_backend,
             )
             self._watcher.start()
 
-        # Set up HTTP server
-        os.chdir(self.dist_path)
+            # Compiled CSS (Grunt/Sass) is hot-swapped instead of reloaded
+            self._css_watcher = FileWatcher(
+                paths=[self.dist_path / "styles"],
+                patterns=["*.css"],
+                callback=self._stylesheets_changed,
+                debounce=0.1,
+                backend=self.watcher_backend,
+            )
+            self._css_watcher.start()
 
-        handler = ReloadCheckHandler
-        handler.extensions_map.update(
+        # Set up HTTP server
+        handler = functools.partial(
+            LiveReloadHandler,
+            directory=str(self.dist_path),
+            inject_reload=self.auto_reload,
+            broker=self.broker,
+            page_cache=self.page_cache,
+        )
+        LiveReloadHandler.extensions_map.update(
             {
                 ".js": "application/javascript",
                 ".css": "text/css",
@@ -355,11 +713,11 @@ class DevServer:
             }
         )
 
-        # Allow reuse of address
-        socketserver.TCPServer.allow_reuse_address = True
-
         try:
-            self._server = socketserver.TCPServer((self.host, self.port), handler)
+            # One thread per connection: event streams stay open
+            self._server = http.server.ThreadingHTTPServer(
+                (self.host, self.port), handler
+            )
             logger.info(
                 f"🚀 Development server running at http://{self.host}:{self.port}/"
             )
@@ -379,14 +737,17 @@ class DevServer:
         """Stop the development server."""
         if self._watcher:
             self._watcher.stop()
+        if self._css_watcher:
+            self._css_watcher.stop()
+        self.broker.close()
         if self._server:
             self._server.shutdown()
 
 
-def main():
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
     """Main entry point for the development server."""
     parser = argparse.ArgumentParser(
-        description="IDOINE Development Server with Hot Reload"
+        prog=prog, description="IDOINE Development Server with Hot Reload"
     )
     parser.add_argument(
         "--port",
@@ -403,11 +764,22 @@ def main():
         action="store_true",
         help="Disable automatic reload on file changes",
     )
+    parser.add_argument(
+        "--watcher",
+        choices=FileWatcher.BACKENDS,
+        default="auto",
+        help="File watching backend (default: watchdog when installed, else polling)",
+    )
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Serve pages from memory, rendered on first request (no dist/ writes)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set up logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
@@ -425,9 +797,12 @@ def main():
         port=args.port,
         host=args.host,
         auto_reload=not args.no_reload,
+        watcher_backend=args.watcher,
+        in_memory=args.in_memory,
     )
     server.start()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
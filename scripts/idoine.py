@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+"""
+Command-line entry point of the IDOINE static site generator.
+
+Commands:
+    build   Build the site into dist/ (options of scripts/core/build.py)
+    serve   Development server with live reload (options of dev_server.py)
+    check   Validate configuration, frontmatter and templates
+    bench   Run the build benchmark or the micro-benchmarks
+
+Usage:
+    python scripts/idoine.py build --incremental
+    python scripts/idoine.py serve --port 8000
+    python scripts/idoine.py check
+    python scripts/idoine.py bench micro --only slugify
+
+Only the standard library is loaded before a command starts: Jinja2,
+Markdown, Pillow, pydantic and the builders are imported by the command,
+or by the build phase, that needs them. The time spent importing modules
+is measured and reported when the command ends.
+"""
+
+import argparse
+import builtins
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+scripts_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(scripts_dir))
+
+logger = logging.getLogger("idoine")
+
+ICON_TIME = "⏱️"
+
+# Suites of `idoine bench`, in tests/benchmarks
+BENCHMARKS = ("build", "micro")
+
+
+class ImportTimer:
+    """
+    Measures the time spent importing modules.
+
+    While active, builtins.__import__ is wrapped: an import statement that
+    loads new modules adds its duration to `seconds` and the number of
+    modules it loaded to `modules`. Imports nested in another import are
+    part of the outer one's time.
+    """
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.modules = 0
+        self._local = threading.local()
+        self._original: Optional[Callable[..., Any]] = None
+
+    def __enter__(self) -> "ImportTimer":
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        builtins.__import__ = self._original
+
+    def _import(self, *args: Any, **kwargs: Any) -> Any:
+        if getattr(self._local, "active", False):
+            return self._original(*args, **kwargs)
+        loaded = len(sys.modules)
+        start = time.perf_counter()
+        self._local.active = True
+        try:
+            return self._original(*args, **kwargs)
+        finally:
+            self._local.active = False
+            loaded = len(sys.modules) - loaded
+            if loaded > 0:
+                self.seconds += time.perf_counter() - start
+                self.modules += loaded
+
+
+def _build(argv: List[str]) -> int:
+    from core.build import main
+
+    return main(["--build", *argv], prog="idoine build")
+
+
+def _serve(argv: List[str]) -> int:
+    from dev_server import main
+
+    return main(argv, prog="idoine serve")
+
+
+def _check(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="idoine check",
+        description="Validate configuration, frontmatter and templates "
+        "without building",
+    )
+    parser.add_argument(
+        "--src",
+        type=Path,
+        default=scripts_dir.parent / "src",
+        help="Source directory (default: src/)",
+    )
+    args = parser.parse_args(argv)
+
+    from core.site_checker import check_site
+
+    problems = check_site(args.src)
+    for problem in problems:
+        logger.error(problem)
+    if problems:
+        logger.error(f"{len(problems)} problem(s) found in {args.src}")
+        return 1
+    logger.info(f"No problem found in {args.src}")
+    return 0
+
+
+def _bench(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="idoine bench",
+        description="Run a benchmark from tests/benchmarks",
+    )
+    parser.add_argument(
+        "suite",
+        choices=BENCHMARKS,
+        help="build: synthetic-site builds; micro: per-item hot paths",
+    )
+    parser.add_argument(
+        "args",
+        nargs=argparse.REMAINDER,
+        help="Options of the benchmark (see idoine bench SUITE --help)",
+    )
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(scripts_dir.parent))
+    if args.suite == "build":
+        from tests.benchmarks.bench_build import main
+    else:
+        from tests.benchmarks.micro_bench import main
+    return main(args.args, prog=f"idoine bench {args.suite}")
+
+
+# Command -> (function taking the remaining arguments, description)
+COMMANDS: Dict[str, Tuple[Callable[[List[str]], int], str]] = {
+    "build": (_build, "Build the site into dist/"),
+    "serve": (_serve, "Development server with live reload"),
+    "check": (_check, "Validate configuration, frontmatter and templates"),
+    "bench": (_bench, "Run the build benchmark or the micro-benchmarks"),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run an idoine command; return the exit status."""
+    start = time.perf_counter()
+    parser = argparse.ArgumentParser(
+        prog="idoine",
+        description="IDOINE static site generator",
+        epilog="commands:\n"
+        + "\n".join(f"  {name:<8}{text}" for name, (_, text) in COMMANDS.items())
+        + "\n\nSee `idoine COMMAND --help` for the options of a command.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "command", choices=COMMANDS, metavar="COMMAND", help="See commands below"
+    )
+    parser.add_argument("args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    command, _ = COMMANDS[args.command]
+    with ImportTimer() as imports:
+        from utils.logger import setup_logging
+
+        setup_logging()
+        status = command(args.args)
+    logger.info(
+        f"{ICON_TIME} idoine {args.command}: {time.perf_counter() - start:.2f}s, "
+        f"including {imports.seconds:.2f}s of imports ({imports.modules} modules)"
+    )
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
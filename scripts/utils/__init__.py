@@ -3,17 +3,27 @@ Package utils - Utilitaires et fonctions d'assistance.
 
 Ce package contient les fonctions utilitaires réutilisables
 et les helpers utilisés dans le générateur de site statique.
+
+Les noms exportés sont importés à la première utilisation (PEP 562) :
+importer utils.constants ne charge ni pydantic, ni Pillow, ni Markdown.
 """
 
-from .frontmatter_parser import parse_frontmatter
-from .gallery_utils import (
-    copy_images,
-    find_image_files,
-    find_images_dir,
-    generate_resized_images,
-)
-from .metadata import extract_metadata
-from .utils import build_page, format_date_filter, markdown_filter, slugify
+import importlib
+from typing import Any, List
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "markdown_filter": "utils",
+    "build_page": "utils",
+    "format_date_filter": "utils",
+    "slugify": "utils",
+    "parse_frontmatter": "frontmatter_parser",
+    "copy_images": "gallery_utils",
+    "find_image_files": "gallery_utils",
+    "find_images_dir": "gallery_utils",
+    "generate_resized_images": "gallery_utils",
+    "extract_metadata": "metadata",
+}
 
 __all__ = [
     # Core utilities
@@ -30,3 +40,16 @@ __all__ = [
     # Metadata
     "extract_metadata",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
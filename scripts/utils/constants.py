@@ -52,6 +52,21 @@ IMAGE_QUALITY: Dict[str, int] = {
     "avif": 80,
 }
 
+# =============================================================================
+# Build Caches
+# =============================================================================
+CACHE_DIR: str = ".idoine_cache"
+BUILD_GRAPH_FILE: str = "build_graph.json"
+OUTPUT_MANIFEST_FILE: str = "output_manifest.json"
+FILE_HASHES_FILE: str = "file_hashes.db"
+MARKDOWN_CACHE_FILE: str = "markdown_html.db"
+IMAGE_VARIANTS_DIR: str = "image_variants"
+TEMPLATE_BYTECODE_DIR: str = "jinja_bytecode"
+PROFILE_REPORT_FILE: str = "build_profile.json"
+PROFILE_TRACE_FILE: str = "build_trace.json"
+# Frontmatter headers memoized per process by read_frontmatter()
+FRONTMATTER_CACHE_SIZE: int = 4096
+
 # =============================================================================
 # File Extensions
 # =============================================================================
@@ -71,6 +86,8 @@ DATE_FORMAT_PATTERNS: Dict[str, str] = {
 
 DEFAULT_DATE_FORMAT: str = "long"
 DEFAULT_LOCALE: str = "fr_FR"
+# Formatted dates memoized per process by the `date` filter
+DATE_CACHE_SIZE: int = 4096
 
 # =============================================================================
 # Logging Icons
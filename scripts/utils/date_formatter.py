@@ -0,0 +1,116 @@
+"""
+Date formatting service behind the Jinja `date` filter.
+
+Post lists, pagination, taxonomy pages and the home page format the same
+few dates over and over. DateFormatter parses each Babel Locale and
+compiles each date pattern once, and memoizes formatted results by
+(date, format, locale) in a bounded LRU cache. Output is the same as
+babel.dates.format_date() with the pattern of DATE_FORMAT_PATTERNS.
+"""
+
+import functools
+from datetime import date, datetime
+from typing import Dict, Union
+
+from babel.core import Locale
+from babel.dates import LC_TIME, DateTimePattern, parse_pattern
+
+from .constants import (
+    DATE_CACHE_SIZE,
+    DATE_FORMAT_PATTERNS,
+    DEFAULT_DATE_FORMAT,
+    DEFAULT_LOCALE,
+)
+
+
+class DateFormatter:
+    """
+    Formats dates with cached locales, patterns and results.
+
+    Safe to share between threads (lru_cache is, and a locale or pattern
+    computed twice is the same). Each render worker process has its own
+    instance (see get_date_formatter()).
+    """
+
+    def __init__(self, maxsize: int = DATE_CACHE_SIZE):
+        """
+        Initialize the DateFormatter.
+
+        Args:
+            maxsize: Formatted dates kept; the least recently used ones
+                are evicted first.
+        """
+        self._locales: Dict[str, Locale] = {}
+        self._patterns: Dict[str, DateTimePattern] = {}
+        self._memo = functools.lru_cache(maxsize=maxsize)(self._format)
+
+    def locale(self, lang: str) -> Locale:
+        """Return the parsed Babel Locale of an identifier such as 'fr_FR'."""
+        locale = self._locales.get(lang)
+        if locale is None:
+            # Same fallback as format_date(): the system locale
+            locale = Locale.parse(lang or LC_TIME)
+            self._locales[lang] = locale
+        return locale
+
+    def pattern(self, fmt: str) -> DateTimePattern:
+        """Return the compiled pattern of a format name; unknown names are 'long'."""
+        pattern = self._patterns.get(fmt)
+        if pattern is None:
+            pattern = parse_pattern(
+                DATE_FORMAT_PATTERNS.get(fmt, DATE_FORMAT_PATTERNS[DEFAULT_DATE_FORMAT])
+            )
+            self._patterns[fmt] = pattern
+        return pattern
+
+    def _format(self, value: Union[str, date], fmt: str, lang: str) -> str:
+        if isinstance(value, str):
+            day = datetime.strptime(value, "%Y-%m-%d").date()
+        elif isinstance(value, datetime):
+            day = value.date()
+        else:
+            day = value
+        return self.pattern(fmt).apply(day, self.locale(lang))
+
+    def format(
+        self,
+        value: Union[str, datetime, date],
+        fmt: str = DEFAULT_DATE_FORMAT,
+        lang: str = DEFAULT_LOCALE,
+    ) -> str:
+        """
+        Format a date, reusing the result of an identical earlier call.
+
+        Args:
+            value: 'YYYY-MM-DD' string, datetime or date.
+            fmt: Key of DATE_FORMAT_PATTERNS; anything else formats as 'long'.
+            lang: Locale identifier (e.g. 'fr_FR', 'en').
+
+        Returns:
+            The formatted date.
+
+        Raises:
+            ValueError: If the value is not a date, or a string that does
+                not parse as one.
+        """
+        if not isinstance(value, (str, date)):
+            raise ValueError(f"Unrecognized date type: {type(value)}")
+        return self._memo(value, fmt, lang)
+
+    def cache_info(self) -> functools._CacheInfo:
+        """Return hits, misses and size of the result cache."""
+        return self._memo.cache_info()
+
+    def clear(self) -> None:
+        """Forget cached results, locales and patterns."""
+        self._memo.cache_clear()
+        self._locales.clear()
+        self._patterns.clear()
+
+
+_date_formatter = DateFormatter()
+
+
+def get_date_formatter() -> DateFormatter:
+    """Return the DateFormatter of this process."""
+    return _date_formatter
@@ -1,142 +1,336 @@
 """
 File caching system for incremental builds.
 
-Tracks file modifications using MD5 checksums to avoid
-unnecessary reprocessing during development.
+Tracks file modifications using content checksums to avoid
+unnecessary reprocessing during development. Digests are stored with the
+file's size, mtime_ns and inode, so an unchanged file is recognized from
+a stat() call without being read.
+
+Entries live in a SQLite database: opening the cache reads nothing, each
+lookup fetches a single row, and save() writes every update in one
+transaction. Checksums are BLAKE2b, or XXH3-128 when the optional xxhash
+package is installed (pip install xxhash).
+
+scan() compares whole directory trees with the cache in one call and
+reports the files added, modified and deleted since the previous scan.
 """
 
 import hashlib
-import json
 import logging
 import os
-from dataclasses import asdict, dataclass
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+try:
+    import xxhash
+except ImportError:  # Optional: BLAKE2b only
+    xxhash = None
 
 logger = logging.getLogger(__name__)
 
+# Hasher factories by name; digests are compared only within one cache
+HASH_ALGORITHMS: Dict[str, Callable[[], Any]] = {
+    "blake2b": lambda: hashlib.blake2b(digest_size=16),
+}
+if xxhash is not None:
+    HASH_ALGORITHMS["xxh3_128"] = xxhash.xxh3_128
+
+DEFAULT_HASH_ALGORITHM = "xxh3_128" if xxhash is not None else "blake2b"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS entries ("
+    " path TEXT PRIMARY KEY, checksum TEXT NOT NULL, size INTEGER NOT NULL,"
+    " mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL,"
+    " processed_at TEXT NOT NULL) WITHOUT ROWID",
+)
 
-@dataclass
-class CacheEntry:
-    """Represents a cached file entry."""
+
+class CacheEntry(NamedTuple):
+    """Represents a cached file entry (one row of the entries table)."""
 
     path: str
     checksum: str
     size: int
-    mtime: float
+    mtime_ns: int
+    inode: int
     processed_at: str
 
+    def matches(self, stat: os.stat_result) -> bool:
+        """Tell whether a stat result describes the file this entry hashed."""
+        return (
+            self.size == stat.st_size
+            and self.mtime_ns == stat.st_mtime_ns
+            and self.inode == stat.st_ino
+        )
+
+
+@dataclass
+class ChangeSet:
+    """Files added, modified and deleted since the previous scan."""
+
+    added: Set[Path] = field(default_factory=set)
+    modified: Set[Path] = field(default_factory=set)
+    deleted: Set[Path] = field(default_factory=set)
+
+    @property
+    def changed(self) -> Set[Path]:
+        """Every path in the change set."""
+        return self.added | self.modified | self.deleted
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.deleted)
+
+
+def _walk_files(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (path, stat) for every file below root; symlinked directories are skipped."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
 
 class FileCache:
     """
-    MD5-based file cache for incremental builds.
+    Checksum-based file cache for incremental builds.
 
     Tracks which files have been processed and their checksums
-    to avoid reprocessing unchanged files.
+    to avoid reprocessing unchanged files. Changes are kept in memory
+    until save().
     """
 
-    CACHE_VERSION = "1.0"
-    DEFAULT_CACHE_FILE = ".idoine_cache.json"
+    CACHE_VERSION = "3"
+    DEFAULT_CACHE_FILE = ".idoine_cache.db"
+    CHUNK_SIZE = 1024 * 1024
 
     def __init__(
         self,
         cache_dir: Optional[Path] = None,
         cache_file: Optional[str] = None,
+        algorithm: Optional[str] = None,
     ):
         """
         Initialize the FileCache.
 
         Args:
             cache_dir: Directory for cache file. Default: current directory.
-            cache_file: Cache filename. Default: .idoine_cache.json
+            cache_file: Cache filename. Default: .idoine_cache.db
+            algorithm: Checksum algorithm, a key of HASH_ALGORITHMS.
+                Default: xxh3_128 if xxhash is installed, else blake2b.
+
+        Raises:
+            ValueError: If the algorithm is unknown or not installed.
         """
+        self.algorithm = algorithm or DEFAULT_HASH_ALGORITHM
+        if self.algorithm not in HASH_ALGORITHMS:
+            raise ValueError(
+                f"Unknown hash algorithm {self.algorithm!r}; "
+                f"expected one of {tuple(HASH_ALGORITHMS)}"
+            )
         self.cache_dir = Path(cache_dir) if cache_dir else Path.cwd()
         self.cache_file = cache_file or self.DEFAULT_CACHE_FILE
         self.cache_path = self.cache_dir / self.cache_file
-        self._cache: Dict[str, CacheEntry] = {}
-        self._dirty = False
-        self._load()
-
-    def _load(self) -> None:
-        """Load cache from disk."""
-        if not self.cache_path.exists():
-            return
-
-        try:
-            with open(self.cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Check version compatibility
-            if data.get("version") != self.CACHE_VERSION:
+        self._db: Optional[sqlite3.Connection] = None
+        # Rows read so far (None: not in the database)
+        self._loaded: Dict[str, Optional[CacheEntry]] = {}
+        # Changes not saved yet (None: removed)
+        self._pending: Dict[str, Optional[CacheEntry]] = {}
+        self._cleared = False
+
+    def _open(self, database: str) -> sqlite3.Connection:
+        db = sqlite3.connect(database, check_same_thread=False)
+        for statement in _SCHEMA:
+            db.execute(statement)
+        expected = {"version": self.CACHE_VERSION, "algorithm": self.algorithm}
+        meta = dict(db.execute("SELECT name, value FROM meta"))
+        if meta != expected:
+            if meta:
                 logger.info("Cache version mismatch, starting fresh")
-                return
-
-            entries = data.get("entries", {})
-            for key, entry_data in entries.items():
-                self._cache[key] = CacheEntry(**entry_data)
-
-            logger.debug(f"Loaded {len(self._cache)} cache entries")
-
-        except Exception as e:
-            logger.warning(f"Could not load cache: {e}")
+            db.execute("DELETE FROM entries")
+            db.execute("DELETE FROM meta")
+            db.executemany("INSERT INTO meta VALUES (?, ?)", expected.items())
+        db.commit()
+        return db
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._db is None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._db = self._open(str(self.cache_path))
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Could not load cache: {e}")
+                self._db = self._open(":memory:")
+        return self._db
 
     def save(self) -> None:
-        """Save cache to disk."""
-        if not self._dirty:
+        """Write pending changes to disk in a single transaction."""
+        if not self._pending and not self._cleared:
             return
 
+        db = self._connect()
         try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-            data = {
-                "version": self.CACHE_VERSION,
-                "updated_at": datetime.now().isoformat(),
-                "entries": {k: asdict(v) for k, v in self._cache.items()},
-            }
-
-            with open(self.cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-
-            self._dirty = False
-            logger.debug(f"Saved {len(self._cache)} cache entries")
-
-        except Exception as e:
+            with db:
+                if self._cleared:
+                    db.execute("DELETE FROM entries")
+                db.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                    [e for e in self._pending.values() if e is not None],
+                )
+                db.executemany(
+                    "DELETE FROM entries WHERE path = ?",
+                    [(k,) for k, e in self._pending.items() if e is None],
+                )
+        except sqlite3.Error as e:
             logger.warning(f"Could not save cache: {e}")
+            return
+
+        logger.debug(f"Saved {len(self._pending)} cache changes")
+        if self._cleared:
+            self._loaded.clear()
+        self._loaded.update(self._pending)
+        self._pending.clear()
+        self._cleared = False
+
+    def close(self) -> None:
+        """Close the database; unsaved changes are discarded."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self._loaded.clear()
+        self._pending.clear()
+        self._cleared = False
 
     @staticmethod
-    def compute_checksum(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    def compute_checksum(
+        path: Path, chunk_size: int = CHUNK_SIZE, algorithm: str = "blake2b"
+    ) -> str:
         """
-        Compute MD5 checksum of a file.
+        Compute the checksum of a file.
 
         Args:
             path: File path.
             chunk_size: Read chunk size in bytes.
+            algorithm: Key of HASH_ALGORITHMS.
 
         Returns:
-            Hexadecimal MD5 digest string.
+            Hexadecimal 128-bit digest string.
         """
-        hasher = hashlib.md5()
+        hasher = HASH_ALGORITHMS[algorithm]()
         with open(path, "rb") as f:
             for chunk in iter(lambda: f.read(chunk_size), b""):
                 hasher.update(chunk)
         return hasher.hexdigest()
 
     def _make_key(self, path: Path) -> str:
-        """Create a cache key from a path."""
-        return str(path.resolve())
+        """Create a cache key from a path (lexical: no filesystem access)."""
+        return os.path.abspath(path)
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        if key in self._pending:
+            return self._pending[key]
+        if self._cleared:
+            return None
+        try:
+            return self._loaded[key]
+        except KeyError:
+            pass
+        row = (
+            self._connect()
+            .execute("SELECT * FROM entries WHERE path = ?", (key,))
+            .fetchone()
+        )
+        entry = CacheEntry(*row) if row is not None else None
+        self._loaded[key] = entry
+        return entry
+
+    def _load_tree(self, root: str) -> Dict[str, CacheEntry]:
+        """Return every entry below a directory, with one range query."""
+        prefix = root.rstrip(os.sep) + os.sep
+        entries: Dict[str, CacheEntry] = {}
+        if not self._cleared:
+            # Keys below prefix sort between prefix and the next separator
+            upper = prefix[:-1] + chr(ord(os.sep) + 1)
+            for row in self._connect().execute(
+                "SELECT * FROM entries WHERE path >= ? AND path < ?", (prefix, upper)
+            ):
+                entry = CacheEntry(*row)
+                self._loaded[entry.path] = entry
+                entries[entry.path] = entry
+        for key, entry in self._pending.items():
+            if key.startswith(prefix):
+                if entry is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = entry
+        return entries
+
+    def _checksum_or_none(self, path: str) -> Optional[str]:
+        try:
+            return self.compute_checksum(path, self.CHUNK_SIZE, self.algorithm)
+        except OSError:
+            return None
+
+    def _hash_many(
+        self, paths: List[str], workers: Optional[int]
+    ) -> List[Optional[str]]:
+        """
+        Hash files in a thread pool; hashlib releases the GIL while hashing.
+
+        Returns:
+            Checksums in the order of paths, None for unreadable files.
+        """
+        if len(paths) < 2 or workers == 1:
+            return [self._checksum_or_none(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._checksum_or_none, paths))
+
+    def _items(self) -> Iterator[Tuple[str, CacheEntry]]:
+        """Yield every entry, saved or pending."""
+        if not self._cleared:
+            for row in self._connect().execute("SELECT * FROM entries"):
+                if row[0] not in self._pending:
+                    yield row[0], CacheEntry(*row)
+        for key, entry in list(self._pending.items()):
+            if entry is not None:
+                yield key, entry
 
     def get_entry(self, path: Path) -> Optional[CacheEntry]:
         """Get cache entry for a file."""
-        return self._cache.get(self._make_key(path))
+        return self._lookup(self._make_key(path))
 
     def is_modified(self, path: Path) -> bool:
         """
         Check if a file has been modified since last cached.
 
         Uses a two-stage check:
-        1. Fast check using size and mtime
-        2. Slower checksum verification if fast check passes
+        1. Fast check using size, mtime_ns and inode
+        2. Slower checksum verification if the size matches but not the rest
 
         Args:
             path: File path to check.
@@ -144,60 +338,73 @@ class FileCache:
         Returns:
             True if file is new or modified, False if unchanged.
         """
-        path = Path(path)
-        if not path.exists():
-            return True
-
-        key = self._make_key(path)
-        entry = self._cache.get(key)
-
+        entry = self._lookup(self._make_key(path))
         if entry is None:
             return True
 
         try:
-            stat = path.stat()
-
-            # Fast check: size changed?
+            stat = os.stat(path)
             if stat.st_size != entry.size:
                 return True
-
-            # Fast check: mtime changed?
-            if stat.st_mtime != entry.mtime:
-                # mtime changed, verify with checksum
-                current_checksum = self.compute_checksum(path)
-                return current_checksum != entry.checksum
-
-            # Size and mtime match, assume unchanged
-            return False
-
-        except Exception:
+            if entry.matches(stat):
+                return False
+            # Touched or replaced, verify with checksum
+            return (
+                self.compute_checksum(path, self.CHUNK_SIZE, self.algorithm)
+                != entry.checksum
+            )
+        except OSError:
             return True
 
-    def update(self, path: Path) -> CacheEntry:
+    def update(self, path: Path, checksum: Optional[str] = None) -> CacheEntry:
         """
         Update cache entry for a file.
 
         Args:
             path: File path to cache.
+            checksum: Known checksum of the file's current content (e.g.
+                after copying it from a hashed source). Default: computed.
 
         Returns:
             The new CacheEntry.
         """
-        path = Path(path)
-        stat = path.stat()
+        key = self._make_key(path)
+        stat = os.stat(path)
 
         entry = CacheEntry(
-            path=str(path),
-            checksum=self.compute_checksum(path),
+            path=key,
+            checksum=checksum
+            or self.compute_checksum(path, self.CHUNK_SIZE, self.algorithm),
             size=stat.st_size,
-            mtime=stat.st_mtime,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
             processed_at=datetime.now().isoformat(),
         )
 
-        self._cache[self._make_key(path)] = entry
-        self._dirty = True
+        self._pending[key] = entry
         return entry
 
+    def digest(self, path: Path) -> str:
+        """
+        Return the checksum of a file, hashing it only if it changed.
+
+        The stored digest is reused when size, mtime_ns and inode all
+        match, which costs a single stat().
+
+        Args:
+            path: File path.
+
+        Returns:
+            Hexadecimal digest string.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        entry = self._lookup(self._make_key(path))
+        if entry is not None and entry.matches(os.stat(path)):
+            return entry.checksum
+        return self.update(path).checksum
+
     def remove(self, path: Path) -> bool:
         """
         Remove a file from cache.
@@ -209,47 +416,120 @@ class FileCache:
             True if entry was removed, False if not found.
         """
         key = self._make_key(path)
-        if key in self._cache:
-            del self._cache[key]
-            self._dirty = True
-            return True
-        return False
+        if self._lookup(key) is None:
+            return False
+        self._pending[key] = None
+        return True
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
-        self._dirty = True
+        self._loaded.clear()
+        self._pending.clear()
+        self._cleared = True
 
-    def get_modified_files(self, paths: Set[Path]) -> Set[Path]:
+    def get_modified_files(
+        self, paths: Set[Path], workers: Optional[int] = None
+    ) -> Set[Path]:
         """
         Filter a set of paths to only those that have been modified.
 
+        Same decision as is_modified(), with the checksums that stat()
+        cannot settle computed in a thread pool.
+
         Args:
             paths: Set of file paths to check.
+            workers: Hashing threads. Default: ThreadPoolExecutor's.
 
         Returns:
             Set of paths that are new or modified.
         """
-        return {p for p in paths if self.is_modified(p)}
+        modified = set()
+        to_hash: List[Tuple[Path, CacheEntry]] = []
+        for path in paths:
+            entry = self._lookup(self._make_key(path))
+            try:
+                stat = os.stat(path)
+            except OSError:
+                modified.add(path)
+                continue
+            if entry is None or stat.st_size != entry.size:
+                modified.add(path)
+            elif not entry.matches(stat):
+                to_hash.append((path, entry))
+
+        checksums = self._hash_many([str(p) for p, _ in to_hash], workers)
+        for (path, entry), checksum in zip(to_hash, checksums):
+            if checksum != entry.checksum:
+                modified.add(path)
+        return modified
+
+    def scan(self, roots: Iterable[Path], workers: Optional[int] = None) -> ChangeSet:
+        """
+        Compare directory trees with the cache and record their new state.
+
+        Every file is stat()ed through os.scandir; only files whose size,
+        mtime_ns or inode changed are hashed, in a thread pool. A touched
+        file with the same content is not reported. Call save() to persist
+        the new state.
+
+        Args:
+            roots: Directories to scan recursively.
+            workers: Hashing threads. Default: ThreadPoolExecutor's.
+
+        Returns:
+            The files added, modified and deleted since the previous scan
+            of these directories.
+        """
+        changes = ChangeSet()
+        known: Dict[str, CacheEntry] = {}
+        found: Dict[str, os.stat_result] = {}
+        for root in roots:
+            root_key = self._make_key(root)
+            known.update(self._load_tree(root_key))
+            found.update(_walk_files(root_key))
+
+        candidates = [
+            (key, stat)
+            for key, stat in found.items()
+            if key not in known or not known[key].matches(stat)
+        ]
+        checksums = self._hash_many([key for key, _ in candidates], workers)
+        processed_at = datetime.now().isoformat()
+        for (key, stat), checksum in zip(candidates, checksums):
+            if checksum is None:
+                continue
+            entry = known.get(key)
+            if entry is None:
+                changes.added.add(Path(key))
+            elif entry.checksum != checksum:
+                changes.modified.add(Path(key))
+            self._pending[key] = CacheEntry(
+                key,
+                checksum,
+                stat.st_size,
+                stat.st_mtime_ns,
+                stat.st_ino,
+                processed_at,
+            )
+
+        for key in known.keys() - found.keys():
+            changes.deleted.add(Path(key))
+            self._pending[key] = None
+        return changes
 
     def prune_missing(self) -> int:
         """
         Remove cache entries for files that no longer exist.
 
+        Stats every entry: a maintenance operation, not for the build's
+        hot path (scan() already drops the entries of deleted files).
+
         Returns:
             Number of entries removed.
         """
-        to_remove = []
-        for key, entry in self._cache.items():
-            if not Path(entry.path).exists():
-                to_remove.append(key)
-
+        to_remove = [key for key, _ in self._items() if not os.path.exists(key)]
         for key in to_remove:
-            del self._cache[key]
-
-        if to_remove:
-            self._dirty = True
-
+            self._pending[key] = None
         return len(to_remove)
 
     def __enter__(self) -> "FileCache":
@@ -257,12 +537,13 @@ class FileCache:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit - save cache."""
+        """Context manager exit - save cache and close the database."""
         self.save()
+        self.close()
 
     def __len__(self) -> int:
         """Return number of cache entries."""
-        return len(self._cache)
+        return sum(1 for _ in self._items())
 
 
 def needs_rebuild(
@@ -295,4 +576,3 @@ def needs_rebuild(
 
     # Fallback to mtime comparison
     return src_path.stat().st_mtime > dest_path.stat().st_mtime
-
@@ -2,18 +2,34 @@
 Frontmatter parsing utilities for Markdown files.
 
 Parses YAML frontmatter from Markdown content and optionally
-validates it against a pydantic schema.
+validates it against a pydantic schema. read_frontmatter() reads only the
+header of a file, for passes that need metadata but not the body.
 """
 
+import copy
+import functools
 import logging
+import os
+import re
+from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, Type
 
 import frontmatter
+import yaml
 
+from .constants import FRONTMATTER_CACHE_SIZE
 from .metadata_schema import ContentMetadata, validate_metadata
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Same delimiter as python-frontmatter's YAML handler
+_DELIMITER = re.compile(r"-{3,}\s*")
+
 
 def _ensure_list(value: Any) -> list:
     """
@@ -36,6 +52,79 @@ def _ensure_list(value: Any) -> list:
     return [v.strip() for v in text.strip("[]").split(",") if v.strip()]
 
 
+def normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize raw frontmatter metadata the way parse_frontmatter does.
+
+    Args:
+        metadata: Raw metadata mapping as returned by python-frontmatter.
+
+    Returns:
+        New metadata dict with list fields normalized.
+    """
+    result = dict(metadata or {})
+    for key in ["categories", "meta_keywords", "tags"]:
+        result[key] = _ensure_list(result.get(key))
+    return result
+
+
+def _read_header(path: Path) -> Dict[str, Any]:
+    """Read a file up to its closing delimiter and parse the YAML between."""
+    with open(path, "r", encoding="utf-8") as f:
+        first = next((line for line in f if line.strip()), "")
+        if not _DELIMITER.fullmatch(first.lstrip()):
+            # Not YAML frontmatter: let python-frontmatter decide
+            return dict(frontmatter.loads(first + f.read()).metadata)
+        lines = []
+        for line in f:
+            if _DELIMITER.fullmatch(line):
+                break
+            lines.append(line)
+        else:
+            # No closing delimiter: python-frontmatter finds no frontmatter
+            return {}
+    data = yaml.load("".join(lines), Loader=_SafeLoader)
+    return data if isinstance(data, dict) else {}
+
+
+def read_frontmatter(path: Path) -> Dict[str, Any]:
+    """
+    Return the raw frontmatter of a file without reading its body.
+
+    Reads the file only up to the closing "---" and parses the YAML with
+    libyaml's CSafeLoader when available. Results are cached by path and
+    (mtime_ns, size, inode), so a file is read again only once it
+    changed; the cache keeps the FRONTMATTER_CACHE_SIZE most recently
+    used headers. Metadata is the same as frontmatter.load(path).metadata.
+
+    Args:
+        path: Markdown file.
+
+    Returns:
+        A fresh copy of the raw (not normalized) metadata mapping.
+
+    Raises:
+        OSError: If the file cannot be read.
+        yaml.YAMLError: If the frontmatter is not valid YAML.
+    """
+    key = os.fspath(path)
+    stat = os.stat(key)
+    stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    return copy.deepcopy(_cached_header(key, stat_key))
+
+
+@functools.lru_cache(maxsize=FRONTMATTER_CACHE_SIZE)
+def _cached_header(key: str, stat_key: Tuple[int, int, int]) -> Dict[str, Any]:
+    # stat_key is only part of the cache key: an edited file is read again
+    # and its previous header is evicted as it falls out of use
+    return _read_header(Path(key))
+
+
+def clear_frontmatter_cache() -> None:
+    """Forget every header read by read_frontmatter()."""
+    _cached_header.cache_clear()
+
+
 def parse_frontmatter(
     content: str,
     validate: bool = False,
@@ -71,11 +160,9 @@ def parse_frontmatter(
     """
     try:
         parsed = frontmatter.loads(content)
-        metadata = dict(parsed.metadata or {})
 
         # Normalize common list fields
-        for key in ["categories", "meta_keywords", "tags"]:
-            metadata[key] = _ensure_list(metadata.get(key))
+        metadata = normalize_metadata(parsed.metadata)
 
         # Optional schema validation
         if validate:
@@ -2,15 +2,15 @@
 Gallery image utilities for the IDOINE static site generator.
 
 Handles image discovery, copying, and resizing with path validation.
+Resizing is delegated to the shared ImageProcessor service.
 """
 
 import logging
 import shutil
 from pathlib import Path
-from typing import List, Optional
-
-from PIL import Image, ImageOps
+from typing import Dict, List, Optional
 
+from .image_processor import ImageProcessor, ImageVariant
 from .path_validator import PathValidationError, validate_path_within_base
 
 logger = logging.getLogger(__name__)
@@ -43,15 +43,31 @@ def find_image_files(images_dir: Path) -> list:
     ]
 
 
-def copy_images(images_dir: Path, dist_path: Path) -> None:
+def _is_same_copy(src: Path, dst: Path) -> bool:
+    try:
+        src_stat, dst_stat = src.stat(), dst.stat()
+    except OSError:
+        return False
+    return (
+        src_stat.st_size == dst_stat.st_size
+        and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+    )
+
+
+def copy_images(images_dir: Path, dist_path: Path) -> List[Path]:
     """
     Copy images from source to assets/gallery_images preserving directory structure.
 
-    Validates all paths to prevent path traversal attacks.
+    Validates all paths to prevent path traversal attacks. An image whose
+    copy has the same size and modification time (copy2 preserves it) is
+    left in place.
 
     Args:
         images_dir: Source directory containing images.
         dist_path: Destination root directory.
+
+    Returns:
+        The gallery image files in dist/, copied or already up to date.
     """
     image_extensions = (".png", ".jpg", ".jpeg", ".gif", ".webp")
     target_images_dir = dist_path / "assets" / "gallery_images"
@@ -59,6 +75,7 @@ def copy_images(images_dir: Path, dist_path: Path) -> None:
 
     images_dir = Path(images_dir).resolve()
     dist_path = Path(dist_path).resolve()
+    copied = []
 
     for src_image in images_dir.glob("**/*"):
         if src_image.is_file() and src_image.suffix.lower() in image_extensions:
@@ -79,85 +96,52 @@ def copy_images(images_dir: Path, dist_path: Path) -> None:
                 logger.warning(f"Chemin de destination invalide ignoré : {e}")
                 continue
 
+            copied.append(dst_image)
+            if _is_same_copy(src_image, dst_image):
+                continue
             dst_image.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(src_image, dst_image)
             logger.info("Copié : %s -> %s", src_image, dst_image)
 
-
-def _save_image(image: Image.Image, dest: Path, suffix: str, width: int) -> None:
-    dest = dest.with_suffix(suffix)
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    transposed = ImageOps.exif_transpose(image)
-    img: Image.Image = transposed if isinstance(transposed, Image.Image) else image
-    img = img.convert("RGB")
-    img_copy = img.copy()
-    img_copy.thumbnail((width, width * 10_000))
-    if suffix.lower() == ".webp":
-        img_copy.save(dest, format="WEBP", quality=85, method=6)
-    elif suffix.lower() in (".jpg", ".jpeg"):
-        img_copy.save(dest, format="JPEG", quality=85, optimize=True, progressive=True)
-    else:
-        img_copy.save(dest, format="PNG", optimize=True)
+    return copied
 
 
-def generate_resized_images(images_dir: Path, dist_path: Path) -> None:
+def generate_resized_images(
+    images_dir: Path,
+    dist_path: Path,
+    processor: Optional[ImageProcessor] = None,
+) -> Dict[str, Dict[str, List[ImageVariant]]]:
     """
-    Generate resized images (small/medium/large) and WebP variants.
+    Generate resized images (small/medium/large) with WebP/AVIF variants.
 
     Creates optimized versions under dist/assets/gallery_images/{size}/...
-    Validates all paths to prevent path traversal attacks.
+    through the shared ImageProcessor, together with any other images
+    already submitted to it. Validates all paths to prevent path
+    traversal attacks.
 
     Args:
         images_dir: Source directory containing original images.
         dist_path: Destination root directory.
+        processor: Image service to use. Default: a serial, uncached one.
+
+    Returns:
+        Manifest mapping each gallery image (relative posix path, as
+        returned by find_image_files) to its variants by size name.
     """
     if not images_dir.exists():
-        return
+        return {}
 
     images_dir = Path(images_dir).resolve()
     dist_path = Path(dist_path).resolve()
-    target_root = dist_path / "assets" / "gallery_images"
-
-    sizes = {
-        "small": 300,
-        "medium": 800,
-        "large": 1200,
-    }
-    image_extensions = (".png", ".jpg", ".jpeg", ".gif", ".webp")
-
-    for src_image in images_dir.glob("**/*"):
-        if not (src_image.is_file() and src_image.suffix.lower() in image_extensions):
-            continue
-
-        # Validate source path
-        try:
-            validate_path_within_base(src_image, images_dir)
-        except PathValidationError as e:
-            logger.warning(f"Image source invalide ignorée : {e}")
-            continue
+    processor = processor if processor is not None else ImageProcessor()
 
-        relative_path = src_image.relative_to(images_dir)
+    processor.submit_directory(images_dir, dist_path / "assets" / "gallery_images")
+    manifest = processor.flush()
 
+    gallery: Dict[str, Dict[str, List[ImageVariant]]] = {}
+    for src, variants in manifest.items():
         try:
-            with Image.open(src_image) as im:
-                for size_name, width in sizes.items():
-                    base_dest = target_root / size_name / relative_path
-
-                    # Validate destination path
-                    try:
-                        validate_path_within_base(base_dest.parent, dist_path)
-                    except PathValidationError as e:
-                        logger.warning(f"Destination invalide ignorée : {e}")
-                        continue
-
-                    # Save fallback in original extension (jpg/png)
-                    fallback_suffix = (
-                        ".jpg"
-                        if src_image.suffix.lower() in (".jpg", ".jpeg")
-                        else (".png" if src_image.suffix.lower() == ".png" else ".jpg")
-                    )
-                    _save_image(im, base_dest, fallback_suffix, width)
-                    # Save WebP variant
-                    _save_image(im, base_dest, ".webp", width)
-        except Exception as e:
-            logger.error("Erreur lors du redimensionnement de %s: %s", src_image, e)
+            gallery[src.relative_to(images_dir).as_posix()] = variants
+        except ValueError:
+            continue  # Submitted by another caller
+    return gallery
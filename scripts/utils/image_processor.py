@@ -3,9 +3,20 @@ Image processing utilities for the IDOINE static site generator.
 
 Provides image optimization, resizing, and format conversion
 using Pillow for better performance and smaller file sizes.
+
+Images are submitted in batches: each source is decoded and oriented
+once, downscaled step by step from the largest configured size to the
+smallest, and encoded in every output format (WebP, and AVIF when the
+installed Pillow supports it). Encoded variants can be kept in a
+content-addressed cache and cache misses spread over a process pool.
 """
 
+import functools
+import hashlib
 import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -13,10 +24,31 @@ from typing import Any, Dict, List, Optional, Tuple
 from PIL import Image, ImageOps
 
 from .constants import IMAGE_QUALITY, IMAGE_SIZES, SUPPORTED_IMAGE_EXTENSIONS
+from .file_cache import FileCache
 from .path_validator import PathValidationError, validate_path_within_base
 
 logger = logging.getLogger(__name__)
 
+# Bump when the encoding settings change so cached variants are rebuilt
+IMAGE_PIPELINE_VERSION = "2"
+
+FORMAT_SUFFIXES: Dict[str, str] = {
+    "JPEG": ".jpg",
+    "PNG": ".png",
+    "WEBP": ".webp",
+    "AVIF": ".avif",
+}
+
+# Manifest of generated variants: source path -> size name -> variants
+ImageManifest = Dict[Path, Dict[str, List["ImageVariant"]]]
+
+
+@functools.lru_cache(maxsize=None)
+def avif_supported() -> bool:
+    """Whether the installed Pillow can encode AVIF."""
+    Image.init()
+    return "AVIF" in Image.SAVE
+
 
 @dataclass
 class ImageVariant:
@@ -29,12 +61,110 @@ class ImageVariant:
     size_bytes: int
 
 
+@dataclass
+class _VariantTarget:
+    """One variant to produce for a submitted source."""
+
+    size_name: str
+    width: int
+    format: str
+    dest: Path
+    cached: Optional[Path] = None
+
+    @property
+    def output(self) -> Path:
+        """Where the encoder writes: the cache when enabled, else dest."""
+        return self.cached if self.cached is not None else self.dest
+
+
+def _open_oriented(src_path: Path) -> Image.Image:
+    """Decode src_path, apply its EXIF orientation and normalize the mode."""
+    with Image.open(src_path) as im:
+        transposed = ImageOps.exif_transpose(im)
+        img: Image.Image = transposed if isinstance(transposed, Image.Image) else im
+        if img.mode == "P":
+            return img.convert("RGBA" if "transparency" in img.info else "RGB")
+        if img.mode in ("RGBA", "LA", "PA"):
+            return img.convert("RGBA")
+        return img.convert("RGB")
+
+
+def _save(image: Image.Image, dest: Path, fmt: str, quality: int) -> None:
+    """Encode image to dest atomically."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "JPEG" and image.mode != "RGB":
+        # JPEG has no alpha channel
+        image = image.convert("RGB")
+
+    save_kwargs: Dict[str, Any] = {}
+    if fmt == "JPEG":
+        save_kwargs = {"quality": quality, "optimize": True, "progressive": True}
+    elif fmt == "WEBP":
+        save_kwargs = {"quality": quality, "method": 4}
+    elif fmt == "AVIF":
+        save_kwargs = {"quality": quality}
+    elif fmt == "PNG":
+        save_kwargs = {"optimize": True}
+
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    image.save(tmp, format=fmt, **save_kwargs)
+    os.replace(tmp, dest)
+
+
+def _encode_source(
+    src_path: Path, targets: List[_VariantTarget], quality: Dict[str, int]
+) -> List[Tuple[int, int]]:
+    """
+    Decode src_path once and encode every target.
+
+    Widths are processed from largest to smallest, each step downscaling
+    the previous one rather than the original. Runs in pool workers.
+
+    Returns:
+        The (width, height) of each target, in order.
+    """
+    current = _open_oriented(src_path)
+    sizes: Dict[int, Tuple[int, int]] = {}
+    for width in sorted({t.width for t in targets}, reverse=True):
+        step = current.copy()
+        step.thumbnail((width, width * 10_000))
+        for target in targets:
+            if target.width == width:
+                fmt = target.format
+                _save(step, target.output, fmt, quality.get(fmt.lower(), 85))
+        sizes[width] = step.size
+        current = step
+    return [sizes[t.width] for t in targets]
+
+
+def _install(cached: Path, dest: Path) -> None:
+    """Copy a cached variant to dest atomically unless an identical copy is there."""
+    try:
+        src_stat, dst_stat = cached.stat(), dest.stat()
+        if (
+            src_stat.st_size == dst_stat.st_size
+            and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+        ):
+            return
+    except FileNotFoundError:
+        pass
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    try:
+        shutil.copy2(cached, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 class ImageProcessor:
     """
     Handles image optimization and responsive image generation.
 
-    Generates multiple sizes and formats (including WebP) for
-    responsive images with optimal compression.
+    Generates multiple sizes and formats (including WebP and AVIF) for
+    responsive images with optimal compression. Variants are written as
+    dest_root/{size}/{relative path}{format suffix}.
     """
 
     def __init__(
@@ -42,6 +172,10 @@ class ImageProcessor:
         sizes: Optional[Dict[str, int]] = None,
         quality: Optional[Dict[str, int]] = None,
         generate_webp: bool = True,
+        generate_avif: bool = True,
+        cache_dir: Optional[Path] = None,
+        jobs: int = 1,
+        file_cache: Optional[FileCache] = None,
     ):
         """
         Initialize the ImageProcessor.
@@ -52,11 +186,27 @@ class ImageProcessor:
             quality: Dictionary of format names to quality values.
                      Default: {"jpeg": 85, "webp": 85, "avif": 80}
             generate_webp: Whether to generate WebP variants. Default True.
+            generate_avif: Whether to generate AVIF variants when the
+                           installed Pillow supports it. Default True.
+            cache_dir: Content-addressed variant cache. None disables caching.
+            jobs: Worker processes for encoding. 1 encodes serially;
+                  0 uses one per CPU.
+            file_cache: Digests of sources for the variant cache keys; an
+                        unchanged source costs a stat(). None hashes each
+                        source once per (size, mtime_ns, inode).
         """
         self.sizes = sizes or dict(IMAGE_SIZES)
         self.quality = quality or dict(IMAGE_QUALITY)
         self.generate_webp = generate_webp
+        self.generate_avif = generate_avif and avif_supported()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.file_cache = file_cache
+        # Source path -> (size, mtime_ns, inode, digest) without a file_cache
+        self._digests: Dict[Path, Tuple[int, int, int, str]] = {}
         self.supported_extensions = SUPPORTED_IMAGE_EXTENSIONS
+        self._queue: Dict[Path, List[_VariantTarget]] = {}
+        self._outputs: List[Path] = []
 
     def is_supported(self, path: Path) -> bool:
         """Check if the file is a supported image format."""
@@ -80,6 +230,215 @@ class ImageProcessor:
         """Get quality setting for a format."""
         return self.quality.get(format_name.lower(), 85)
 
+    def variant_formats(self, src_path: Path) -> List[str]:
+        """
+        Output formats generated for a source.
+
+        The fallback keeps PNG sources as PNG and encodes everything else
+        (including GIF and WebP sources) as JPEG.
+        """
+        formats = ["PNG" if src_path.suffix.lower() == ".png" else "JPEG"]
+        if self.generate_webp:
+            formats.append("WEBP")
+        if self.generate_avif:
+            formats.append("AVIF")
+        return formats
+
+    def _variant_key(self, source_digest: str, width: int, fmt: str) -> str:
+        """Content-addressed cache key of a variant."""
+        payload = (
+            f"{IMAGE_PIPELINE_VERSION}:{source_digest}:{width}:{fmt}:"
+            f"{self._get_quality(fmt)}"
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _source_digest(self, src_path: Path) -> str:
+        """Content digest of a source, read only when its stat changed."""
+        if self.file_cache is not None:
+            return self.file_cache.digest(src_path)
+        stat = src_path.stat()
+        known = self._digests.get(src_path)
+        if known is not None and known[:3] == (
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
+        ):
+            return known[3]
+        digest = hashlib.sha256(src_path.read_bytes()).hexdigest()
+        self._digests[src_path] = (stat.st_size, stat.st_mtime_ns, stat.st_ino, digest)
+        return digest
+
+    def submit(
+        self, src_path: Path, dest_root: Path, relative: Optional[Path] = None
+    ) -> None:
+        """
+        Queue a source image for processing by the next flush().
+
+        Args:
+            src_path: Source image path.
+            dest_root: Root under which the {size}/ directories are written.
+            relative: Output path below each size directory; its suffix is
+                      replaced by each format's. Default: the source file name.
+        """
+        src_path = Path(src_path)
+        stem = Path(relative if relative is not None else src_path.name).with_suffix("")
+
+        digest = ""
+        if self.cache_dir is not None:
+            digest = self._source_digest(src_path)
+
+        targets = []
+        for size_name, width in self.sizes.items():
+            for fmt in self.variant_formats(src_path):
+                suffix = FORMAT_SUFFIXES[fmt]
+                target = _VariantTarget(
+                    size_name,
+                    width,
+                    fmt,
+                    Path(dest_root) / size_name / stem.with_name(stem.name + suffix),
+                )
+                if self.cache_dir is not None:
+                    key = self._variant_key(digest, width, fmt)
+                    target.cached = self.cache_dir / key[:2] / f"{key}{suffix}"
+                targets.append(target)
+        self._queue[src_path] = targets
+
+    def submit_directory(
+        self, src_dir: Path, dest_root: Path, recursive: bool = True
+    ) -> int:
+        """
+        Queue every supported image of a directory, preserving its structure.
+
+        Validates all paths to prevent path traversal attacks.
+
+        Args:
+            src_dir: Source directory containing images.
+            dest_root: Root under which the {size}/ directories are written.
+            recursive: Whether to process subdirectories.
+
+        Returns:
+            Number of images queued.
+        """
+        src_dir = Path(src_dir).resolve()
+        dest_root = Path(dest_root).resolve()
+        pattern = "**/*" if recursive else "*"
+        queued = 0
+
+        for src_path in sorted(src_dir.glob(pattern)):
+            if not src_path.is_file() or not self.is_supported(src_path):
+                continue
+
+            # Validate paths
+            try:
+                validate_path_within_base(src_path, src_dir)
+                relative_path = src_path.relative_to(src_dir)
+                for size_name in self.sizes:
+                    validate_path_within_base(
+                        dest_root / size_name / relative_path, dest_root
+                    )
+            except PathValidationError as e:
+                logger.warning(f"Skipping invalid image path: {e}")
+                continue
+
+            try:
+                self.submit(src_path, dest_root, relative_path)
+            except OSError as e:
+                logger.error(f"Error processing image {src_path}: {e}")
+                continue
+            queued += 1
+
+        return queued
+
+    def flush(self) -> ImageManifest:
+        """
+        Process every queued image.
+
+        Sources with a cache entry for all their variants are copied from
+        the cache; the others are decoded once and encoded, across the
+        process pool when jobs > 1.
+
+        Returns:
+            Manifest mapping each source path to its variants by size name.
+        """
+        queue, self._queue = self._queue, {}
+        pending = {
+            src: [t for t in targets if t.cached is None or not t.cached.exists()]
+            for src, targets in queue.items()
+        }
+        pending = {src: targets for src, targets in pending.items() if targets}
+
+        dimensions = self._run_encoders(pending)
+
+        manifest: ImageManifest = {}
+        for src, targets in queue.items():
+            if src in pending and src not in dimensions:
+                continue  # Encoding failed (already logged)
+            encoded = {
+                (t.size_name, t.format): size
+                for t, size in zip(pending.get(src, []), dimensions.get(src, []))
+            }
+            variants: Dict[str, List[ImageVariant]] = {}
+            for target in targets:
+                if target.cached is not None:
+                    _install(target.cached, target.dest)
+                self._outputs.append(target.dest)
+                size = encoded.get((target.size_name, target.format))
+                if size is None:
+                    with Image.open(target.dest) as img:
+                        size = img.size
+                variants.setdefault(target.size_name, []).append(
+                    ImageVariant(
+                        path=target.dest,
+                        width=size[0],
+                        height=size[1],
+                        format=target.format,
+                        size_bytes=target.dest.stat().st_size,
+                    )
+                )
+            manifest[src] = variants
+
+        if queue:
+            logger.info(
+                f"Images : {len(dimensions)} encodée(s), "
+                f"{len(queue) - len(pending)} depuis le cache"
+            )
+        return manifest
+
+    def take_outputs(self) -> List[Path]:
+        """Return the variant files written or kept by flush() since the last call."""
+        outputs, self._outputs = self._outputs, []
+        return outputs
+
+    def _run_encoders(
+        self, pending: Dict[Path, List[_VariantTarget]]
+    ) -> Dict[Path, List[Tuple[int, int]]]:
+        """
+        Encode pending sources serially or across a process pool.
+
+        Returns:
+            Dimensions of the encoded targets for each successful source.
+        """
+        results: Dict[Path, List[Tuple[int, int]]] = {}
+        if self.jobs <= 1 or len(pending) <= 1:
+            for src, targets in pending.items():
+                try:
+                    results[src] = _encode_source(src, targets, self.quality)
+                except Exception as e:
+                    logger.error(f"Error processing image {src}: {e}")
+            return results
+
+        with ProcessPoolExecutor(max_workers=min(self.jobs, len(pending))) as pool:
+            futures = {
+                src: pool.submit(_encode_source, src, targets, self.quality)
+                for src, targets in pending.items()
+            }
+            for src, future in futures.items():
+                try:
+                    results[src] = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing image {src}: {e}")
+        return results
+
     def optimize_image(
         self,
         src_path: Path,
@@ -101,55 +460,22 @@ class ImageProcessor:
             or None if processing failed.
         """
         try:
-            with Image.open(src_path) as img:
-                # Handle EXIF orientation
-                img = ImageOps.exif_transpose(img) or img
-
-                # Convert to RGB for JPEG output (removes alpha channel)
-                if output_format in ("JPEG", "WEBP") and img.mode in ("RGBA", "P"):
-                    img = img.convert("RGB")
-                elif img.mode == "P":
-                    img = img.convert("RGBA" if "transparency" in img.info else "RGB")
-
-                # Create a copy for processing
-                processed = img.copy()
-
-                # Resize if max_width specified
-                if max_width and processed.width > max_width:
-                    ratio = max_width / processed.width
-                    new_height = int(processed.height * ratio)
-                    processed = processed.resize(
-                        (max_width, new_height),
-                        Image.Resampling.LANCZOS,
-                    )
+            processed = _open_oriented(src_path)
 
-                # Ensure destination directory exists
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Determine output format
-                fmt = output_format or self._get_output_format(src_path.suffix)
-                quality = self._get_quality(fmt)
-
-                # Save with optimization
-                save_kwargs: Dict[str, Any] = {"optimize": True}
-                if fmt == "JPEG":
-                    save_kwargs["quality"] = quality
-                    save_kwargs["progressive"] = True
-                elif fmt == "WEBP":
-                    save_kwargs["quality"] = quality
-                    save_kwargs["method"] = 6  # Higher = better compression, slower
-                elif fmt == "PNG":
-                    save_kwargs["compress_level"] = 9
-
-                processed.save(dest_path, format=fmt, **save_kwargs)
-
-                return ImageVariant(
-                    path=dest_path,
-                    width=processed.width,
-                    height=processed.height,
-                    format=fmt,
-                    size_bytes=dest_path.stat().st_size,
-                )
+            # Resize if max_width specified
+            if max_width and processed.width > max_width:
+                processed.thumbnail((max_width, max_width * 10_000))
+
+            fmt = output_format or self._get_output_format(src_path.suffix)
+            _save(processed, dest_path, fmt, self._get_quality(fmt))
+
+            return ImageVariant(
+                path=dest_path,
+                width=processed.width,
+                height=processed.height,
+                format=fmt,
+                size_bytes=dest_path.stat().st_size,
+            )
 
         except Exception as e:
             logger.error(f"Error processing image {src_path}: {e}")
@@ -171,51 +497,22 @@ class ImageProcessor:
 
         Returns:
             Dictionary mapping size names to lists of ImageVariant objects.
-            Each size may have multiple formats (e.g., JPEG and WebP).
+            Each size may have multiple formats (e.g., JPEG, WebP and AVIF).
         """
-        results: Dict[str, List[ImageVariant]] = {}
-
         if not self.is_supported(src_path):
             logger.warning(f"Unsupported image format: {src_path}")
-            return results
-
-        base_name = base_name or src_path.stem
-        original_format = self._get_output_format(src_path.suffix)
-
-        for size_name, max_width in self.sizes.items():
-            variants = []
-            size_dir = dest_dir / size_name
+            return {}
 
-            # Generate in original format
-            if original_format in ("JPEG", "PNG"):
-                suffix = ".jpg" if original_format == "JPEG" else ".png"
-                dest_path = size_dir / f"{base_name}{suffix}"
-
-                variant = self.optimize_image(
-                    src_path, dest_path, max_width, original_format
-                )
-                if variant:
-                    variants.append(variant)
-
-            # Generate WebP variant
-            if self.generate_webp:
-                webp_path = size_dir / f"{base_name}.webp"
-                webp_variant = self.optimize_image(
-                    src_path, webp_path, max_width, "WEBP"
-                )
-                if webp_variant:
-                    variants.append(webp_variant)
-
-            results[size_name] = variants
-
-        return results
+        name = f"{base_name}{src_path.suffix}" if base_name else src_path.name
+        self.submit(src_path, dest_dir, Path(name))
+        return self.flush().get(Path(src_path), {})
 
     def process_directory(
         self,
         src_dir: Path,
         dest_dir: Path,
         recursive: bool = True,
-    ) -> Dict[Path, Dict[str, List[ImageVariant]]]:
+    ) -> ImageManifest:
         """
         Process all images in a directory.
 
@@ -227,40 +524,8 @@ class ImageProcessor:
         Returns:
             Dictionary mapping source paths to their generated variants.
         """
-        results: Dict[Path, Dict[str, List[ImageVariant]]] = {}
-
-        src_dir = Path(src_dir).resolve()
-        dest_dir = Path(dest_dir).resolve()
-
-        pattern = "**/*" if recursive else "*"
-
-        for src_path in src_dir.glob(pattern):
-            if not src_path.is_file():
-                continue
-
-            if not self.is_supported(src_path):
-                continue
-
-            # Validate paths
-            try:
-                validate_path_within_base(src_path, src_dir)
-            except PathValidationError as e:
-                logger.warning(f"Skipping invalid source path: {e}")
-                continue
-
-            # Preserve directory structure
-            relative_path = src_path.relative_to(src_dir)
-            output_base = dest_dir / relative_path.parent
-
-            variants = self.generate_responsive_variants(
-                src_path, output_base, src_path.stem
-            )
-
-            if variants:
-                results[src_path] = variants
-                logger.info(f"Processed: {src_path.name}")
-
-        return results
+        self.submit_directory(src_dir, dest_dir, recursive)
+        return self.flush()
 
 
 def optimize_gallery_images(
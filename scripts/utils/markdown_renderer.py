@@ -0,0 +1,356 @@
+"""
+Markdown to HTML conversion for the IDOINE static site generator.
+
+Conversion goes through a MarkdownEngine selected by the markdown_engine
+setting: python-markdown (default), or markdown-it, a CommonMark engine
+(pip install markdown-it-py). Each thread keeps one engine instance per
+extension list, reset between documents, instead of building a new
+parser (and all its processors) for every call. Converted HTML can also
+be kept in a persistent cache keyed by the Markdown body, the engine, its
+version and the extension list, so rebuilds that only change templates
+skip Markdown conversion entirely. Entries record when they were last
+used; a build that converts every page drops the ones it did not use.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Type
+
+import markdown
+
+try:
+    import markdown_it
+except ImportError:  # Optional: python-markdown only
+    markdown_it = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXTENSIONS: Tuple[str, ...] = ("meta",)
+DEFAULT_ENGINE = "python-markdown"
+
+
+class MarkdownEngine(ABC):
+    """
+    A Markdown implementation.
+
+    Subclasses implement convert(). Instances are not thread-safe;
+    markdown_to_html() keeps one per thread.
+    """
+
+    name = ""
+    version = ""
+
+    def __init__(self, extensions: Sequence[str] = DEFAULT_EXTENSIONS):
+        """
+        Initialize the engine.
+
+        Args:
+            extensions: python-markdown extension names.
+        """
+        self.extensions = tuple(extensions)
+
+    @property
+    def cache_tag(self) -> str:
+        """Everything besides the text that determines the output."""
+        return f"{self.name} {self.version} {','.join(self.extensions)}"
+
+    @abstractmethod
+    def convert(self, text: str) -> str:
+        """Convert one document to HTML."""
+
+
+class PythonMarkdownEngine(MarkdownEngine):
+    """python-markdown, with the configured extensions."""
+
+    name = "python-markdown"
+    version = markdown.__version__
+
+    def __init__(self, extensions: Sequence[str] = DEFAULT_EXTENSIONS):
+        super().__init__(extensions)
+        self._md = markdown.Markdown(extensions=list(self.extensions))
+
+    def convert(self, text: str) -> str:
+        return self._md.reset().convert(text)
+
+
+class MarkdownItEngine(MarkdownEngine):
+    """
+    markdown-it-py with the CommonMark preset.
+
+    python-markdown extensions do not apply: "meta" lines at the top of
+    a body are kept as text, and raw HTML blocks follow CommonMark rules.
+    """
+
+    name = "markdown-it"
+    version = markdown_it.__version__ if markdown_it is not None else ""
+
+    def __init__(self, extensions: Sequence[str] = DEFAULT_EXTENSIONS):
+        if markdown_it is None:
+            raise ValueError(
+                "The markdown-it engine requires: pip install markdown-it-py"
+            )
+        super().__init__(extensions)
+        self._md = markdown_it.MarkdownIt("commonmark")
+
+    def convert(self, text: str) -> str:
+        # python-markdown output has no trailing newline
+        return self._md.render(text).rstrip("\n")
+
+
+MARKDOWN_ENGINES: Dict[str, Type[MarkdownEngine]] = {
+    PythonMarkdownEngine.name: PythonMarkdownEngine,
+    MarkdownItEngine.name: MarkdownItEngine,
+}
+
+
+class MarkdownHtmlCache:
+    """
+    SQLite store of converted HTML.
+
+    Safe to share between threads and processes: every process opens its
+    own connection on first use, and entries are written as they are
+    converted (pool workers have no chance to flush a batch).
+
+    Each entry stores the session (a timestamp) that last used it; a hit
+    from an older session updates it, so an entry is written at most once
+    per session. prune() deletes the entries left unused since a given
+    session.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the MarkdownHtmlCache.
+
+        Args:
+            path: Database file; created on first use.
+        """
+        self.path = Path(path)
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._lock = threading.Lock()
+        self.session = time.time()
+        self.hits = 0
+        self.misses = 0
+
+    def begin_session(self) -> float:
+        """Start a new session (e.g. a build) and return its timestamp."""
+        # Strictly later than the previous session, even on a coarse clock
+        self.session = max(time.time(), self.session + 1e-6)
+        return self.session
+
+    @staticmethod
+    def make_key(text: str, tag: str) -> str:
+        """Return the cache key of a body converted by an engine with this tag."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{tag}\0".encode("utf-8"))
+        hasher.update(text.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        # A connection inherited through fork() must not be used
+        if self._db is not None and self._pid == os.getpid():
+            return self._db
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=OFF")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS html (key TEXT PRIMARY KEY, "
+                "html TEXT NOT NULL, used REAL NOT NULL DEFAULT 0) WITHOUT ROWID"
+            )
+            columns = {row[1] for row in db.execute("PRAGMA table_info(html)")}
+            if "used" not in columns:
+                # Cache written before entries recorded their last use
+                db.execute("ALTER TABLE html ADD COLUMN used REAL NOT NULL DEFAULT 0")
+            db.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open Markdown cache: {e}")
+            db = None
+        self._db, self._pid = db, os.getpid()
+        return db
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the HTML stored under key, or None."""
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT html, used FROM html WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] < self.session:
+                    with db:
+                        db.execute(
+                            "UPDATE html SET used = ? WHERE key = ?",
+                            (self.session, key),
+                        )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read Markdown cache: {e}")
+                return None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, html: str) -> None:
+        """Store the HTML converted for key."""
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO html VALUES (?, ?, ?)",
+                        (key, html, self.session),
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write Markdown cache: {e}")
+
+    def prune(self, session: float) -> int:
+        """
+        Delete the entries not used since a session started.
+
+        Only call after every page was converted or served from the cache
+        in that session, or entries still in use would be lost.
+
+        Args:
+            session: Timestamp returned by begin_session().
+
+        Returns:
+            Number of entries deleted.
+        """
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return 0
+            try:
+                with db:
+                    return db.execute(
+                        "DELETE FROM html WHERE used < ?", (session,)
+                    ).rowcount
+            except sqlite3.Error as e:
+                logger.warning(f"Could not prune Markdown cache: {e}")
+                return 0
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            db = self._connect()
+            if db is not None:
+                with db:
+                    db.execute("DELETE FROM html")
+
+
+_html_cache: Optional[MarkdownHtmlCache] = None
+_engine_name = DEFAULT_ENGINE
+_local = threading.local()
+
+
+def set_markdown_engine(name: str) -> None:
+    """
+    Select the engine used by markdown_to_html() in this process.
+
+    The engine is created right away, so that a missing or incomplete
+    engine fails here rather than on the first page rendered.
+
+    Args:
+        name: A key of MARKDOWN_ENGINES.
+
+    Raises:
+        ValueError: If the engine is unknown or not installed.
+        TypeError: If the engine does not implement convert().
+    """
+    global _engine_name
+    if name not in MARKDOWN_ENGINES:
+        raise ValueError(
+            f"Unknown Markdown engine {name!r}; "
+            f"expected one of {tuple(MARKDOWN_ENGINES)}"
+        )
+    _converter(name, DEFAULT_EXTENSIONS)
+    _engine_name = name
+
+
+def get_markdown_engine() -> str:
+    """Return the name of the engine used in this process."""
+    return _engine_name
+
+
+def set_html_cache(path: Optional[Path]) -> Optional[MarkdownHtmlCache]:
+    """
+    Enable the persistent HTML cache for this process.
+
+    Args:
+        path: Database file, or None to disable the cache.
+
+    Returns:
+        The cache in use, or None.
+    """
+    global _html_cache
+    if path is None:
+        _html_cache = None
+    elif _html_cache is None or _html_cache.path != Path(path):
+        _html_cache = MarkdownHtmlCache(path)
+    return _html_cache
+
+
+def get_html_cache() -> Optional[MarkdownHtmlCache]:
+    """Return the persistent HTML cache of this process, if enabled."""
+    return _html_cache
+
+
+def _converter(name: str, extensions: Tuple[str, ...]) -> MarkdownEngine:
+    """Return this thread's engine instance for an extension list."""
+    converters: Optional[Dict[Tuple[str, Tuple[str, ...]], MarkdownEngine]] = getattr(
+        _local, "converters", None
+    )
+    if converters is None:
+        converters = _local.converters = {}
+    engine = converters.get((name, extensions))
+    if engine is None:
+        engine = MARKDOWN_ENGINES[name](extensions)
+        converters[(name, extensions)] = engine
+    return engine
+
+
+def markdown_to_html(
+    text: str,
+    extensions: Sequence[str] = DEFAULT_EXTENSIONS,
+    engine: Optional[str] = None,
+) -> str:
+    """
+    Convert Markdown text to HTML.
+
+    With python-markdown, same output as
+    markdown.markdown(text, extensions=extensions).
+
+    Args:
+        text: Markdown formatted string.
+        extensions: Markdown extensions to use.
+        engine: Engine name. Default: the one set by set_markdown_engine().
+
+    Returns:
+        HTML string.
+    """
+    converter = _converter(engine or _engine_name, tuple(extensions))
+    cache = _html_cache
+    key = None
+    if cache is not None:
+        key = cache.make_key(text, converter.cache_tag)
+        html = cache.get(key)
+        if html is not None:
+            return html
+
+    html = converter.convert(text)
+    if cache is not None and key is not None:
+        cache.put(key, html)
+    return html
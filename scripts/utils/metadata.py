@@ -7,16 +7,29 @@ from .errors import MetadataParsingError
 from .metadata_schema import ContentMetadata
 
 
+def _validate(metadata: Dict[str, Any]) -> dict:
+    # Ensure plain dict with str keys for model init
+    metadata_dict: Dict[str, Any] = dict(metadata)
+    validated = ContentMetadata(**metadata_dict)  # type: ignore[arg-type]
+    return validated.dict()
+
+
+def validate_extracted_metadata(metadata: Dict[str, Any]) -> dict:
+    """Valide des métadonnées déjà extraites (ex. depuis l'index de contenu)."""
+    try:
+        return _validate(metadata)
+    except Exception as e:
+        logging.error(f"Erreur générale lors de l'extraction des métadonnées: {e}")
+        raise MetadataParsingError(str(e))
+
+
 def extract_metadata(content: str) -> dict:
     """Extrait les métadonnées d'un contenu Markdown via le parseur centralisé."""
     try:
         from utils.frontmatter_parser import parse_frontmatter
 
         metadata, _ = parse_frontmatter(content)
-        # Ensure plain dict with str keys for model init
-        metadata_dict: Dict[str, Any] = dict(metadata)
-        validated = ContentMetadata(**metadata_dict)  # type: ignore[arg-type]
-        return validated.dict()
+        return _validate(metadata)
     except yaml.YAMLError as e:
         logging.error(f"Erreur YAML lors de l'extraction des métadonnées: {e}")
         raise MetadataParsingError(str(e))
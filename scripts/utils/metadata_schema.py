@@ -87,6 +87,16 @@ class ContentMetadata(BaseModel):
 
         return v
 
+    @field_validator("translation_id", mode="before")
+    @classmethod
+    def validate_translation_id(cls, v: Any) -> Optional[str]:
+        """Accept numeric ids (`translation_id: 1`); builders compare strings."""
+        if v is None or v == "":
+            return None
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            return str(v)
+        return v
+
     @field_validator("template", mode="before")
     @classmethod
     def validate_template(cls, v: Any) -> Optional[str]:
@@ -15,12 +15,14 @@ from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Union
 
 import frontmatter
-import markdown
-from babel.dates import format_date
 from jinja2 import Environment
 from unidecode import unidecode
 
-from .constants import DATE_FORMAT_PATTERNS, DEFAULT_DATE_FORMAT, DEFAULT_LOCALE
+from .constants import DEFAULT_DATE_FORMAT, DEFAULT_LOCALE
+from .date_formatter import get_date_formatter
+from .markdown_renderer import markdown_to_html
+
+_date_formatter = get_date_formatter()
 
 
 def markdown_filter(text: str) -> str:
@@ -37,7 +39,7 @@ def markdown_filter(text: str) -> str:
         >>> markdown_filter("# Hello World")
         '<h1>Hello World</h1>'
     """
-    return markdown.markdown(text, extensions=["meta"])
+    return markdown_to_html(text, ["meta"])
 
 
 def build_page(
@@ -53,6 +55,7 @@ def build_page(
     jinja_env: Environment,
     content_translations: Optional[Dict[str, str]] = None,
     pagination: Optional[Dict[str, Any]] = None,
+    processed: Optional[Any] = None,
 ) -> str:
     """
     Generate an HTML page using a Jinja2 template.
@@ -77,6 +80,8 @@ def build_page(
         jinja_env: Configured Jinja2 Environment instance.
         content_translations: Optional mapping of language codes to translated URLs.
         pagination: Optional pagination data for list pages.
+        processed: Optional ProcessedContent already parsed from content
+            (e.g. by the ContentIndex); skips parsing when provided.
 
     Returns:
         Rendered HTML string.
@@ -89,8 +94,8 @@ def build_page(
     from core.metadata_processor import MetadataProcessor
 
     # Process content
-    processor = ContentProcessor()
-    processed = processor.parse(content)
+    if processed is None:
+        processed = ContentProcessor().parse(content)
 
     # Process metadata
     meta_processor = MetadataProcessor()
@@ -146,6 +151,10 @@ def format_date_filter(
     """
     Format a date using Babel for internationalization.
 
+    Registered as the Jinja `date` filter. Delegates to the process's
+    DateFormatter (utils/date_formatter.py), which caches locales and
+    patterns and memoizes results.
+
     Args:
         value: Date to format. Can be a string in 'YYYY-MM-DD' format,
                a datetime object, or a date object.
@@ -168,18 +177,7 @@ def format_date_filter(
         >>> format_date_filter(date(2025, 11, 25), "short", "en_US")
         '11/25/25'
     """
-    dt: date
-    if isinstance(value, str):
-        dt = datetime.strptime(value, "%Y-%m-%d").date()
-    elif isinstance(value, datetime):
-        dt = value.date()
-    elif isinstance(value, date):
-        dt = value
-    else:
-        raise ValueError(f"Unrecognized date type: {type(value)}")
-
-    pattern = DATE_FORMAT_PATTERNS.get(fmt, DATE_FORMAT_PATTERNS[DEFAULT_DATE_FORMAT])
-    return format_date(dt, format=pattern, locale=lang)
+    return _date_formatter.format(value, fmt, lang)
 
 
 def slugify(value: str) -> str:
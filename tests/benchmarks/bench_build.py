@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+"""
+End-to-end build benchmark on synthetic sites.
+
+For each size, generates a site (tests/benchmarks/site_generator.py) and
+runs SiteBuilder.build() on it twice, each time in a fresh process:
+"cold" starts without dist/ or caches, "warm" rebuilds with the caches
+of the cold run and no source change. Each run records its throughput
+(pages/s), peak RSS and the --profile phase timings.
+
+Results can be saved as a baseline; later runs are compared with it and
+exit with status 1 when a size got slower or bigger than the threshold
+allows. Phase timings are reported for information only.
+
+Usage:
+    python tests/benchmarks/bench_build.py --sizes 1000 10000 100000
+    python tests/benchmarks/bench_build.py --save-baseline
+    python tests/benchmarks/bench_build.py --threshold 0.25
+"""
+
+import argparse
+import json
+import logging
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+repo_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(repo_root / "scripts"))
+sys.path.insert(0, str(repo_root))
+
+from tests.benchmarks.site_generator import SiteSpec, generate_site  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_WORKDIR = Path(tempfile.gettempdir()) / "idoine-bench"
+RESULTS_VERSION = "1"
+MODES = ("cold", "warm")
+
+
+def _peak_rss_mb(children: bool = False) -> Optional[float]:
+    """Peak resident set size in MiB of this process or its largest child."""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    # KiB on Linux, bytes on macOS
+    peak = resource.getrusage(who).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return round(peak / 1024, 1)
+
+
+def run_build(site: Path, jobs: int) -> Dict[str, Any]:
+    """
+    Build a site in this process and measure it.
+
+    Args:
+        site: Project directory from generate_site().
+        jobs: Render worker processes.
+
+    Returns:
+        pages, seconds, pages_per_s, peak RSS of this process and of its
+        largest worker, and the wall time of each phase.
+
+    Raises:
+        RuntimeError: If the build fails.
+    """
+    from core.build import SiteBuilder
+
+    start = time.perf_counter()
+    builder = SiteBuilder(jobs=jobs, profile=True, base_path=site)
+    if not builder.build():
+        raise RuntimeError(f"Build of {site} failed")
+    seconds = time.perf_counter() - start
+
+    stats = builder.output_store.stats
+    pages = stats.written + stats.unchanged
+    phases = builder.profiler.report()["phases"]
+    return {
+        "pages": pages,
+        "seconds": round(seconds, 3),
+        "pages_per_s": round(pages / seconds, 1),
+        "peak_rss_mb": _peak_rss_mb(),
+        "workers_peak_rss_mb": _peak_rss_mb(children=True),
+        "phases": {phase["name"]: round(phase["wall_s"], 3) for phase in phases},
+    }
+
+
+def measure(spec: SiteSpec, workdir: Path, jobs: int = 1) -> List[Dict[str, Any]]:
+    """
+    Generate a site and time its cold and warm builds in child processes.
+
+    Args:
+        spec: Site size.
+        workdir: Directory keeping generated sites between runs.
+        jobs: Render worker processes.
+
+    Returns:
+        One result per mode, with the spec included.
+
+    Raises:
+        RuntimeError: If a build fails.
+    """
+    start = time.perf_counter()
+    site = generate_site(workdir / spec.name, spec)
+    logger.info(f"Site {spec.name} ready in {time.perf_counter() - start:.1f}s")
+
+    for stale in (site / "dist", site / ".idoine_cache"):
+        shutil.rmtree(stale, ignore_errors=True)
+    results = []
+    for mode in MODES:
+        child = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                str(site),
+                "--jobs",
+                str(jobs),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if child.returncode != 0:
+            raise RuntimeError(f"{mode} build of {spec.name} failed:\n{child.stderr}")
+        result = json.loads(child.stdout.splitlines()[-1])
+        results.append({**asdict(spec), "mode": mode, "jobs": jobs, **result})
+        logger.info(
+            f"{spec.name} {mode}: {result['pages']} pages in {result['seconds']}s "
+            f"({result['pages_per_s']} pages/s, peak RSS {result['peak_rss_mb']} MiB)"
+        )
+    return results
+
+
+def _key(result: Dict[str, Any]) -> tuple:
+    return (
+        result["posts"],
+        result["languages"],
+        result["terms"],
+        result["images"],
+        result["seed"],
+        result["mode"],
+        result["jobs"],
+    )
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results: Results of this run.
+        baseline: Results of the baseline run.
+        threshold: Allowed relative loss, e.g. 0.2 for 20%.
+
+    Returns:
+        One message per regression: throughput below (1 - threshold) times
+        the baseline, or peak RSS above (1 + threshold) times it. Sizes
+        missing from the baseline are not compared.
+    """
+    previous = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        base = previous.get(_key(result))
+        if base is None:
+            continue
+        label = f"{result['posts']} posts {result['mode']}"
+        if result["pages_per_s"] < base["pages_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{label}: {result['pages_per_s']} pages/s "
+                f"(baseline {base['pages_per_s']})"
+            )
+        rss, base_rss = result.get("peak_rss_mb"), base.get("peak_rss_mb")
+        if rss is not None and base_rss and rss > base_rss * (1 + threshold):
+            regressions.append(f"{label}: peak RSS {rss} MiB (baseline {base_rss})")
+        for name, seconds in result["phases"].items():
+            before = base["phases"].get(name)
+            if before is not None:
+                logger.info(f"{label} {name}: {before:.3f}s -> {seconds:.3f}s")
+    return regressions
+
+
+def load_results(path: Path) -> List[Dict[str, Any]]:
+    """Load results written by save_results(); empty if missing or outdated."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+    if data.get("version") != RESULTS_VERSION:
+        logger.warning(f"Ignoring {path}: results version mismatch")
+        return []
+    return data["results"]
+
+
+def save_results(path: Path, results: List[Dict[str, Any]]) -> None:
+    """Write results with the machine they were measured on."""
+    data = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    Path(path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    """Run the benchmark; return the exit status."""
+    parser = argparse.ArgumentParser(prog=prog, description="IDOINE build benchmark")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        metavar="N",
+        help="Posts per language for each run (default: 1000 10000 100000)",
+    )
+    parser.add_argument("--languages", type=int, default=2, help="Languages (M)")
+    parser.add_argument(
+        "--terms", type=int, default=100, help="Glossary terms per language (K)"
+    )
+    parser.add_argument("--images", type=int, default=20, help="Gallery images (G)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Render workers")
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=DEFAULT_WORKDIR,
+        help=f"Where generated sites are kept (default: {DEFAULT_WORKDIR})",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline results file (default: tests/benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store this run as the baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Also write this run's results to a file"
+    )
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        logging.basicConfig(level=logging.WARNING)
+        print(json.dumps(run_build(args.child, args.jobs)))
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    results = []
+    for size in args.sizes:
+        spec = SiteSpec(
+            posts=size,
+            languages=args.languages,
+            terms=args.terms,
+            images=args.images,
+            seed=args.seed,
+        )
+        results.extend(measure(spec, args.workdir, args.jobs))
+
+    if args.output is not None:
+        save_results(args.output, results)
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        logger.info(f"Baseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare(results, load_results(args.baseline), args.threshold)
+    for message in regressions:
+        logger.error(f"Regression: {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+"""
+Micro-benchmarks for the per-item hot paths of a build.
+
+Each benchmark calls one function over a fixed corpus drawn from
+tests/fixtures/sample_content (titles, taxonomies, dates, frontmatter,
+Markdown bodies), cycling through it:
+
+    slugify, format_date_filter, markdown_filter, build_page,
+    parse_frontmatter, MetadataProcessor.process, validate_path_within_base
+
+Throughput is the best of several timed rounds, in calls per second.
+Allocation is the peak memory traced by tracemalloc during one call,
+averaged over the corpus, in KiB. Results are compared with a baseline
+like the build benchmark's (bench_build.py); a benchmark fails when it
+is slower, or allocates more, than its threshold allows.
+
+Usage:
+    python tests/benchmarks/micro_bench.py --save-baseline
+    python tests/benchmarks/micro_bench.py
+    python tests/benchmarks/micro_bench.py --only slugify build_page --threshold 0.1
+"""
+
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+repo_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(repo_root / "scripts"))
+sys.path.insert(0, str(repo_root))
+
+import frontmatter  # noqa: E402
+import yaml  # noqa: E402
+
+from tests.benchmarks.bench_build import load_results, save_results  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_CONTENT = repo_root / "tests" / "fixtures" / "sample_content"
+DEFAULT_BASELINE = Path(__file__).parent / "micro_baseline.json"
+DEFAULT_THRESHOLD = 0.2
+# Benchmarks whose timings vary more from run to run
+THRESHOLDS = {
+    "build_page": 0.3,
+    "markdown_filter": 0.3,
+}
+
+
+class Corpus:
+    """Inputs of the micro-benchmarks, read once from the fixtures."""
+
+    def __init__(self, content_dir: Path = SAMPLE_CONTENT):
+        """
+        Initialize the Corpus.
+
+        Args:
+            content_dir: Directory of Markdown documents with frontmatter.
+        """
+        self.paths = sorted(content_dir.glob("*.md"))
+        self.raw = [p.read_text(encoding="utf-8") for p in self.paths]
+        posts = [frontmatter.loads(text) for text in self.raw]
+        self.metadata = [dict(post.metadata) for post in posts]
+        self.bodies = [post.content for post in posts]
+        self.content_dir = content_dir
+
+        words = []
+        for metadata, body in zip(self.metadata, self.bodies):
+            words.append(str(metadata.get("title", "")))
+            for key in ("categories", "tags", "meta_keywords"):
+                words.extend(str(value) for value in metadata.get(key) or [])
+            words.extend(
+                line.lstrip("#").strip()
+                for line in body.splitlines()
+                if line.startswith("#")
+            )
+        self.slug_sources = [word for word in words if word]
+
+        # The shapes templates use: ISO strings, dates, explicit locales,
+        # and strftime-like formats that fall back to "long"
+        days = [str(m["date"]) for m in self.metadata if "date" in m]
+        days += ["2018-08-07", "2021-02-28", "2024-12-31"]
+        self.dates = []
+        for day in days:
+            self.dates.append((day, "long", "fr_FR"))
+            self.dates.append((day, "%Y-%m-%d", "fr_FR"))
+            self.dates.append((date.fromisoformat(day), "long", "en"))
+            self.dates.append((day, "short", "fr"))
+
+        self.relative_paths = [p.name for p in self.paths] + [
+            f"nested/../{p.name}" for p in self.paths
+        ]
+
+
+def _build_page_benchmark(corpus: Corpus) -> Callable[[int], Any]:
+    from core.template_renderer import create_jinja_environment
+    from utils.utils import build_page
+
+    src = repo_root / "src"
+    with open(src / "config" / "site_config.yaml", encoding="utf-8") as f:
+        site_config = yaml.safe_load(f)
+    with open(src / "data" / "translations.yaml", encoding="utf-8") as f:
+        translations = yaml.safe_load(f)["fr"]
+    env = create_jinja_environment(src / "templates", False)
+    documents = [
+        (raw, metadata.get("slug", path.stem))
+        for raw, metadata, path in zip(corpus.raw, corpus.metadata, corpus.paths)
+    ]
+
+    def run(i: int) -> str:
+        raw, slug = documents[i % len(documents)]
+        return build_page(
+            raw,
+            "posts/post.html",
+            "fr",
+            custom_url=None,
+            is_post=True,
+            slug=slug,
+            translations=translations,
+            site_config=site_config,
+            projects={},
+            jinja_env=env,
+        )
+
+    return run
+
+
+def make_benchmarks(corpus: Corpus) -> Dict[str, Callable[[int], Any]]:
+    """Return each benchmark as a function of the call index."""
+    from core.metadata_processor import MetadataProcessor
+    from utils.frontmatter_parser import parse_frontmatter
+    from utils.path_validator import validate_path_within_base
+    from utils.utils import format_date_filter, markdown_filter, slugify
+
+    processor = MetadataProcessor()
+    sources, dates = corpus.slug_sources, corpus.dates
+    bodies, raw, metadata = corpus.bodies, corpus.raw, corpus.metadata
+    paths, base = corpus.relative_paths, corpus.content_dir
+    return {
+        "slugify": lambda i: slugify(sources[i % len(sources)]),
+        "format_date_filter": lambda i: format_date_filter(*dates[i % len(dates)]),
+        "markdown_filter": lambda i: markdown_filter(bodies[i % len(bodies)]),
+        "build_page": _build_page_benchmark(corpus),
+        "parse_frontmatter": lambda i: parse_frontmatter(raw[i % len(raw)]),
+        "MetadataProcessor.process": lambda i: processor.process(
+            metadata[i % len(metadata)]
+        ),
+        "validate_path_within_base": lambda i: validate_path_within_base(
+            paths[i % len(paths)], base
+        ),
+    }
+
+
+def time_calls(func: Callable[[int], Any], min_time: float, rounds: int) -> float:
+    """
+    Measure throughput.
+
+    Args:
+        func: Benchmark, called with increasing indexes.
+        min_time: Minimum duration of one round, in seconds.
+        rounds: Timed rounds; the fastest one counts.
+
+    Returns:
+        Calls per second.
+    """
+    func(0)  # Warm-up: imports, caches, compiled templates
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(calls):
+            func(i)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for i in range(calls):
+            func(i)
+        best = min(best, time.perf_counter() - start)
+    return calls / best
+
+
+def allocated_kib(func: Callable[[int], Any], calls: int) -> float:
+    """Return the mean peak memory traced during one call, in KiB."""
+    func(0)
+    total = 0
+    tracemalloc.start()
+    try:
+        for i in range(calls):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            func(i)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / calls / 1024
+
+
+def run(
+    only: Optional[List[str]] = None,
+    min_time: float = 0.2,
+    rounds: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    Run the micro-benchmarks.
+
+    Args:
+        only: Names of the benchmarks to run. Default: all.
+        min_time: Minimum duration of one timed round, in seconds.
+        rounds: Timed rounds per benchmark.
+
+    Returns:
+        One result per benchmark: name, ops_per_s, alloc_kib_per_call.
+
+    Raises:
+        ValueError: If a requested benchmark does not exist.
+    """
+    corpus = Corpus()
+    benchmarks = make_benchmarks(corpus)
+    unknown = set(only or ()) - set(benchmarks)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    results = []
+    for name, func in benchmarks.items():
+        if only and name not in only:
+            continue
+        ops = time_calls(func, min_time, rounds)
+        # At least one pass over every input the benchmark cycles through
+        calls = max(len(corpus.slug_sources), len(corpus.dates))
+        alloc = allocated_kib(func, calls)
+        results.append(
+            {
+                "name": name,
+                "ops_per_s": round(ops, 1),
+                "alloc_kib_per_call": round(alloc, 2),
+            }
+        )
+        logger.info(f"{name:<28} {ops:>12,.0f} ops/s {alloc:>10.2f} KiB/call")
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: Optional[float] = None,
+) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results: Results of this run.
+        baseline: Results of the baseline run.
+        threshold: Allowed relative loss for every benchmark. Default:
+            THRESHOLDS, else DEFAULT_THRESHOLD.
+
+    Returns:
+        One message per benchmark below (1 - threshold) times its baseline
+        throughput, or above (1 + threshold) times its allocation.
+    """
+    previous = {result["name"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        base = previous.get(result["name"])
+        if base is None:
+            continue
+        name = result["name"]
+        allowed = threshold
+        if allowed is None:
+            allowed = THRESHOLDS.get(name, DEFAULT_THRESHOLD)
+        if result["ops_per_s"] < base["ops_per_s"] * (1 - allowed):
+            regressions.append(
+                f"{name}: {result['ops_per_s']} ops/s (baseline {base['ops_per_s']})"
+            )
+        alloc, base_alloc = result["alloc_kib_per_call"], base["alloc_kib_per_call"]
+        # Sub-KiB figures are dominated by noise from caches and interning
+        if alloc > 1 and alloc > base_alloc * (1 + allowed):
+            regressions.append(f"{name}: {alloc} KiB/call (baseline {base_alloc})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> int:
+    """Run the micro-benchmarks; return the exit status."""
+    parser = argparse.ArgumentParser(prog=prog, description="IDOINE micro-benchmarks")
+    parser.add_argument(
+        "--only", nargs="+", metavar="NAME", help="Benchmarks to run (default: all)"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum duration of a timed round, in seconds (default: 0.2)",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Timed rounds (default: 5)"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline file (default: tests/benchmarks/micro_baseline.json)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store this run as the baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help="Allowed relative regression for every benchmark "
+        f"(default: {DEFAULT_THRESHOLD}, more for the noisier ones)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    results = run(args.only, args.min_time, args.rounds)
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        logger.info(f"Baseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare(results, load_results(args.baseline), args.threshold)
+    for message in regressions:
+        logger.error(f"Regression: {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
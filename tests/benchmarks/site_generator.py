@@ -0,0 +1,222 @@
+"""
+Synthetic site generator for the build benchmarks.
+
+Creates a complete project (src/ with config, data, templates and
+content) of a chosen size: N posts in each of M languages, linked by
+translation_id, K glossary terms per language and G gallery images.
+Frontmatter follows the real content: dates, summaries, categories,
+tags and meta_keywords drawn from fixed vocabularies, so taxonomy pages
+and pagination grow like they would on a real site. Templates, data and
+the standard pages are copied from the repository's src/.
+
+Generation is deterministic for a given SiteSpec and seed.
+"""
+
+import json
+import random
+import shutil
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+import yaml
+
+REPO_SRC = Path(__file__).resolve().parent.parent.parent / "src"
+
+# Written at the root of a generated site; a matching spec is reused
+SPEC_FILE = "bench_site.json"
+
+LANGUAGES = ("fr", "en", "de", "es", "it", "pt", "nl", "pl")
+
+_WORDS = (
+    "aventure campagne dé dragon donjon épée forêt guilde héros intrigue "
+    "joueur magie maître monstre partie personnage quête règle rôle scène "
+    "session table taverne trésor univers voyage alliance ombre destin "
+    "chronique légende royaume mystère combat énigme carte ville ruine"
+).split()
+_CATEGORIES = [f"Catégorie {i}" for i in range(1, 13)]
+_TAGS = [f"tag {word}" for word in _WORDS[:30]]
+_KEYWORDS = [f"mot-clé {word}" for word in _WORDS[10:35]]
+
+
+@dataclass(frozen=True)
+class SiteSpec:
+    """Size of a synthetic site."""
+
+    posts: int
+    languages: int = 2
+    terms: int = 100
+    images: int = 20
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        """Directory name identifying the spec."""
+        return (
+            f"p{self.posts}-l{self.languages}-t{self.terms}"
+            f"-g{self.images}-s{self.seed}"
+        )
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    sentences = rng.randint(3, 6)
+    return " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(sentences))
+
+
+def _body(rng: random.Random, title: str) -> str:
+    """A Markdown body with headings, emphasis, links and a list."""
+    parts = [f"# {title}", _paragraph(rng)]
+    for section in range(rng.randint(2, 4)):
+        parts.append(f"## {_sentence(rng, 4)[:-1]}")
+        parts.append(_paragraph(rng))
+        if section == 0:
+            parts.append("\n".join(f"- {_sentence(rng, 5)}" for _ in range(4)))
+        parts.append(
+            f"Voir *{rng.choice(_WORDS)}* et **{rng.choice(_WORDS)}**, "
+            f"ou [{rng.choice(_WORDS)}](/blog/{rng.choice(_WORDS)}/)."
+        )
+    return "\n\n".join(parts) + "\n"
+
+
+def _document(metadata: dict, body: str) -> str:
+    header = yaml.safe_dump(metadata, allow_unicode=True, sort_keys=True)
+    return f"---\n{header}---\n\n{body}"
+
+
+def _write_config(src: Path, languages: List[str]) -> None:
+    with open(REPO_SRC / "config" / "site_config.yaml", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    config["languages"] = languages
+    config["default_lang"] = languages[0]
+    config["language_names"] = {lang: lang.upper() for lang in languages}
+    (src / "config").mkdir(parents=True)
+    with open(src / "config" / "site_config.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(config, f, allow_unicode=True, sort_keys=False)
+
+    with open(REPO_SRC / "data" / "translations.yaml", encoding="utf-8") as f:
+        translations = yaml.safe_load(f)
+    reference = translations["fr"]
+    (src / "data").mkdir(parents=True)
+    with open(src / "data" / "translations.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(
+            {lang: translations.get(lang, reference) for lang in languages},
+            f,
+            allow_unicode=True,
+        )
+    shutil.copy2(REPO_SRC / "data" / "projects.yaml", src / "data" / "projects.yaml")
+
+
+def _write_posts(src: Path, spec: SiteSpec, languages: List[str]) -> None:
+    rng = random.Random(spec.seed)
+    first_day = date(2015, 1, 1)
+    for lang in languages:
+        (src / "locales" / lang / "posts").mkdir(parents=True)
+    for i in range(spec.posts):
+        title = _sentence(rng, rng.randint(3, 8))[:-1]
+        summary = _sentence(rng, 20)
+        metadata = {
+            "date": (first_day + timedelta(days=rng.randrange(4000))).isoformat(),
+            "summary": summary,
+            "description": summary,
+            "categories": rng.sample(_CATEGORIES, rng.randint(1, 2)),
+            "tags": rng.sample(_TAGS, rng.randint(1, 4)),
+            "meta_keywords": rng.sample(_KEYWORDS, rng.randint(1, 3)),
+            "translation_id": f"post-{i}",
+        }
+        body = _body(rng, title)
+        for lang in languages:
+            slug = f"{lang}-post-{i}"
+            (src / "locales" / lang / "posts" / f"{slug}.md").write_text(
+                _document(
+                    {**metadata, "title": f"{title} ({lang})", "slug": slug}, body
+                ),
+                encoding="utf-8",
+            )
+
+
+def _write_terms(src: Path, spec: SiteSpec, languages: List[str]) -> None:
+    rng = random.Random(spec.seed + 1)
+    for lang in languages:
+        terms_dir = src / "locales" / lang / "glossaire"
+        terms_dir.mkdir(parents=True)
+        for i in range(spec.terms):
+            title = f"Terme {i} {rng.choice(_WORDS)}"
+            metadata = {
+                "title": title,
+                "slug": f"terme-{i}",
+                "date": "2025-02-20",
+                "summary": _sentence(rng, 12),
+                "categories": rng.sample(_CATEGORIES, 1),
+                "tags": rng.sample(_TAGS, rng.randint(1, 2)),
+                "meta_keywords": rng.sample(_KEYWORDS, 1),
+            }
+            (terms_dir / f"terme-{i}.md").write_text(
+                _document(metadata, _body(rng, title)), encoding="utf-8"
+            )
+
+
+def _write_pages(src: Path, languages: List[str]) -> None:
+    for lang in languages:
+        pages_dir = src / "locales" / lang / "pages"
+        shutil.copytree(REPO_SRC / "locales" / "fr" / "pages", pages_dir)
+
+
+def _write_images(src: Path, spec: SiteSpec) -> None:
+    from PIL import Image
+
+    rng = random.Random(spec.seed + 2)
+    gallery = src / "assets" / "gallery_images"
+    gallery.mkdir(parents=True)
+    for i in range(spec.images):
+        color = tuple(rng.randrange(256) for _ in range(3))
+        image = Image.new("RGB", (1600, 1200), color)
+        # A gradient band, so that encoders have some detail to work on
+        for x in range(0, 1600, 8):
+            image.paste((x % 256, color[1], 255 - x % 256), (x, 0, x + 4, 1200))
+        image.save(gallery / f"image-{i:04d}.jpg", quality=85)
+
+
+def generate_site(root: Path, spec: SiteSpec) -> Path:
+    """
+    Create a synthetic project under root, or reuse it if already there.
+
+    Args:
+        root: Project directory; src/ is created inside it.
+        spec: Site size.
+
+    Returns:
+        The project directory (to pass as SiteBuilder(base_path=...)).
+
+    Raises:
+        ValueError: If the spec asks for more languages than available.
+    """
+    root = Path(root)
+    if not 1 <= spec.languages <= len(LANGUAGES):
+        raise ValueError(f"languages must be between 1 and {len(LANGUAGES)}")
+    marker = root / SPEC_FILE
+    if marker.exists():
+        try:
+            if json.loads(marker.read_text(encoding="utf-8")) == asdict(spec):
+                return root
+        except ValueError:
+            pass
+    if root.exists():
+        shutil.rmtree(root)
+
+    src = root / "src"
+    languages = list(LANGUAGES[: spec.languages])
+    src.mkdir(parents=True)
+    shutil.copytree(REPO_SRC / "templates", src / "templates")
+    _write_config(src, languages)
+    _write_pages(src, languages)
+    _write_posts(src, spec, languages)
+    _write_terms(src, spec, languages)
+    _write_images(src, spec)
+    marker.write_text(json.dumps(asdict(spec)), encoding="utf-8")
+    return root
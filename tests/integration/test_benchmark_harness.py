@@ -0,0 +1,154 @@
+"""
+Integration tests for the synthetic-site build benchmark.
+"""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import frontmatter
+import pytest
+
+from tests.benchmarks import micro_bench
+from tests.benchmarks.bench_build import compare, load_results, measure, save_results
+from tests.benchmarks.site_generator import SiteSpec, generate_site
+
+SPEC = SiteSpec(posts=4, languages=2, terms=2, images=1)
+
+
+class TestSiteGenerator:
+    """Tests for generate_site()."""
+
+    def test_generates_requested_sizes(self, tmp_path: Path):
+        """Test the number of posts, terms and images per language."""
+        root = generate_site(tmp_path / "site", SPEC)
+        src = root / "src"
+        for lang in ("fr", "en"):
+            assert len(list((src / "locales" / lang / "posts").glob("*.md"))) == 4
+            assert len(list((src / "locales" / lang / "glossaire").glob("*.md"))) == 2
+            assert (src / "locales" / lang / "pages" / "home.md").exists()
+        assert len(list((src / "assets" / "gallery_images").iterdir())) == 1
+        assert (src / "templates" / "base.html").exists()
+
+    def test_posts_have_realistic_frontmatter(self, tmp_path: Path):
+        """Test that translations share a translation_id and taxonomies."""
+        src = generate_site(tmp_path / "site", SPEC) / "src" / "locales"
+        fr = frontmatter.load(src / "fr" / "posts" / "fr-post-1.md")
+        en = frontmatter.load(src / "en" / "posts" / "en-post-1.md")
+        assert fr["translation_id"] == en["translation_id"] == "post-1"
+        assert fr["categories"] == en["categories"]
+        assert fr["tags"] and fr["meta_keywords"] and fr["date"]
+        assert fr.content.startswith("# ")
+
+    def test_is_deterministic_and_reused(self, tmp_path: Path):
+        """Test that the same spec gives the same files and is not rewritten."""
+        first = generate_site(tmp_path / "a", SPEC) / "src" / "locales"
+        second = generate_site(tmp_path / "b", SPEC) / "src" / "locales"
+        post = Path("fr") / "posts" / "fr-post-3.md"
+        assert (first / post).read_bytes() == (second / post).read_bytes()
+
+        mtime = (first / post).stat().st_mtime_ns
+        generate_site(tmp_path / "a", SPEC)
+        assert (first / post).stat().st_mtime_ns == mtime
+
+    def test_rejects_unknown_languages(self, tmp_path: Path):
+        """Test that more languages than available is an error."""
+        with pytest.raises(ValueError):
+            generate_site(tmp_path / "site", SiteSpec(posts=1, languages=99))
+
+
+class TestBenchmark:
+    """Tests for the benchmark runner."""
+
+    def test_measure_cold_and_warm_builds(self, tmp_path: Path):
+        """Test an end-to-end run on a tiny site."""
+        results = measure(SPEC, tmp_path)
+
+        assert [r["mode"] for r in results] == ["cold", "warm"]
+        cold, warm = results
+        assert cold["pages"] == warm["pages"] > 2 * SPEC.posts
+        assert cold["pages_per_s"] > 0
+        assert "post_builder" in cold["phases"]
+        assert (tmp_path / SPEC.name / "dist" / "fr" / "index.html").exists()
+
+    def test_compare_flags_regressions(self, tmp_path: Path):
+        """Test the throughput and peak RSS thresholds."""
+        base = {
+            **asdict(SiteSpec(posts=10, terms=1, images=1)),
+            "mode": "cold",
+            "jobs": 1,
+            "pages_per_s": 100.0,
+            "peak_rss_mb": 100.0,
+            "phases": {"post_builder": 1.0},
+        }
+        save_results(tmp_path / "baseline.json", [base])
+        baseline = load_results(tmp_path / "baseline.json")
+
+        assert compare([{**base, "pages_per_s": 85.0}], baseline, 0.2) == []
+        slower = compare([{**base, "pages_per_s": 70.0}], baseline, 0.2)
+        bigger = compare([{**base, "peak_rss_mb": 130.0}], baseline, 0.2)
+        other_size = compare(
+            [{**base, "posts": 20, "pages_per_s": 1.0}], baseline, 0.2
+        )
+        assert len(slower) == 1 and "pages/s" in slower[0]
+        assert len(bigger) == 1 and "RSS" in bigger[0]
+        assert other_size == []
+
+    def test_missing_baseline(self, tmp_path: Path):
+        """Test that a missing baseline compares nothing."""
+        assert load_results(tmp_path / "missing.json") == []
+
+
+class TestMicroBenchmarks:
+    """Tests for the micro-benchmark suite."""
+
+    def test_corpus_comes_from_fixtures(self):
+        """Test that every input list is filled from sample_content."""
+        corpus = micro_bench.Corpus()
+        assert len(corpus.raw) == len(list(micro_bench.SAMPLE_CONTENT.glob("*.md")))
+        assert "Sample Blog Post" in corpus.slug_sources
+        assert ("2025-11-25", "long", "fr_FR") in corpus.dates
+
+    def test_every_benchmark_runs(self):
+        """Test that each benchmark handles its whole corpus."""
+        corpus = micro_bench.Corpus()
+        benchmarks = micro_bench.make_benchmarks(corpus)
+        assert set(benchmarks) == {
+            "slugify",
+            "format_date_filter",
+            "markdown_filter",
+            "build_page",
+            "parse_frontmatter",
+            "MetadataProcessor.process",
+            "validate_path_within_base",
+        }
+        for func in benchmarks.values():
+            for i in range(len(corpus.dates)):
+                func(i)
+
+    def test_run_reports_throughput_and_allocations(self):
+        """Test the result of a short run."""
+        results = micro_bench.run(["slugify"], min_time=0.01, rounds=1)
+        assert [r["name"] for r in results] == ["slugify"]
+        assert results[0]["ops_per_s"] > 0
+        assert results[0]["alloc_kib_per_call"] >= 0
+
+    def test_run_rejects_unknown_benchmark(self):
+        """Test that a misspelled name is an error."""
+        with pytest.raises(ValueError):
+            micro_bench.run(["slugfy"])
+
+    def test_compare_uses_thresholds(self):
+        """Test the default, per-benchmark and explicit thresholds."""
+        baseline = [
+            {"name": "slugify", "ops_per_s": 100.0, "alloc_kib_per_call": 10.0},
+            {"name": "build_page", "ops_per_s": 100.0, "alloc_kib_per_call": 10.0},
+        ]
+        results = [
+            {"name": "slugify", "ops_per_s": 75.0, "alloc_kib_per_call": 10.0},
+            {"name": "build_page", "ops_per_s": 75.0, "alloc_kib_per_call": 14.0},
+        ]
+        regressions = micro_bench.compare(results, baseline)
+        assert len(regressions) == 2
+        assert regressions[0].startswith("slugify:")
+        assert "KiB/call" in regressions[1]
+        assert micro_bench.compare(results, baseline, threshold=0.5) == []
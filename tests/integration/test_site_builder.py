@@ -0,0 +1,73 @@
+"""
+Integration tests for SiteBuilder on a synthetic site.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.build import SiteBuilder
+from tests.benchmarks.site_generator import SiteSpec, generate_site
+
+SPEC = SiteSpec(posts=2, languages=1, terms=1, images=1)
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Path:
+    """A tiny generated project."""
+    return generate_site(tmp_path / "site", SPEC)
+
+
+class TestSourceScan:
+    """Tests that the source scan decides what a full build re-reads."""
+
+    def test_warm_full_build_invalidates_scanned_changes(
+        self, site: Path, monkeypatch
+    ):
+        """Test that a second full build only forgets the files that changed."""
+        builder = SiteBuilder(base_path=site)
+        assert builder.build()
+
+        post = (site / "src" / "locales" / "fr" / "posts" / "fr-post-0.md").absolute()
+        post.write_text(
+            post.read_text(encoding="utf-8") + "\nParagraphe ajouté.\n",
+            encoding="utf-8",
+        )
+        invalidated = []
+
+        def no_clear():
+            raise AssertionError("content index cleared")
+
+        monkeypatch.setattr(builder.content_index, "clear", no_clear)
+        invalidate = builder.content_index.invalidate
+
+        def recording_invalidate(path):
+            invalidated.append(path)
+            invalidate(path)
+
+        monkeypatch.setattr(builder.content_index, "invalidate", recording_invalidate)
+        assert builder.build()
+
+        assert invalidated == [post]
+        assert any(
+            "Paragraphe ajouté." in page.read_text(encoding="utf-8")
+            for page in (site / "dist").rglob("index.html")
+        )
+
+    def test_assets_are_not_scanned(self, site: Path, monkeypatch):
+        """Test that the scan leaves src/assets to the static file manager."""
+        builder = SiteBuilder(base_path=site)
+        roots = []
+        scan = builder.file_cache.scan
+
+        def recording_scan(paths, *args, **kwargs):
+            paths = list(paths)
+            roots.extend(paths)
+            return scan(paths, *args, **kwargs)
+
+        monkeypatch.setattr(builder.file_cache, "scan", recording_scan)
+        assert builder.build()
+
+        src = site / "src"
+        assert src / "locales" in roots
+        assert all(src / "assets" not in [root, *root.parents] for root in roots)
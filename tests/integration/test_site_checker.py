@@ -0,0 +1,17 @@
+"""
+Integration tests for the source checks on the site's own sources.
+"""
+
+from pathlib import Path
+
+from core.site_checker import check_site
+
+SRC_DIR = Path(__file__).parent.parent.parent / "src"
+
+
+class TestSiteSources:
+    """Tests that `npm run check` passes on the shipped content."""
+
+    def test_site_sources_have_no_problem(self):
+        """Test that src/ passes every check."""
+        assert check_site(SRC_DIR) == []
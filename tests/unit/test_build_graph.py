@@ -0,0 +1,239 @@
+"""
+Unit tests for the build_graph module.
+"""
+
+from pathlib import Path
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from core.build_graph import WILDCARD, BuildGraph
+
+
+TEMPLATES = {
+    "base.html": "<title>{{ site.title }}</title>{% block content %}{% endblock %}",
+    "post.html": (
+        '{% extends "base.html" %}{% block content %}'
+        '{% include "parts/meta.html" %}{{ content }}{% endblock %}'
+    ),
+    "parts/meta.html": "{{ t.read_more }} {{ t.get('published', 'x') }}",
+    "dump.html": "{% for k, v in site.items() %}{{ k }}{% endfor %}",
+}
+
+
+@pytest.fixture
+def graph_factory(tmp_path: Path):
+    """Build graphs sharing one graph file and dist directory."""
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    env = Environment(loader=DictLoader(dict(TEMPLATES)))
+
+    def factory(site=None, translations=None) -> BuildGraph:
+        return BuildGraph(
+            tmp_path / "cache" / "graph.json",
+            dist,
+            jinja_env=env,
+            site_config=site or {"title": "Site", "author": "A"},
+            translations=translations or {"fr": {"read_more": "Lire"}},
+        )
+
+    return factory, dist, env
+
+
+def _write(graph: BuildGraph, output: Path, **kwargs) -> bool:
+    """Run one is_fresh/record cycle; return True if the output was rendered."""
+    if graph.is_fresh(output, "post.html", "fr", **kwargs):
+        return False
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text("rendered", encoding="utf-8")
+    graph.record(output)
+    return True
+
+
+class TestTemplateAnalysis:
+    """Tests for static template dependency analysis."""
+
+    def test_closure_follows_extends_and_include(self, graph_factory):
+        """Test that the template closure includes parents and includes."""
+        factory, _, _ = graph_factory
+        analysis = factory().analyse_template("post.html")
+
+        assert analysis.templates == {"post.html", "base.html", "parts/meta.html"}
+
+    def test_tracks_site_and_translation_keys(self, graph_factory):
+        """Test that attribute, get() and item accesses are recorded."""
+        factory, _, _ = graph_factory
+        analysis = factory().analyse_template("post.html")
+
+        assert analysis.keys["site"] == {"title"}
+        assert analysis.keys["t"] == {"read_more", "published"}
+
+    def test_whole_mapping_use_is_wildcard(self, graph_factory):
+        """Test that iterating a mapping depends on all of it."""
+        factory, _, _ = graph_factory
+        analysis = factory().analyse_template("dump.html")
+
+        assert WILDCARD in analysis.keys["site"]
+
+    def test_saved_analyses_are_reused(self, graph_factory, monkeypatch):
+        """Test that a new graph does not parse templates that did not change."""
+        factory, dist, env = graph_factory
+        graph = factory()
+        _write(graph, dist / "index.html")
+        graph.save()
+
+        parsed = []
+        original = env.parse
+        monkeypatch.setattr(
+            env, "parse", lambda source: parsed.append(source) or original(source)
+        )
+        analysis = factory().analyse_template("post.html")
+
+        assert parsed == []
+        assert analysis.templates == {"post.html", "base.html", "parts/meta.html"}
+        assert analysis.keys["t"] == {"read_more", "published"}
+
+    def test_edited_template_is_analysed_again(self, graph_factory):
+        """Test that a saved analysis is dropped when its template changes."""
+        factory, dist, env = graph_factory
+        graph = factory()
+        _write(graph, dist / "index.html")
+        graph.save()
+
+        env.loader.mapping["parts/meta.html"] = "{{ t.comments }}"
+        analysis = factory().analyse_template("post.html")
+
+        assert analysis.keys["t"] == {"comments"}
+
+
+class TestIncrementalRebuild:
+    """Tests for is_fresh/record/sweep across builds."""
+
+    def test_unchanged_output_is_skipped(self, graph_factory, tmp_path: Path):
+        """Test that a second build with identical inputs skips the output."""
+        factory, dist, _ = graph_factory
+        source = tmp_path / "post.md"
+        source.write_text("# Hello", encoding="utf-8")
+        output = dist / "post" / "index.html"
+
+        graph = factory()
+        assert _write(graph, output, sources=[source]) is True
+        graph.save()
+
+        graph = factory()
+        graph.begin_build()
+        assert _write(graph, output, sources=[source]) is False
+
+    def test_source_change_triggers_render(self, graph_factory, tmp_path: Path):
+        """Test that editing a source re-renders its output."""
+        factory, dist, _ = graph_factory
+        source = tmp_path / "post.md"
+        source.write_text("# Hello", encoding="utf-8")
+        output = dist / "post" / "index.html"
+
+        graph = factory()
+        _write(graph, output, sources=[source])
+        graph.save()
+
+        source.write_text("# Changed", encoding="utf-8")
+        assert _write(factory(), output, sources=[source]) is True
+
+    def test_only_used_config_keys_matter(self, graph_factory):
+        """Test that unrelated config keys do not invalidate outputs."""
+        factory, dist, _ = graph_factory
+        output = dist / "index.html"
+
+        graph = factory()
+        _write(graph, output)
+        graph.save()
+
+        unrelated = factory(site={"title": "Site", "author": "B"})
+        assert _write(unrelated, output) is False
+
+        related = factory(site={"title": "Other", "author": "A"})
+        assert _write(related, output) is True
+
+    def test_translation_change_triggers_render(self, graph_factory):
+        """Test that a used translation entry invalidates the output."""
+        factory, dist, _ = graph_factory
+        output = dist / "index.html"
+
+        graph = factory()
+        _write(graph, output)
+        graph.save()
+
+        changed = factory(translations={"fr": {"read_more": "Lire la suite"}})
+        assert _write(changed, output) is True
+
+    def test_sweep_removes_outputs_of_deleted_sources(self, graph_factory):
+        """Test that outputs not produced by the current build are deleted."""
+        factory, dist, _ = graph_factory
+        kept = dist / "kept" / "index.html"
+        gone = dist / "gone" / "index.html"
+
+        graph = factory()
+        _write(graph, kept)
+        _write(graph, gone)
+        graph.save()
+
+        graph = factory()
+        graph.begin_build()
+        _write(graph, kept)
+        removed = graph.sweep()
+
+        assert removed == [gone]
+        assert kept.exists()
+        assert not gone.exists()
+        assert not gone.parent.exists()
+
+    def test_begin_build_with_changes_rehashes_only_those(
+        self, graph_factory, tmp_path: Path
+    ):
+        """Test that a warm graph re-reads only the reported sources."""
+        factory, dist, _ = graph_factory
+        edited = tmp_path / "edited.md"
+        other = tmp_path / "other.md"
+        for source in (edited, other):
+            source.write_text("# Hello", encoding="utf-8")
+
+        graph = factory()
+        _write(graph, dist / "edited.html", sources=[edited])
+        _write(graph, dist / "other.html", sources=[other])
+
+        # Same size, so only a re-hash can see these edits
+        edited.write_text("# Hallo", encoding="utf-8")
+        other.write_text("# Hallo", encoding="utf-8")
+        graph.begin_build(changed=[edited])
+
+        assert _write(graph, dist / "edited.html", sources=[edited]) is True
+        assert _write(graph, dist / "other.html", sources=[other]) is False
+
+    def test_changed_outputs_lists_written_and_swept_files(self, graph_factory):
+        """Test that changed_outputs() reports what the last build touched."""
+        factory, dist, _ = graph_factory
+        kept = dist / "kept" / "index.html"
+        gone = dist / "gone" / "index.html"
+
+        graph = factory()
+        _write(graph, kept)
+        _write(graph, gone)
+        graph.save()
+
+        graph = factory()
+        graph.begin_build()
+        _write(graph, kept)
+        graph.sweep()
+        assert graph.changed_outputs() == [gone]
+
+        graph.begin_build()
+        assert graph.changed_outputs() == []
+
+    def test_disabled_graph_never_skips(self, tmp_path: Path):
+        """Test that a disabled graph always renders and records nothing."""
+        graph = BuildGraph.disabled()
+        output = tmp_path / "index.html"
+        output.write_text("x", encoding="utf-8")
+
+        assert graph.is_fresh(output, "post.html", "fr") is False
+        graph.record(output)
+        assert len(graph) == 0
@@ -0,0 +1,88 @@
+"""
+Unit tests for the build_manifest module.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.build_manifest import BuildManifest
+
+
+@pytest.fixture
+def dist(tmp_path: Path) -> Path:
+    """Output directory with two emitted files and one foreign file."""
+    dist = tmp_path / "dist"
+    for rel in ("index.html", "assets/old/logo.png", "styles/main.css"):
+        (dist / rel).parent.mkdir(parents=True, exist_ok=True)
+        (dist / rel).write_text(rel, encoding="utf-8")
+    return dist
+
+
+def _manifest(tmp_path: Path, dist: Path) -> BuildManifest:
+    return BuildManifest(tmp_path / "cache" / "manifest.json", dist)
+
+
+def _build(manifest: BuildManifest, dist: Path, *emitted: str) -> None:
+    manifest.begin_build()
+    manifest.add_all(dist / rel for rel in emitted)
+
+
+class TestBuildManifest:
+    """Tests for the BuildManifest class."""
+
+    def test_sweep_removes_only_orphans(self, tmp_path: Path, dist: Path):
+        """Test that files the build never emitted are left alone."""
+        manifest = _manifest(tmp_path, dist)
+        _build(manifest, dist, "index.html", "assets/old/logo.png")
+        manifest.save()
+
+        manifest = _manifest(tmp_path, dist)
+        _build(manifest, dist, "index.html")
+
+        assert manifest.sweep() == [dist / "assets/old/logo.png"]
+        assert not (dist / "assets").exists()
+        assert (dist / "index.html").exists()
+        assert (dist / "styles" / "main.css").exists()
+
+    def test_partial_build_keeps_previous_entries(self, tmp_path: Path, dist: Path):
+        """Test that a partial build does not forget skipped producers."""
+        manifest = _manifest(tmp_path, dist)
+        _build(manifest, dist, "index.html", "assets/old/logo.png")
+        manifest.save()
+
+        _build(manifest, dist, "index.html")
+        manifest.save(complete=False)
+
+        manifest = _manifest(tmp_path, dist)
+        _build(manifest, dist, "index.html")
+        assert manifest.sweep() == [dist / "assets/old/logo.png"]
+
+    def test_first_build_warns_about_unaccounted_files(
+        self, tmp_path: Path, dist: Path, caplog
+    ):
+        """Test that a dist/ without manifest is kept, with a warning, once."""
+        manifest = _manifest(tmp_path, dist)
+        _build(manifest, dist, "index.html")
+
+        assert manifest.sweep() == []
+        assert "2 file(s)" in caplog.text
+        assert (dist / "assets" / "old" / "logo.png").exists()
+
+        manifest.save()
+        caplog.clear()
+        manifest = _manifest(tmp_path, dist)
+        _build(manifest, dist, "index.html")
+        assert manifest.sweep() == []
+        assert caplog.text == ""
+
+    def test_paths_outside_dist_are_ignored(self, tmp_path: Path, dist: Path):
+        """Test that only files below the output root are recorded."""
+        manifest = _manifest(tmp_path, dist)
+        _build(manifest, dist, "index.html")
+        manifest.add(tmp_path / "elsewhere.txt")
+        manifest.save()
+
+        manifest = _manifest(tmp_path, dist)
+        manifest.begin_build()
+        assert manifest.sweep() == [dist / "index.html"]
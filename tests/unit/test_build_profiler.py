@@ -0,0 +1,114 @@
+"""
+Unit tests for the build_profiler module.
+"""
+
+import json
+from pathlib import Path
+
+from core.build_profiler import (
+    MARKDOWN,
+    PAGE,
+    PHASE,
+    TEMPLATE,
+    BuildProfiler,
+    Span,
+    Stopwatch,
+)
+
+
+def _page_spans(output: str, template: str, wall: float):
+    return [
+        Span(MARKDOWN, template, 1.0, wall / 4, wall / 4, 1, 1, output),
+        Span(TEMPLATE, template, 1.0, wall / 2, wall / 2, 1, 1, output),
+        Span(PAGE, template, 1.0, wall, wall, 1, 1, output),
+    ]
+
+
+class TestBuildProfiler:
+    """Tests for the BuildProfiler class."""
+
+    def test_phases_are_recorded_in_order(self):
+        """Test that phase() records one span per phase."""
+        profiler = BuildProfiler()
+        profiler.begin_build()
+        with profiler.phase("scan_sources"):
+            pass
+        with profiler.phase("post_builder"):
+            sum(range(1000))
+        profiler.end_build()
+
+        report = profiler.report()
+        assert [p["name"] for p in report["phases"]] == ["scan_sources", "post_builder"]
+        assert report["total"]["wall_s"] >= sum(p["wall_s"] for p in report["phases"])
+
+    def test_phase_is_recorded_on_error(self):
+        """Test that a phase that raises is still timed."""
+        profiler = BuildProfiler()
+        try:
+            with profiler.phase("page_builder"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert [s.name for s in profiler.spans] == ["page_builder"]
+
+    def test_disabled_records_nothing(self):
+        """Test that a disabled profiler has no sink and no spans."""
+        profiler = BuildProfiler.disabled()
+        with profiler.phase("post_builder"):
+            pass
+        profiler.extend(_page_spans("/dist/a.html", "post.html", 0.1))
+        assert profiler.sink() is None
+        assert profiler.spans == []
+
+    def test_report_aggregates_pages_and_templates(self, tmp_path: Path):
+        """Test the per-template totals and the slowest pages."""
+        profiler = BuildProfiler(root=tmp_path)
+        for i, wall in enumerate([0.1, 0.4, 0.2]):
+            profiler.extend(
+                _page_spans(str(tmp_path / f"p{i}" / "index.html"), "post.html", wall)
+            )
+        profiler.extend(_page_spans(str(tmp_path / "index.html"), "home.html", 0.3))
+
+        report = profiler.report(top=2)
+        assert [p["output"] for p in report["slowest_pages"]] == [
+            "p1/index.html",
+            "index.html",
+        ]
+        assert len(report["pages"]) == 4
+        assert report["templates"][0]["name"] == "post.html"
+        assert report["templates"][0]["count"] == 3
+        assert report["markdown"]["count"] == 4
+
+    def test_writes_json_report_and_chrome_trace(self, tmp_path: Path):
+        """Test that both files are valid JSON in the expected formats."""
+        profiler = BuildProfiler(root=tmp_path)
+        profiler.begin_build()
+        with profiler.phase("post_builder"):
+            watch = Stopwatch(profiler.sink(), str(tmp_path / "index.html"))
+            with watch(PAGE, "post.html"):
+                pass
+        profiler.end_build()
+        profiler.write_report(tmp_path / "profile.json")
+        profiler.write_trace(tmp_path / "trace.json")
+
+        report = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+        assert report["slowest_pages"][0]["output"] == "index.html"
+        events = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))
+        events = events["traceEvents"]
+        assert {(e["cat"], e["name"]) for e in events} == {
+            (PAGE, "post.html"),
+            (PHASE, "post_builder"),
+            (PHASE, "build"),
+        }
+        assert all(e["ph"] == "X" and e["ts"] >= 0 for e in events)
+
+
+class TestStopwatch:
+    """Tests for the Stopwatch class."""
+
+    def test_without_sink_times_nothing(self):
+        """Test that a Stopwatch without a list only runs the block."""
+        ran = []
+        with Stopwatch(None, "index.html")(PAGE, "post.html"):
+            ran.append(True)
+        assert ran == [True]
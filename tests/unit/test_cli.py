@@ -0,0 +1,135 @@
+"""
+Unit tests for the idoine command-line entry point.
+"""
+
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import idoine
+from idoine import ImportTimer
+
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+
+# Third-party packages a build needs but startup must not load
+HEAVY_MODULES = ("jinja2", "markdown", "frontmatter", "PIL", "babel", "pydantic")
+
+
+def _loaded_after(statement: str) -> set:
+    """Return the heavy modules loaded by running a statement in a new process."""
+    code = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(SCRIPTS_DIR)!r})\n"
+        f"{statement}\n"
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    child = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(child.stdout.split())
+
+
+class TestImportTimer:
+    """Tests for ImportTimer."""
+
+    def test_measures_new_modules(self, tmp_path: Path, monkeypatch):
+        """Test that importing a new module is counted and timed."""
+        (tmp_path / "timer_probe_module.py").write_text(
+            "import time\ntime.sleep(0.01)\n", encoding="utf-8"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "timer_probe_module", raising=False)
+
+        with ImportTimer() as timer:
+            import timer_probe_module  # noqa: F401
+
+        assert timer.modules == 1
+        assert timer.seconds >= 0.01
+
+    def test_ignores_loaded_modules(self):
+        """Test that an import of an already loaded module costs nothing."""
+        with ImportTimer() as timer:
+            import json  # noqa: F401
+
+        assert timer.modules == 0
+        assert timer.seconds == 0.0
+
+    def test_restores_import(self):
+        """Test that the import function is put back on exit."""
+        import builtins
+
+        original = builtins.__import__
+        with ImportTimer():
+            assert builtins.__import__ is not original
+        assert builtins.__import__ is original
+
+
+class TestLazyImports:
+    """Tests that startup does not load what only a build phase needs."""
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import idoine",
+            "import core.build",
+            "import utils, core, builders",
+        ],
+    )
+    def test_startup_loads_no_heavy_module(self, statement: str):
+        """Test that entry points and packages import no heavy dependency."""
+        assert _loaded_after(statement) == set()
+
+    def test_package_exports_are_loaded_on_use(self):
+        """Test that a package export still resolves, loading its module."""
+        loaded = _loaded_after("from utils import slugify")
+
+        assert "jinja2" in loaded
+
+
+class TestMain:
+    """Tests for command dispatch."""
+
+    @pytest.fixture(autouse=True)
+    def keep_logging(self, monkeypatch, caplog):
+        """Keep pytest's log capture instead of the CLI's handler."""
+        monkeypatch.setattr("utils.logger.setup_logging", lambda: None)
+        caplog.set_level(logging.INFO)
+
+    def test_unknown_command_is_rejected(self):
+        """Test that an unknown command exits with a usage error."""
+        with pytest.raises(SystemExit) as excinfo:
+            idoine.main(["deploy"])
+        assert excinfo.value.code == 2
+
+    def test_check_reports_problems(self, tmp_path: Path, caplog):
+        """Test that check exits with 1 and reports timings when sources are bad."""
+        src = tmp_path / "src"
+        (src / "config").mkdir(parents=True)
+        (src / "config" / "site_config.yaml").write_text(
+            "posts_per_page: 0\n", encoding="utf-8"
+        )
+
+        status = idoine.main(["check", "--src", str(src)])
+
+        assert status == 1
+        assert "problem(s) found" in caplog.text
+        assert "of imports" in caplog.text
+
+    def test_check_passes_on_valid_sources(self, monkeypatch, tmp_path: Path):
+        """Test that check exits with 0 when no check finds a problem."""
+        monkeypatch.setattr("core.site_checker.check_site", lambda src: [])
+
+        assert idoine.main(["check", "--src", str(tmp_path)]) == 0
+
+    def test_build_forwards_options(self, monkeypatch):
+        """Test that build runs core.build.main with --build and the options."""
+        calls = []
+        monkeypatch.setattr(
+            "core.build.main", lambda argv, prog: calls.append((argv, prog)) or 0
+        )
+
+        assert idoine.main(["build", "--incremental", "-j", "2"]) == 0
+        assert calls == [(["--build", "--incremental", "-j", "2"], "idoine build")]
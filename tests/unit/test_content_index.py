@@ -0,0 +1,113 @@
+"""
+Unit tests for the content_index module.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.content_index import ContentIndex
+
+
+@pytest.fixture
+def content_dir(tmp_path: Path, sample_markdown_content: str) -> Path:
+    """Directory with a couple of Markdown sources."""
+    (tmp_path / "first.md").write_text(sample_markdown_content, encoding="utf-8")
+    (tmp_path / "second.md").write_text("# Second\n", encoding="utf-8")
+    return tmp_path
+
+
+class TestContentIndex:
+    """Tests for the ContentIndex class."""
+
+    def test_get_parses_metadata_and_body(self, content_dir: Path):
+        """Test that an entry exposes metadata, body and raw content."""
+        index = ContentIndex()
+        entry = index.get(content_dir / "first.md")
+
+        assert entry.metadata["title"] == "Test Page"
+        assert entry.metadata["tags"] == ["tag1", "tag2"]
+        assert "# Test Heading" in entry.body
+        assert entry.raw.startswith("---")
+
+    def test_file_is_read_once(self, content_dir: Path, monkeypatch):
+        """Test that repeated lookups do not re-read the file."""
+        index = ContentIndex()
+        path = content_dir / "first.md"
+        calls = []
+        original = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            # Loading Markdown extensions reads package metadata files too
+            if self.suffix == ".md":
+                calls.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        index.get(path)
+        index.get(path)
+        index.html(path)
+        index.processed(path)
+
+        assert calls == [path]
+
+    def test_html_is_cached(self, content_dir: Path):
+        """Test that Markdown is converted once per entry."""
+        index = ContentIndex()
+        path = content_dir / "first.md"
+
+        html = index.html(path)
+
+        assert "<h1>Test Heading</h1>" in html
+        assert index.html(path) is html
+
+    def test_processed_returns_raw_front_matter(self, content_dir: Path):
+        """Test that processed() mirrors ContentProcessor.parse."""
+        index = ContentIndex()
+        processed = index.processed(content_dir / "second.md")
+
+        assert processed.metadata == {}
+        assert "<h1>Second</h1>" in processed.html
+
+    def test_list_dir_and_clear(self, content_dir: Path):
+        """Test directory listing and clearing the index."""
+        index = ContentIndex()
+        entries = index.entries(content_dir)
+
+        assert sorted(e.path.name for e in entries) == ["first.md", "second.md"]
+        assert len(index) == 2
+
+        index.clear()
+        assert len(index) == 0
+
+    def test_invalidate_rereads_file(self, content_dir: Path):
+        """Test that invalidate() forces a re-read of a changed file."""
+        index = ContentIndex()
+        path = content_dir / "second.md"
+        index.get(path)
+
+        path.write_text("# Changed\n", encoding="utf-8")
+        index.invalidate(path)
+
+        assert "# Changed" in index.get(path).body
+
+    def test_metadata_of_invalid_or_missing_file(self, content_dir: Path):
+        """Test that invalid frontmatter is empty and a missing file raises."""
+        bad = content_dir / "bad.md"
+        bad.write_text("---\ntitle: [unclosed\n---\n", encoding="utf-8")
+        index = ContentIndex()
+
+        assert index.metadata(bad) == index.get(bad).metadata
+        assert "title" not in index.metadata(bad)
+        with pytest.raises(OSError):
+            index.metadata(content_dir / "missing.md")
+
+    def test_metadata_reads_header_only(self, content_dir: Path):
+        """Test that metadata() matches get() without loading the entry."""
+        index = ContentIndex()
+        path = content_dir / "first.md"
+
+        metadata = index.metadata(path)
+
+        assert path not in index
+        assert metadata == ContentIndex().get(path).metadata
@@ -0,0 +1,85 @@
+"""
+Unit tests for the date_formatter module.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from babel.dates import format_date
+
+from utils.constants import DATE_FORMAT_PATTERNS
+from utils.date_formatter import DateFormatter, get_date_formatter
+
+
+@pytest.fixture
+def formatter() -> DateFormatter:
+    """A DateFormatter with empty caches."""
+    return DateFormatter()
+
+
+class TestDateFormatter:
+    """Tests for DateFormatter."""
+
+    @pytest.mark.parametrize("fmt", sorted(DATE_FORMAT_PATTERNS))
+    @pytest.mark.parametrize("lang", ["fr_FR", "fr", "en_US", "en", "de"])
+    def test_matches_babel(self, formatter: DateFormatter, fmt: str, lang: str):
+        """Test that output is the same as babel.dates.format_date."""
+        day = date(2025, 11, 25)
+        expected = format_date(day, format=DATE_FORMAT_PATTERNS[fmt], locale=lang)
+
+        assert formatter.format(day, fmt, lang) == expected
+        assert formatter.format("2025-11-25", fmt, lang) == expected
+        assert formatter.format(datetime(2025, 11, 25, 10, 30), fmt, lang) == expected
+
+    def test_unknown_format_is_long(self, formatter: DateFormatter):
+        """Test that a format name not in DATE_FORMAT_PATTERNS falls back to long."""
+        assert formatter.format("2025-11-25", "%Y-%m-%d", "fr_FR") == (
+            formatter.format("2025-11-25", "long", "fr_FR")
+        )
+
+    def test_repeated_call_is_memoized(self, formatter: DateFormatter):
+        """Test that an identical call is answered from the cache."""
+        first = formatter.format("2025-11-25", "long", "fr_FR")
+        second = formatter.format("2025-11-25", "long", "fr_FR")
+        info = formatter.cache_info()
+
+        assert first == second
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_locale_and_pattern_are_parsed_once(self, formatter: DateFormatter):
+        """Test that different dates share the parsed locale and pattern."""
+        formatter.format("2025-11-25", "long", "fr_FR")
+        locale = formatter.locale("fr_FR")
+        pattern = formatter.pattern("long")
+        formatter.format("2024-01-02", "long", "fr_FR")
+
+        assert formatter.locale("fr_FR") is locale
+        assert formatter.pattern("long") is pattern
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used results are evicted."""
+        formatter = DateFormatter(maxsize=2)
+        for day in ("2025-01-01", "2025-01-02", "2025-01-03"):
+            formatter.format(day, "short", "en")
+        formatter.format("2025-01-01", "short", "en")
+        info = formatter.cache_info()
+
+        assert info.currsize == 2
+        assert info.hits == 0
+
+    def test_clear(self, formatter: DateFormatter):
+        """Test that clear() empties the result cache."""
+        formatter.format("2025-11-25", "long", "fr_FR")
+        formatter.clear()
+
+        assert formatter.cache_info().currsize == 0
+
+    @pytest.mark.parametrize("value", [12345, None, "25/11/2025"])
+    def test_invalid_value_raises_error(self, formatter: DateFormatter, value):
+        """Test that a non-date or an unparsable string raises ValueError."""
+        with pytest.raises(ValueError):
+            formatter.format(value, "long", "fr_FR")
+
+    def test_shared_instance(self):
+        """Test that get_date_formatter returns the same instance every time."""
+        assert get_date_formatter() is get_date_formatter()
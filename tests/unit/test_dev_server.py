@@ -0,0 +1,243 @@
+"""
+Unit tests for the dev_server module.
+"""
+
+import functools
+import http.client
+import http.server
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from core.output_store import MemoryOutputStore
+from dev_server import (
+    DevServer,
+    FileWatcher,
+    LiveReloadBroker,
+    LiveReloadHandler,
+    PageCache,
+)
+
+
+class _Recorder:
+    """Collects callback calls and lets tests wait for them."""
+
+    def __init__(self):
+        self.calls = []
+        self._event = threading.Event()
+
+    def __call__(self, changed):
+        self.calls.append(changed)
+        self._event.set()
+
+    def wait(self, timeout: float = 5.0) -> bool:
+        hit = self._event.wait(timeout)
+        self._event.clear()
+        return hit
+
+
+@pytest.fixture
+def watch_dir(tmp_path: Path) -> Path:
+    """Directory with a couple of watched files."""
+    (tmp_path / "posts").mkdir()
+    (tmp_path / "posts" / "first.md").write_text("# First", encoding="utf-8")
+    (tmp_path / "base.html").write_text("<html></html>", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def serve(tmp_path: Path):
+    """Start a LiveReloadHandler server on tmp_path; yield a connection factory."""
+    (tmp_path / "index.html").write_text(
+        "<html><body>Hi</body></html>", encoding="utf-8"
+    )
+    (tmp_path / "style.css").write_text("body {}", encoding="utf-8")
+    servers = []
+
+    def start(**kwargs) -> http.client.HTTPConnection:
+        handler = functools.partial(
+            LiveReloadHandler, directory=str(tmp_path), **kwargs
+        )
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return http.client.HTTPConnection(*server.server_address, timeout=5)
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestFileWatcher:
+    """Tests for the FileWatcher class."""
+
+    def test_burst_is_coalesced_into_one_callback(self, tmp_path: Path):
+        """Test that events within the debounce delay are reported together."""
+        recorder = _Recorder()
+        watcher = FileWatcher([tmp_path], ["*.md"], recorder, debounce=0.2)
+        watcher.start()
+        try:
+            for name in ("a.md", "b.md", "a.md", "ignored.txt"):
+                watcher.notify(tmp_path / name)
+                time.sleep(0.02)
+            assert recorder.wait()
+        finally:
+            watcher.stop()
+
+        assert recorder.calls == [{tmp_path / "a.md", tmp_path / "b.md"}]
+
+    def test_polling_reports_exact_change_set(self, watch_dir: Path):
+        """Test that created, modified and deleted files are all reported."""
+        recorder = _Recorder()
+        watcher = FileWatcher(
+            [watch_dir],
+            ["*.md", "*.html"],
+            recorder,
+            debounce=0.1,
+            backend="polling",
+            poll_interval=0.05,
+        )
+        watcher.start()
+        try:
+            (watch_dir / "posts" / "first.md").write_text("# Edited!", encoding="utf-8")
+            (watch_dir / "posts" / "second.md").write_text("# New", encoding="utf-8")
+            (watch_dir / "base.html").unlink()
+            (watch_dir / "notes.txt").write_text("ignored", encoding="utf-8")
+            assert recorder.wait()
+        finally:
+            watcher.stop()
+
+        assert set().union(*recorder.calls) == {
+            watch_dir / "posts" / "first.md",
+            watch_dir / "posts" / "second.md",
+            watch_dir / "base.html",
+        }
+
+    def test_watchdog_backend_reports_changes(self, watch_dir: Path):
+        """Test the event-driven backend when watchdog is installed."""
+        pytest.importorskip("watchdog")
+        recorder = _Recorder()
+        watcher = FileWatcher(
+            [watch_dir], ["*.md"], recorder, debounce=0.1, backend="watchdog"
+        )
+        watcher.start()
+        try:
+            (watch_dir / "posts" / "first.md").write_text("# Edited", encoding="utf-8")
+            assert recorder.wait()
+        finally:
+            watcher.stop()
+
+        assert watch_dir / "posts" / "first.md" in set().union(*recorder.calls)
+
+    def test_unknown_backend_is_rejected(self, tmp_path: Path):
+        """Test that an invalid backend name raises ValueError."""
+        with pytest.raises(ValueError):
+            FileWatcher([tmp_path], ["*.md"], lambda changed: None, backend="fsnotify")
+
+
+class TestLiveReload:
+    """Tests for the Server-Sent Events live reload channel."""
+
+    def test_broker_fans_out_to_every_client(self):
+        """Test that a published event reaches all subscribers."""
+        broker = LiveReloadBroker()
+        first, second = broker.subscribe(), broker.subscribe()
+        broker.unsubscribe(second)
+
+        assert broker.publish("build", {"urls": ["/"]}) == 1
+        assert first.get_nowait() == 'event: build\ndata: {"urls": ["/"]}\n\n'
+        assert second.empty()
+
+    def test_event_stream_delivers_published_events(self, serve):
+        """Test that a connected client receives events over HTTP."""
+        broker = LiveReloadBroker()
+        conn = serve(broker=broker)
+        try:
+            conn.request("GET", "/")
+            page = conn.getresponse().read().decode("utf-8")
+            assert "new EventSource('/__livereload')" in page
+
+            conn.request("GET", LiveReloadHandler.EVENTS_PATH)
+            response = conn.getresponse()
+            assert response.getheader("Content-Type") == "text/event-stream"
+            assert response.readline() == b"retry: 1000\n"
+            response.readline()
+
+            deadline = time.monotonic() + 5
+            while not broker.publish("css", {"files": ["main.css"]}):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            assert response.readline() == b"event: css\n"
+            assert json.loads(response.readline()[len(b"data: ") :]) == {
+                "files": ["main.css"]
+            }
+        finally:
+            broker.close()
+
+    def test_output_urls(self, tmp_path: Path):
+        """Test that output files map to the URLs browsers have open."""
+        dist = tmp_path / "dist"
+        server = DevServer(tmp_path / "src", dist)
+
+        assert server._output_urls(
+            [dist / "index.html", dist / "fr" / "blog" / "index.html", dist / "404.html"]
+        ) == ["/", "/fr/blog/", "/404.html"]
+
+
+class TestCaching:
+    """Tests for the injected page cache and conditional requests."""
+
+    def test_page_cache_reuses_until_file_changes(self, tmp_path: Path):
+        """Test that a page is injected once and refreshed when rewritten."""
+        page = tmp_path / "index.html"
+        page.write_text("<body>one</body>", encoding="utf-8")
+        cache = PageCache(script="<script></script>")
+
+        body, etag = cache.get(str(page))
+        assert body == b"<body>one<script></script></body>"
+        assert cache.get(str(page))[0] is body
+
+        page.write_text("<body>two!</body>", encoding="utf-8")
+        body, new_etag = cache.get(str(page))
+        assert b"two!" in body
+        assert new_etag != etag
+
+        cache.invalidate([page])
+        assert len(cache) == 0
+
+    def test_memory_store_pages_shadow_dist(self, tmp_path: Path, serve):
+        """Test that pages held in memory are served instead of dist files."""
+        store = MemoryOutputStore(tmp_path, lazy=True)
+        store.defer(tmp_path / "index.html", lambda: "<body>memory</body>")
+        store.write_text(tmp_path / "blog" / "index.html", "<body>blog</body>")
+        conn = serve(page_cache=PageCache(store=store))
+
+        for url, text in (("/", b"memory"), ("/blog/", b"blog")):
+            conn.request("GET", url)
+            response = conn.getresponse()
+            assert response.status == 200
+            assert text in response.read()
+
+        conn.request("GET", "/missing/")
+        response = conn.getresponse()
+        response.read()
+        assert response.status == 404
+
+    def test_unchanged_page_and_asset_return_304(self, serve):
+        """Test that If-None-Match with the current ETag is answered 304."""
+        conn = serve()
+        for url in ("/", "/style.css"):
+            conn.request("GET", url)
+            response = conn.getresponse()
+            response.read()
+            etag = response.getheader("ETag")
+            assert response.status == 200 and etag
+
+            conn.request("GET", url, headers={"If-None-Match": etag})
+            response = conn.getresponse()
+            assert response.status == 304
+            assert response.read() == b""
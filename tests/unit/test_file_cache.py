@@ -0,0 +1,158 @@
+"""
+Unit tests for the file_cache module.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from utils import file_cache
+from utils.file_cache import FileCache
+
+
+class TestFileCache:
+    """Tests for the FileCache class."""
+
+    def test_digest_is_reused_until_stat_changes(self, tmp_path: Path, monkeypatch):
+        """Test that digest() hashes a file only when its stat changes."""
+        path = tmp_path / "asset.bin"
+        path.write_bytes(b"one")
+        calls = []
+        original = FileCache.compute_checksum
+
+        def counting(p, *args):
+            calls.append(p)
+            return original(p, *args)
+
+        monkeypatch.setattr(FileCache, "compute_checksum", staticmethod(counting))
+        cache = FileCache(tmp_path / "cache")
+
+        first = cache.digest(path)
+        assert cache.digest(path) == first
+        assert len(calls) == 1
+
+        path.write_bytes(b"two")
+        os.utime(path, ns=(1, 1))
+        assert cache.digest(path) != first
+        assert len(calls) == 2
+
+    def test_digests_persist_across_instances(self, tmp_path: Path):
+        """Test that saved entries are reused by a new cache."""
+        path = tmp_path / "asset.bin"
+        path.write_bytes(b"content")
+        cache = FileCache(tmp_path / "cache")
+        digest = cache.digest(path)
+        cache.save()
+
+        reloaded = FileCache(tmp_path / "cache")
+        assert reloaded.get_entry(path).checksum == digest
+        assert reloaded.get_entry(path).matches(path.stat())
+
+    def test_changes_are_written_only_on_save(self, tmp_path: Path):
+        """Test that unsaved updates and removals are not persisted."""
+        kept = tmp_path / "kept.bin"
+        dropped = tmp_path / "dropped.bin"
+        kept.write_bytes(b"kept")
+        dropped.write_bytes(b"dropped")
+        with FileCache(tmp_path / "cache") as cache:
+            cache.update(kept)
+            cache.update(dropped)
+
+        cache = FileCache(tmp_path / "cache")
+        assert cache.remove(dropped) is True
+        cache.update(tmp_path / "kept.bin", checksum="0" * 32)
+        cache.close()
+
+        reloaded = FileCache(tmp_path / "cache")
+        assert len(reloaded) == 2
+        assert reloaded.get_entry(kept).checksum != "0" * 32
+
+    def test_prune_missing_removes_deleted_files(self, tmp_path: Path):
+        """Test that entries of deleted files are pruned on save."""
+        gone = tmp_path / "gone.bin"
+        gone.write_bytes(b"gone")
+        with FileCache(tmp_path / "cache") as cache:
+            cache.update(gone)
+        gone.unlink()
+
+        with FileCache(tmp_path / "cache") as cache:
+            assert cache.prune_missing() == 1
+
+        assert len(FileCache(tmp_path / "cache")) == 0
+
+    def test_algorithm_change_starts_fresh(self, tmp_path: Path, monkeypatch):
+        """Test that digests from another hash algorithm are discarded."""
+        path = tmp_path / "asset.bin"
+        path.write_bytes(b"content")
+        with FileCache(tmp_path / "cache", algorithm="blake2b") as cache:
+            cache.update(path)
+
+        monkeypatch.setitem(
+            file_cache.HASH_ALGORITHMS, "sha256", hashlib.sha256
+        )
+        cache = FileCache(tmp_path / "cache", algorithm="sha256")
+        assert cache.get_entry(path) is None
+        assert len(cache.digest(path)) == 64
+
+    def test_unknown_algorithm_is_rejected(self, tmp_path: Path):
+        """Test that a missing hash algorithm fails early."""
+        with pytest.raises(ValueError):
+            FileCache(tmp_path, algorithm="md4")
+
+
+class TestScan:
+    """Tests for FileCache.scan and the batch change detection."""
+
+    def test_reports_added_modified_and_deleted(self, tmp_path: Path):
+        """Test that a second scan classifies every change."""
+        src = tmp_path / "src"
+        (src / "posts").mkdir(parents=True)
+        kept = src / "kept.md"
+        edited = src / "posts" / "edited.md"
+        gone = src / "posts" / "gone.md"
+        for path in (kept, edited, gone):
+            path.write_text(path.name, encoding="utf-8")
+
+        with FileCache(tmp_path / "cache") as cache:
+            assert cache.scan([src]).added == {kept, edited, gone}
+
+        edited.write_text("new content", encoding="utf-8")
+        gone.unlink()
+        added = src / "added.md"
+        added.write_text("added", encoding="utf-8")
+        with FileCache(tmp_path / "cache") as cache:
+            changes = cache.scan([src], workers=2)
+
+        assert changes.added == {added}
+        assert changes.modified == {edited}
+        assert changes.deleted == {gone}
+        with FileCache(tmp_path / "cache") as cache:
+            assert not cache.scan([src])
+
+    def test_touched_files_are_rehashed_not_reported(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """Test that only files whose stat changed are hashed."""
+        src = tmp_path / "src"
+        src.mkdir()
+        for name in ("a.md", "b.md"):
+            (src / name).write_text(name, encoding="utf-8")
+        with FileCache(tmp_path / "cache") as cache:
+            cache.scan([src])
+
+        hashed = []
+        original = FileCache.compute_checksum
+
+        def tracking(p, *args):
+            hashed.append(Path(p).name)
+            return original(p, *args)
+
+        monkeypatch.setattr(FileCache, "compute_checksum", staticmethod(tracking))
+        os.utime(src / "a.md", ns=(1, 1))
+        cache = FileCache(tmp_path / "cache")
+
+        assert not cache.scan([src])
+        assert hashed == ["a.md"]
+        assert cache.get_modified_files({src / "a.md", src / "b.md"}) == set()
@@ -2,9 +2,18 @@
 Unit tests for the frontmatter parser module.
 """
 
+import functools
+import os
+from pathlib import Path
+
+import frontmatter
 import pytest
 
-from utils.frontmatter_parser import parse_frontmatter
+from utils import frontmatter_parser
+from utils.constants import FRONTMATTER_CACHE_SIZE
+from utils.frontmatter_parser import parse_frontmatter, read_frontmatter
+
+SAMPLE_CONTENT = Path(__file__).parent.parent / "fixtures" / "sample_content"
 
 
 class TestParseFrontmatter:
@@ -137,3 +146,66 @@ Content
 
         assert metadata["title"] == "Test: A Special Title (With Parentheses)"
 
+
+
+class TestReadFrontmatter:
+    """Tests for the read_frontmatter function."""
+
+    def test_matches_python_frontmatter(self, tmp_path: Path):
+        """Test that the header reader returns frontmatter.load's metadata."""
+        sources = list(SAMPLE_CONTENT.glob("*.md"))
+        (tmp_path / "none.md").write_text("# No header\n", encoding="utf-8")
+        (tmp_path / "open.md").write_text("---\ntitle: x\n", encoding="utf-8")
+        (tmp_path / "list.md").write_text("---\n- a\n---\nbody", encoding="utf-8")
+        sources.extend(tmp_path.glob("*.md"))
+
+        for path in sources:
+            assert read_frontmatter(path) == frontmatter.load(path).metadata
+
+    def test_body_is_not_read(self, tmp_path: Path):
+        """Test that bytes after the header are never decoded."""
+        path = tmp_path / "large.md"
+        path.write_bytes(
+            b"---\ntitle: Large\n---\n" + b"x" * 200_000 + b"\xff\xfe invalid"
+        )
+
+        assert read_frontmatter(path) == {"title": "Large"}
+
+    def test_cached_until_file_changes(self, tmp_path: Path, monkeypatch):
+        """Test that an unchanged file is parsed once."""
+        path = tmp_path / "post.md"
+        path.write_text("---\ntitle: One\n---\n", encoding="utf-8")
+        reads = []
+        original = frontmatter_parser._read_header
+
+        def counting(p):
+            reads.append(p)
+            return original(p)
+
+        monkeypatch.setattr(frontmatter_parser, "_read_header", counting)
+        read_frontmatter(path)["title"] = "mutated"
+        assert read_frontmatter(path) == {"title": "One"}
+        assert len(reads) == 1
+
+        path.write_text("---\ntitle: Two\n---\n", encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+        assert read_frontmatter(path) == {"title": "Two"}
+        assert len(reads) == 2
+
+    def test_cache_is_bounded(self, tmp_path: Path, monkeypatch):
+        """Test that headers of earlier versions of a file are evicted."""
+        assert (
+            frontmatter_parser._cached_header.cache_info().maxsize
+            == FRONTMATTER_CACHE_SIZE
+        )
+        small = functools.lru_cache(maxsize=2)(
+            frontmatter_parser._cached_header.__wrapped__
+        )
+        monkeypatch.setattr(frontmatter_parser, "_cached_header", small)
+        path = tmp_path / "post.md"
+        for version in range(5):
+            path.write_text(f"---\ntitle: v{version}\n---\n", encoding="utf-8")
+            os.utime(path, ns=(version, version))
+            assert read_frontmatter(path) == {"title": f"v{version}"}
+
+        assert small.cache_info().currsize == 2
@@ -0,0 +1,155 @@
+"""
+Unit tests for the gallery_utils module.
+"""
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from utils import image_processor
+from utils.gallery_utils import copy_images, generate_resized_images
+from utils.image_processor import ImageProcessor
+
+
+@pytest.fixture
+def images_dir(tmp_path: Path) -> Path:
+    """Directory with a JPEG and a PNG source image."""
+    images = tmp_path / "images"
+    (images / "album").mkdir(parents=True)
+    Image.new("RGB", (1600, 1000), "red").save(images / "photo.jpg")
+    Image.new("RGBA", (500, 500), "blue").save(images / "album" / "logo.png")
+    return images
+
+
+class TestCopyImages:
+    """Tests for copy_images."""
+
+    def test_copies_preserving_structure(self, images_dir: Path, tmp_path: Path):
+        """Test that every image is copied under assets/gallery_images."""
+        dist = tmp_path / "dist"
+        copied = copy_images(images_dir, dist)
+
+        target = dist / "assets" / "gallery_images"
+        assert sorted(copied) == [target / "album" / "logo.png", target / "photo.jpg"]
+        assert (target / "photo.jpg").read_bytes() == (
+            images_dir / "photo.jpg"
+        ).read_bytes()
+
+    def test_up_to_date_copies_are_kept(
+        self, images_dir: Path, tmp_path: Path, monkeypatch
+    ):
+        """Test that a second run copies nothing but still lists every image."""
+        dist = tmp_path / "dist"
+        first = copy_images(images_dir, dist)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged image copied again")
+
+        monkeypatch.setattr("utils.gallery_utils.shutil.copy2", fail)
+        assert copy_images(images_dir, dist) == first
+
+    def test_changed_image_is_copied_again(self, images_dir: Path, tmp_path: Path):
+        """Test that an edited source replaces its copy."""
+        dist = tmp_path / "dist"
+        copy_images(images_dir, dist)
+        Image.new("RGB", (800, 500), "green").save(images_dir / "photo.jpg")
+
+        copy_images(images_dir, dist)
+        assert (dist / "assets" / "gallery_images" / "photo.jpg").read_bytes() == (
+            images_dir / "photo.jpg"
+        ).read_bytes()
+
+
+class TestGenerateResizedImages:
+    """Tests for generate_resized_images."""
+
+    def test_generates_every_size_and_format(self, images_dir: Path, tmp_path: Path):
+        """Test that each size has a fallback and a WebP variant."""
+        dist = tmp_path / "dist"
+        manifest = generate_resized_images(images_dir, dist)
+
+        assert set(manifest) == {"photo.jpg", "album/logo.png"}
+        assert [v.format for v in manifest["photo.jpg"]["small"]][:2] == [
+            "JPEG",
+            "WEBP",
+        ]
+        assert manifest["photo.jpg"]["medium"][0].width == 800
+
+        root = dist / "assets" / "gallery_images"
+        for size, width in (("small", 300), ("medium", 800), ("large", 1200)):
+            with Image.open(root / size / "photo.jpg") as img:
+                assert img.width == width
+            assert (root / size / "photo.webp").exists()
+            assert (root / size / "album" / "logo.png").exists()
+            assert (root / size / "album" / "logo.webp").exists()
+
+        # Smaller sources are never upscaled
+        with Image.open(root / "large" / "album" / "logo.png") as img:
+            assert img.size == (500, 500)
+
+    def test_cached_variants_are_not_reencoded(
+        self, images_dir: Path, tmp_path: Path, monkeypatch
+    ):
+        """Test that a second run copies variants from the cache."""
+        cache = tmp_path / "cache"
+        generate_resized_images(
+            images_dir, tmp_path / "a", ImageProcessor(cache_dir=cache)
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("image re-encoded")
+
+        monkeypatch.setattr(image_processor, "_encode_source", fail)
+        dist = tmp_path / "b"
+        manifest = generate_resized_images(
+            images_dir, dist, ImageProcessor(cache_dir=cache)
+        )
+        assert manifest["photo.jpg"]["large"][0].width == 1200
+
+        variant = Path("assets/gallery_images/medium/photo.webp")
+        assert (dist / variant).read_bytes() == (tmp_path / "a" / variant).read_bytes()
+
+    def test_changed_source_is_reencoded(
+        self, images_dir: Path, tmp_path: Path, monkeypatch
+    ):
+        """Test that only the modified image misses the cache."""
+        cache = tmp_path / "cache"
+        dist = tmp_path / "dist"
+        generate_resized_images(images_dir, dist, ImageProcessor(cache_dir=cache))
+
+        Image.new("RGB", (1600, 1000), "green").save(images_dir / "photo.jpg")
+        encoded = []
+        original = image_processor._encode_source
+
+        def tracking(src, *args):
+            encoded.append(src.name)
+            return original(src, *args)
+
+        monkeypatch.setattr(image_processor, "_encode_source", tracking)
+        generate_resized_images(images_dir, dist, ImageProcessor(cache_dir=cache))
+
+        assert encoded == ["photo.jpg"]
+        with Image.open(dist / "assets/gallery_images/small/photo.jpg") as img:
+            assert img.getpixel((10, 10))[1] > 100
+
+    def test_parallel_encoding_matches_serial(self, images_dir: Path, tmp_path: Path):
+        """Test that the process pool writes the same variants."""
+        generate_resized_images(images_dir, tmp_path / "serial")
+        generate_resized_images(
+            images_dir, tmp_path / "parallel", ImageProcessor(jobs=2)
+        )
+
+        serial = sorted(
+            p.relative_to(tmp_path / "serial")
+            for p in (tmp_path / "serial").rglob("*.*")
+        )
+        parallel = sorted(
+            p.relative_to(tmp_path / "parallel")
+            for p in (tmp_path / "parallel").rglob("*.*")
+        )
+        assert serial == parallel
+        for rel in serial:
+            assert (tmp_path / "serial" / rel).read_bytes() == (
+                tmp_path / "parallel" / rel
+            ).read_bytes()
@@ -0,0 +1,123 @@
+"""
+Unit tests for the image_processor module.
+"""
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from utils.file_cache import FileCache
+from utils import image_processor
+from utils.image_processor import ImageProcessor, avif_supported
+
+
+@pytest.fixture
+def source_image(tmp_path: Path) -> Path:
+    """A transparent PNG wider than every configured size."""
+    path = tmp_path / "src" / "banner.png"
+    path.parent.mkdir()
+    Image.new("RGBA", (1000, 400), (0, 128, 255, 128)).save(path)
+    return path
+
+
+class TestImageProcessor:
+    """Tests for the ImageProcessor class."""
+
+    def test_variants_use_configured_sizes_and_formats(
+        self, source_image: Path, tmp_path: Path
+    ):
+        """Test that sizes and formats follow the processor settings."""
+        processor = ImageProcessor(sizes={"thumb": 100, "full": 500})
+        variants = processor.generate_responsive_variants(
+            source_image, tmp_path / "out"
+        )
+
+        assert set(variants) == {"thumb", "full"}
+        formats = [v.format for v in variants["thumb"]]
+        assert formats[:2] == ["PNG", "WEBP"]
+        assert ("AVIF" in formats) == avif_supported()
+        assert (variants["full"][0].width, variants["full"][0].height) == (500, 200)
+        assert (tmp_path / "out" / "thumb" / "banner.webp").exists()
+
+    def test_png_keeps_transparency(self, source_image: Path, tmp_path: Path):
+        """Test that alpha survives in PNG variants but not in JPEG ones."""
+        processor = ImageProcessor(sizes={"small": 300}, generate_avif=False)
+        variants = processor.generate_responsive_variants(
+            source_image, tmp_path / "out"
+        )
+
+        with Image.open(variants["small"][0].path) as img:
+            assert img.mode == "RGBA"
+
+    def test_batch_decodes_each_source_once(
+        self, source_image: Path, tmp_path: Path, monkeypatch
+    ):
+        """Test that a batch opens every source a single time."""
+        jpeg = source_image.parent / "photo.jpg"
+        Image.new("RGB", (1600, 900), "red").save(jpeg)
+        opened = []
+        original = Image.open
+
+        def counting_open(fp, *args, **kwargs):
+            opened.append(Path(fp).name)
+            return original(fp, *args, **kwargs)
+
+        monkeypatch.setattr(Image, "open", counting_open)
+        processor = ImageProcessor(generate_avif=False)
+        assert processor.submit_directory(source_image.parent, tmp_path / "out") == 2
+        manifest = processor.flush()
+
+        assert sorted(opened) == ["banner.png", "photo.jpg"]
+        assert len(manifest[jpeg]["large"]) == 2
+
+    @pytest.mark.parametrize("with_file_cache", [True, False])
+    def test_unchanged_source_is_not_read_again(
+        self, source_image: Path, tmp_path: Path, monkeypatch, with_file_cache: bool
+    ):
+        """Test that resubmitting an unchanged source only stat()s it."""
+        processor = ImageProcessor(
+            generate_avif=False,
+            cache_dir=tmp_path / "variants",
+            file_cache=FileCache(tmp_path / "cache") if with_file_cache else None,
+        )
+        processor.submit(source_image, tmp_path / "out")
+        first = [t.cached for t in processor._queue[source_image]]
+
+        def no_read(*args, **kwargs):
+            raise AssertionError("source read again")
+
+        monkeypatch.setattr(Path, "read_bytes", no_read)
+        monkeypatch.setattr(FileCache, "compute_checksum", no_read)
+        processor.submit(source_image, tmp_path / "out")
+
+        assert [t.cached for t in processor._queue[source_image]] == first
+
+    def test_interrupted_install_keeps_the_previous_variant(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """Test that a failed copy from the cache never truncates dest."""
+        cached = tmp_path / "cached.webp"
+        cached.write_bytes(b"new" * 100)
+        dest = tmp_path / "out" / "banner.webp"
+        dest.parent.mkdir()
+        dest.write_bytes(b"old")
+
+        def partial_copy(src, dst):
+            Path(dst).write_bytes(b"ne")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(image_processor.shutil, "copy2", partial_copy)
+        with pytest.raises(OSError):
+            image_processor._install(cached, dest)
+
+        assert dest.read_bytes() == b"old"
+        assert list(dest.parent.iterdir()) == [dest]
+
+    def test_flush_empties_the_queue(self, source_image: Path, tmp_path: Path):
+        """Test that a second flush has nothing left to process."""
+        processor = ImageProcessor(generate_avif=False)
+        processor.submit(source_image, tmp_path / "out")
+
+        assert source_image in processor.flush()
+        assert processor.flush() == {}
@@ -0,0 +1,115 @@
+"""
+Unit tests for the markdown_renderer module.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import markdown
+import pytest
+
+from utils import markdown_renderer
+from utils.markdown_renderer import MarkdownHtmlCache, markdown_to_html, set_html_cache
+
+
+DOCUMENTS = [
+    "# Titre\n\nUn paragraphe avec *emphase*.",
+    "title: Méta\nauthor: A\n\nCorps après les métadonnées.",
+    "Note[^1] et [lien][ref].\n\n[ref]: https://example.org\n",
+    "- un\n- deux\n\n    code indenté\n",
+]
+
+
+@pytest.fixture
+def html_cache(tmp_path: Path):
+    """Enable a persistent HTML cache for the test only."""
+    cache = set_html_cache(tmp_path / "markdown.db")
+    yield cache
+    set_html_cache(None)
+
+
+class TestMarkdownToHtml:
+    """Tests for markdown_to_html."""
+
+    def test_reused_parser_matches_fresh_conversion(self):
+        """Test that resetting the parser leaks no state between documents."""
+        for _ in range(2):
+            for text in DOCUMENTS:
+                assert markdown_to_html(text) == markdown.markdown(
+                    text, extensions=["meta"]
+                )
+
+    def test_cached_html_skips_conversion(self, html_cache, monkeypatch):
+        """Test that a known body is served from the persistent cache."""
+        first = markdown_to_html(DOCUMENTS[0])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Markdown converted again")
+
+        monkeypatch.setattr(markdown_renderer.PythonMarkdownEngine, "convert", fail)
+        # A new cache object reads what the previous one stored
+        set_html_cache(None)
+        set_html_cache(html_cache.path)
+        assert markdown_to_html(DOCUMENTS[0]) == first
+
+    def test_key_depends_on_extensions(self, html_cache):
+        """Test that another extension list is not served from the cache."""
+        text = "Texte~~barré~~ et tableau"
+        assert html_cache.make_key(text, ["meta"]) != html_cache.make_key(
+            text, ["meta", "tables"]
+        )
+        markdown_to_html(text, ["meta"])
+        assert markdown_to_html(text, ["meta", "tables"]) == markdown.markdown(
+            text, extensions=["meta", "tables"]
+        )
+
+    def test_unknown_engine_is_rejected(self):
+        """Test that a misspelled engine name fails early."""
+        with pytest.raises(ValueError):
+            markdown_renderer.set_markdown_engine("commonmark")
+
+    def test_incomplete_engine_fails_when_selected(self, monkeypatch):
+        """Test that an engine without convert() fails before any rendering."""
+
+        class IncompleteEngine(markdown_renderer.MarkdownEngine):
+            name = "incomplete"
+
+        monkeypatch.setitem(
+            markdown_renderer.MARKDOWN_ENGINES, "incomplete", IncompleteEngine
+        )
+        with pytest.raises(TypeError):
+            markdown_renderer.set_markdown_engine("incomplete")
+        assert markdown_renderer.get_markdown_engine() != "incomplete"
+
+
+class TestMarkdownHtmlCache:
+    """Tests for MarkdownHtmlCache eviction."""
+
+    def test_prune_drops_entries_unused_in_session(self, tmp_path: Path):
+        """Test that only entries read or written since the session survive."""
+        cache = MarkdownHtmlCache(tmp_path / "markdown.db")
+        cache.put("kept", "<p>kept</p>")
+        cache.put("stale", "<p>stale</p>")
+
+        session = cache.begin_session()
+        assert cache.get("kept") == "<p>kept</p>"
+        cache.put("new", "<p>new</p>")
+
+        assert cache.prune(session) == 1
+        assert cache.get("stale") is None
+        assert cache.get("kept") == "<p>kept</p>"
+        assert cache.get("new") == "<p>new</p>"
+
+    def test_cache_without_use_column_is_upgraded(self, tmp_path: Path):
+        """Test that a cache written before eviction keeps its entries."""
+        path = tmp_path / "markdown.db"
+        db = sqlite3.connect(str(path))
+        db.execute("CREATE TABLE html (key TEXT PRIMARY KEY, html TEXT NOT NULL)")
+        db.execute("INSERT INTO html VALUES ('old', '<p>old</p>')")
+        db.commit()
+        db.close()
+
+        cache = MarkdownHtmlCache(path)
+        session = cache.begin_session()
+        assert cache.get("old") == "<p>old</p>"
+        assert cache.prune(session) == 0
@@ -0,0 +1,100 @@
+"""
+Unit tests for the output_store module.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core.build_graph import BuildGraph
+from core.output_store import MemoryOutputStore, OutputStore, WriteStats
+
+
+class TestOutputStore:
+    """Tests for the filesystem OutputStore."""
+
+    def test_write_and_remove_prunes_empty_directories(self, tmp_path: Path):
+        """Test that removing the last output removes its directories."""
+        store = OutputStore(tmp_path)
+        page = tmp_path / "blog" / "post" / "index.html"
+        store.write_text(page, "<p>é</p>")
+
+        assert page.read_text(encoding="utf-8") == "<p>é</p>"
+        store.remove(page)
+        assert not (tmp_path / "blog").exists()
+        assert tmp_path.exists()
+
+        with pytest.raises(FileNotFoundError):
+            store.remove(page)
+
+    def test_identical_content_is_not_rewritten(self, tmp_path: Path):
+        """Test that unchanged outputs keep their mtime and are counted."""
+        store = OutputStore(tmp_path)
+        page = tmp_path / "index.html"
+        store.write_text(page, "same")
+        os.utime(page, ns=(1_000_000_000, 1_000_000_000))
+
+        store.write_text(page, "same")
+        assert page.stat().st_mtime_ns == 1_000_000_000
+
+        store.write_text(page, "changed")
+        assert page.read_text(encoding="utf-8") == "changed"
+        assert page.stat().st_mtime_ns != 1_000_000_000
+        assert [p.name for p in tmp_path.iterdir()] == ["index.html"]
+
+        store.remove(page)
+        assert store.reset_stats() == WriteStats(written=2, unchanged=1, deleted=1)
+        assert store.stats == WriteStats()
+
+
+class TestMemoryOutputStore:
+    """Tests for the MemoryOutputStore class."""
+
+    def test_outputs_never_touch_disk(self, tmp_path: Path):
+        """Test that written outputs are only kept in memory."""
+        store = MemoryOutputStore(tmp_path)
+        page = tmp_path / "index.html"
+        store.write_text(page, "home")
+
+        assert not page.exists()
+        assert store.exists(page)
+        revision, content = store.get(page)
+        assert content == b"home"
+
+        store.write_text(page, "home v2")
+        assert store.get(page)[0] > revision
+
+    def test_lazy_outputs_render_on_first_read(self, tmp_path: Path):
+        """Test that deferred pages are rendered once, when first read."""
+        store = MemoryOutputStore(tmp_path, lazy=True)
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "rendered"
+
+        page = tmp_path / "blog" / "index.html"
+        store.defer(page, render)
+        assert store.exists(page)
+        assert calls == []
+
+        assert store.get(page)[1] == b"rendered"
+        assert store.get(page)[1] == b"rendered"
+        assert calls == [1]
+        assert store.get(tmp_path / "missing.html") is None
+
+    def test_build_graph_sweeps_memory_outputs(self, tmp_path: Path):
+        """Test that a graph over a memory store removes stale pages from it."""
+        store = MemoryOutputStore(tmp_path)
+        graph = BuildGraph(None, tmp_path, store=store)
+        kept, gone = tmp_path / "kept.html", tmp_path / "gone.html"
+        for page in (kept, gone):
+            graph.is_fresh(page, "page.html", "fr")
+            store.write_text(page, "x")
+            graph.record(page)
+
+        graph.begin_build()
+        assert graph.is_fresh(kept, "page.html", "fr") is True
+        assert graph.sweep() == [gone]
+        assert store.paths() == [kept]
@@ -0,0 +1,167 @@
+"""
+Unit tests for the render_queue module.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.build_profiler import MARKDOWN, PAGE, TEMPLATE, BuildProfiler
+from core.output_store import MemoryOutputStore
+from core.render_queue import RenderQueue
+from core.template_renderer import create_jinja_environment
+
+
+@pytest.fixture
+def templates_path(tmp_path: Path) -> Path:
+    """Templates exercising the custom filters."""
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "page.html").write_text(
+        "<h1>{{ page.title | slugify }}</h1>{{ page.date | date }}"
+        "{{ content | safe }}{{ t.read_more }}{{ site.title }}"
+        "{% if is_multilingual %}multi{% endif %}",
+        encoding="utf-8",
+    )
+    (templates / "post.html").write_text(
+        "{{ page.url }}|{{ page.title }}|{{ content | safe }}", encoding="utf-8"
+    )
+    return templates
+
+
+def _render_all(queue: RenderQueue, out: Path) -> None:
+    for i in range(6):
+        queue.render_template(
+            out / f"page-{i}" / "index.html",
+            "page.html",
+            "fr",
+            {"page": {"title": f"Élément {i}", "date": "2025-11-25"}},
+            markdown=f"# Titre {i}\n\nTexte *{i}*.",
+        )
+    queue.render_content(
+        out / "post" / "index.html",
+        "post.html",
+        "fr",
+        raw="---\ntitle: Post\n---\n# Body\n",
+        front_matter={"title": "Post"},
+        body="# Body\n",
+        slug="post",
+    )
+    queue.drain()
+
+
+class TestRenderQueue:
+    """Tests for the RenderQueue class."""
+
+    site_config = {"title": "Site", "languages": ["fr", "en"], "blog_url": "/blog/"}
+    translations = {"fr": {"read_more": "Lire la suite"}}
+
+    def _queue(
+        self, templates_path: Path, jobs: int, store=None, profiler=None
+    ) -> RenderQueue:
+        env = create_jinja_environment(templates_path, is_multilingual=True)
+        return RenderQueue(
+            env,
+            templates_path,
+            self.site_config,
+            self.translations,
+            {},
+            jobs=jobs,
+            store=store,
+            profiler=profiler,
+        )
+
+    def test_parallel_output_matches_serial(self, templates_path: Path, tmp_path: Path):
+        """Test that worker processes produce byte-identical files."""
+        serial = self._queue(templates_path, jobs=1)
+        parallel = self._queue(templates_path, jobs=2)
+        try:
+            _render_all(serial, tmp_path / "serial")
+            _render_all(parallel, tmp_path / "parallel")
+        finally:
+            parallel.close()
+
+        serial_files = sorted(
+            p.relative_to(tmp_path / "serial") for p in (tmp_path / "serial").rglob("*.html")
+        )
+        parallel_files = sorted(
+            p.relative_to(tmp_path / "parallel")
+            for p in (tmp_path / "parallel").rglob("*.html")
+        )
+        assert serial_files == parallel_files
+        assert len(serial_files) == 7
+        for rel in serial_files:
+            assert (tmp_path / "serial" / rel).read_bytes() == (
+                tmp_path / "parallel" / rel
+            ).read_bytes()
+
+    def test_serial_render_uses_filters_and_shared_values(
+        self, templates_path: Path, tmp_path: Path
+    ):
+        """Test that shared values and Markdown content are injected."""
+        queue = self._queue(templates_path, jobs=1)
+        _render_all(queue, tmp_path)
+
+        html = (tmp_path / "page-1" / "index.html").read_text(encoding="utf-8")
+        assert "<h1>element-1</h1>" in html
+        assert "25 novembre 2025" in html
+        assert "<h1>Titre 1</h1>" in html
+        assert "Lire la suite" in html
+        assert "Site" in html
+        assert "multi" in html
+
+        post = (tmp_path / "post" / "index.html").read_text(encoding="utf-8")
+        assert post.startswith("/fr/blog/post|Post|")
+
+    def test_last_write_wins_for_duplicate_outputs(
+        self, templates_path: Path, tmp_path: Path
+    ):
+        """Test that a later submission for the same file is kept."""
+        queue = self._queue(templates_path, jobs=2)
+        output = tmp_path / "index.html"
+        try:
+            for title in ("first", "second"):
+                queue.render_template(
+                    output, "page.html", "fr", {"page": {"title": title, "date": "2025-01-01"}}
+                )
+            queue.drain()
+        finally:
+            queue.close()
+
+        assert "<h1>second</h1>" in output.read_text(encoding="utf-8")
+
+    def test_lazy_store_renders_on_read(self, templates_path: Path, tmp_path: Path):
+        """Test that a lazy memory store gets the same pages, rendered on read."""
+        _render_all(self._queue(templates_path, jobs=1), tmp_path / "disk")
+
+        store = MemoryOutputStore(tmp_path / "memory", lazy=True)
+        _render_all(self._queue(templates_path, jobs=2, store=store), tmp_path / "memory")
+
+        assert not (tmp_path / "memory").exists()
+        assert len(store) == 7
+        for page in (tmp_path / "disk").rglob("*.html"):
+            rel = page.relative_to(tmp_path / "disk")
+            assert store.get(tmp_path / "memory" / rel)[1] == page.read_bytes()
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_profiler_times_every_page(
+        self, templates_path: Path, tmp_path: Path, jobs: int
+    ):
+        """Test that pages are timed in the build process and in workers."""
+        profiler = BuildProfiler(root=tmp_path)
+        queue = self._queue(templates_path, jobs=jobs, profiler=profiler)
+        try:
+            _render_all(queue, tmp_path)
+        finally:
+            queue.close()
+
+        counts = {}
+        for span in profiler.spans:
+            counts[span.category] = counts.get(span.category, 0) + 1
+        assert counts == {PAGE: 7, TEMPLATE: 7, MARKDOWN: 7}
+        report = profiler.report()
+        assert report["total"]["pages"] == 7
+        assert {t["name"]: t["count"] for t in report["templates"]} == {
+            "page.html": 6,
+            "post.html": 1,
+        }
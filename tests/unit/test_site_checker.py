@@ -0,0 +1,118 @@
+"""
+Unit tests for the site_checker module.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.site_checker import check_config, check_content, check_site, check_templates
+
+
+@pytest.fixture
+def src_path(tmp_path: Path) -> Path:
+    """A minimal valid source tree."""
+    src = tmp_path / "src"
+    (src / "config").mkdir(parents=True)
+    (src / "data").mkdir()
+    (src / "templates").mkdir()
+    (src / "locales" / "fr" / "posts").mkdir(parents=True)
+    (src / "config" / "site_config.yaml").write_text(
+        "title: Site\nlanguages: [fr]\n", encoding="utf-8"
+    )
+    (src / "data" / "translations.yaml").write_text(
+        "fr:\n  read_more: Lire la suite\n", encoding="utf-8"
+    )
+    (src / "templates" / "post.html").write_text(
+        "{{ page.date | date('long', 'fr') }}", encoding="utf-8"
+    )
+    (src / "locales" / "fr" / "posts" / "post.md").write_text(
+        "---\ntitle: Post\ndate: 2025-01-02\n---\n\nTexte.\n", encoding="utf-8"
+    )
+    return src
+
+
+class TestCheckSite:
+    """Tests for check_site and the individual checks."""
+
+    def test_valid_sources_have_no_problem(self, src_path: Path):
+        """Test that a valid tree passes every check."""
+        assert check_site(src_path) == []
+
+    def test_frontmatter_accepted_by_the_builders(self, src_path: Path):
+        """Test that numeric translation ids and unused post templates pass."""
+        (src_path / "locales" / "fr" / "posts" / "post.md").write_text(
+            "---\ntitle: Post\ntranslation_id: 1\ntemplate: fosse\n---\n",
+            encoding="utf-8",
+        )
+        assert check_content(src_path) == []
+
+    def test_page_template_must_be_html(self, src_path: Path):
+        """Test that the schema's template suffix rule still applies to pages."""
+        pages = src_path / "locales" / "fr" / "pages"
+        pages.mkdir()
+        (pages / "about.md").write_text(
+            "---\ntitle: About\ntemplate: fosse\n---\n", encoding="utf-8"
+        )
+        problems = check_content(src_path)
+
+        assert len(problems) == 1
+        assert "template must be an HTML file" in problems[0]
+
+    def test_missing_page_template(self, src_path: Path):
+        """Test that a page rendered with a template that does not exist is reported."""
+        pages = src_path / "locales" / "fr" / "pages"
+        pages.mkdir()
+        (pages / "about.md").write_text(
+            "---\ntitle: About\ntemplate: pages/about.html\n---\n", encoding="utf-8"
+        )
+        assert check_content(src_path) == [
+            "locales/fr/pages/about.md: template not found: pages/about.html"
+        ]
+
+    def test_invalid_site_config(self, src_path: Path):
+        """Test that a schema violation in site_config.yaml is reported."""
+        (src_path / "config" / "site_config.yaml").write_text(
+            "title: Site\nposts_per_page: 0\n", encoding="utf-8"
+        )
+        problems = check_config(src_path)
+
+        assert len(problems) == 1
+        assert problems[0].startswith("config/site_config.yaml:")
+
+    def test_language_without_translations(self, src_path: Path):
+        """Test that a configured language missing from translations is reported."""
+        (src_path / "config" / "site_config.yaml").write_text(
+            "title: Site\nlanguages: [fr, en]\n", encoding="utf-8"
+        )
+        assert check_config(src_path) == [
+            "data/translations.yaml: no translations for 'en'"
+        ]
+
+    def test_invalid_frontmatter(self, src_path: Path):
+        """Test that bad metadata and bad YAML are reported per file."""
+        posts = src_path / "locales" / "fr" / "posts"
+        (posts / "bad-date.md").write_text(
+            "---\ntitle: Post\ndate: 02/01/2025\n---\n", encoding="utf-8"
+        )
+        (posts / "bad-yaml.md").write_text(
+            "---\ntitle: [unclosed\n---\n", encoding="utf-8"
+        )
+        problems = check_content(src_path)
+
+        assert [p.split(":")[0] for p in problems] == [
+            "locales/fr/posts/bad-date.md",
+            "locales/fr/posts/bad-yaml.md",
+        ]
+
+    def test_broken_template(self, src_path: Path):
+        """Test that syntax errors and unknown filters are reported."""
+        templates = src_path / "templates"
+        (templates / "syntax.html").write_text("{% if %}", encoding="utf-8")
+        (templates / "filter.html").write_text("{{ x | nope }}", encoding="utf-8")
+        problems = check_templates(src_path)
+
+        assert [p.split(":")[0] for p in problems] == [
+            "templates/filter.html",
+            "templates/syntax.html",
+        ]
@@ -0,0 +1,147 @@
+"""
+Unit tests for the static_file_manager module.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.build_manifest import BuildManifest
+from core.static_file_manager import StaticFileManager
+from utils.file_cache import FileCache
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Path:
+    """Source tree with a few assets and a legacy images folder."""
+    assets = tmp_path / "src" / "assets"
+    (assets / "images").mkdir(parents=True)
+    (assets / "fonts").mkdir()
+    (assets / "images" / "logo.png").write_bytes(b"png" * 100)
+    (assets / "fonts" / "font.woff2").write_bytes(b"woff" * 100)
+    return tmp_path
+
+
+def _manager(site: Path, **kwargs) -> StaticFileManager:
+    return StaticFileManager(site / "src", site / "dist", **kwargs)
+
+
+class TestStaticFileManager:
+    """Tests for the StaticFileManager class."""
+
+    def test_copies_assets_and_legacy_alias(self, site: Path):
+        """Test that every asset and the /images mirror are reported."""
+        outputs = _manager(site).copy_static_files()
+
+        dist = site / "dist"
+        assert sorted(p.relative_to(dist).as_posix() for p in outputs) == [
+            "assets/fonts/font.woff2",
+            "assets/images/logo.png",
+            "images/logo.png",
+        ]
+        assert (dist / "images" / "logo.png").read_bytes() == b"png" * 100
+
+    def test_unchanged_assets_are_decided_from_stat(self, site: Path, monkeypatch):
+        """Test that a warm hash store never reads unchanged files."""
+        cache_dir = site / "cache"
+        _manager(site, file_cache=FileCache(cache_dir)).copy_static_files()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file hashed")
+
+        monkeypatch.setattr(FileCache, "compute_checksum", staticmethod(fail))
+        _manager(site, file_cache=FileCache(cache_dir)).copy_static_files()
+
+    def test_copy_does_not_stat_every_cache_entry(self, site: Path, monkeypatch):
+        """Test that a static copy never walks the whole hash store."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("whole cache pruned")
+
+        monkeypatch.setattr(FileCache, "prune_missing", fail)
+        _manager(site, file_cache=FileCache(site / "cache")).copy_static_files()
+
+    def test_same_size_edit_is_copied(self, site: Path):
+        """Test that content changes are detected when the size is equal."""
+        cache_dir = site / "cache"
+        _manager(site, file_cache=FileCache(cache_dir)).copy_static_files()
+
+        (site / "src" / "assets" / "fonts" / "font.woff2").write_bytes(b"WOFF" * 100)
+        _manager(site, file_cache=FileCache(cache_dir)).copy_static_files()
+
+        copied = site / "dist" / "assets" / "fonts" / "font.woff2"
+        assert copied.read_bytes() == b"WOFF" * 100
+
+    def test_hardlink_mode_links_files(self, site: Path):
+        """Test that hardlink mode shares the source inode."""
+        _manager(site, copy_mode="hardlink").copy_static_files()
+
+        src = site / "src" / "assets" / "images" / "logo.png"
+        dst = site / "dist" / "assets" / "images" / "logo.png"
+        assert dst.stat().st_ino == src.stat().st_ino
+
+    def test_unknown_copy_mode_is_rejected(self, site: Path):
+        """Test that a misspelled mode fails early."""
+        with pytest.raises(ValueError):
+            _manager(site, copy_mode="symlink")
+
+    def test_symlink_alias_replaces_previous_mirror(self, site: Path):
+        """Test that symlink mode links /images without losing the assets."""
+        dist = site / "dist"
+        manifest = BuildManifest(site / "cache" / "manifest.json", dist)
+        manifest.begin_build()
+        manifest.add_all(_manager(site).copy_static_files())
+        manifest.save()
+
+        manifest.begin_build()
+        manifest.add_all(_manager(site, images_alias="symlink").copy_static_files())
+        manifest.sweep()
+
+        assert (dist / "images").is_symlink()
+        assert (dist / "images" / "logo.png").read_bytes() == b"png" * 100
+        assert (dist / "assets" / "images" / "logo.png").exists()
+
+    def test_redirect_alias_writes_netlify_rule(self, site: Path):
+        """Test that redirect mode writes _redirects instead of copies."""
+        outputs = _manager(site, images_alias="redirect").copy_static_files()
+
+        dist = site / "dist"
+        assert dist / "_redirects" in outputs
+        assert not (dist / "images").exists()
+        rule = (dist / "_redirects").read_text(encoding="utf-8").split()
+        assert rule == ["/images/*", "/assets/images/:splat", "301"]
+
+    def test_redirect_alias_keeps_other_rules(self, site: Path):
+        """Test that the rule is added to an existing _redirects, once."""
+        redirects = site / "dist" / "_redirects"
+        redirects.parent.mkdir()
+        redirects.write_text("/blog/*  /posts/:splat  301", encoding="utf-8")
+
+        manager = _manager(site, images_alias="redirect")
+        outputs = manager.copy_static_files()
+        mtime = redirects.stat().st_mtime_ns
+        manager.copy_static_files()
+
+        lines = redirects.read_text(encoding="utf-8").splitlines()
+        assert [line.split() for line in lines] == [
+            ["/blog/*", "/posts/:splat", "301"],
+            ["/images/*", "/assets/images/:splat", "301"],
+        ]
+        assert redirects.stat().st_mtime_ns == mtime
+        assert redirects not in outputs
+
+    def test_leaving_redirect_mode_removes_the_rule(self, site: Path):
+        """Test that another alias mode drops the rule but not the others."""
+        redirects = site / "dist" / "_redirects"
+        redirects.parent.mkdir()
+        redirects.write_text("/blog/*  /posts/:splat  301\n", encoding="utf-8")
+        _manager(site, images_alias="redirect").copy_static_files()
+
+        _manager(site, images_alias="none").copy_static_files()
+
+        assert redirects.read_text(encoding="utf-8") == "/blog/*  /posts/:splat  301\n"
+
+    def test_unknown_images_alias_is_rejected(self, site: Path):
+        """Test that a misspelled alias mode fails early."""
+        with pytest.raises(ValueError):
+            _manager(site, images_alias="link")
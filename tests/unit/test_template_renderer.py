@@ -0,0 +1,92 @@
+"""
+Unit tests for the template_renderer module.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core.template_renderer import create_jinja_environment, precompile_templates
+
+
+@pytest.fixture
+def templates_path(tmp_path: Path) -> Path:
+    """A small templates tree with a layout and a partial."""
+    templates = tmp_path / "templates"
+    (templates / "components").mkdir(parents=True)
+    (templates / "base.html").write_text(
+        "<main>{% block main %}{% endblock %}</main>", encoding="utf-8"
+    )
+    (templates / "page.html").write_text(
+        '{% extends "base.html" %}{% block main %}'
+        '{% include "components/title.html" %}{% endblock %}',
+        encoding="utf-8",
+    )
+    (templates / "components" / "title.html").write_text(
+        "<h1>{{ page.title | slugify }}</h1>", encoding="utf-8"
+    )
+    return templates
+
+
+class TestBytecodeCache:
+    """Tests for the persistent template bytecode cache."""
+
+    def _render(self, templates_path: Path, cache_dir: Path) -> str:
+        env = create_jinja_environment(templates_path, False, cache_dir)
+        return env.get_template("page.html").render(page={"title": "Élément Un"})
+
+    def test_compiled_templates_are_stored(self, templates_path: Path, tmp_path: Path):
+        """Test that rendering writes one cache file per compiled template."""
+        cache_dir = tmp_path / "cache"
+        assert self._render(templates_path, cache_dir) == (
+            "<main><h1>element-un</h1></main>"
+        )
+        assert len(list(cache_dir.iterdir())) == 3
+
+    def test_cached_code_is_loaded(self, templates_path: Path, tmp_path: Path):
+        """Test that a new environment renders from the cache without compiling."""
+        cache_dir = tmp_path / "cache"
+        expected = self._render(templates_path, cache_dir)
+
+        env = create_jinja_environment(templates_path, False, cache_dir)
+        env.compile = None  # Any compilation would fail
+        assert env.get_template("page.html").render(
+            page={"title": "Élément Un"}
+        ) == expected
+
+    def test_edited_template_is_recompiled(self, templates_path: Path, tmp_path: Path):
+        """Test that a changed source invalidates its cached code."""
+        cache_dir = tmp_path / "cache"
+        self._render(templates_path, cache_dir)
+        partial = templates_path / "components" / "title.html"
+        stat = partial.stat()
+        partial.write_text("<h2>{{ page.title | slugify }}</h2>", encoding="utf-8")
+        # Even with the previous mtime, the source checksum differs
+        os.utime(partial, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert self._render(templates_path, cache_dir) == (
+            "<main><h2>element-un</h2></main>"
+        )
+
+    def test_without_cache_dir(self, templates_path: Path):
+        """Test that the environment has no bytecode cache by default."""
+        env = create_jinja_environment(templates_path, False)
+        assert env.bytecode_cache is None
+
+
+class TestPrecompileTemplates:
+    """Tests for the precompile_templates function."""
+
+    def test_compiles_whole_tree(self, templates_path: Path, tmp_path: Path):
+        """Test that every template is compiled into the cache."""
+        cache_dir = tmp_path / "cache"
+        env = create_jinja_environment(templates_path, False, cache_dir)
+        assert precompile_templates(env) == 3
+        assert len(list(cache_dir.iterdir())) == 3
+
+    def test_broken_template_is_skipped(self, templates_path: Path, tmp_path: Path):
+        """Test that a template that does not compile is left out."""
+        (templates_path / "broken.html").write_text("{% if %}", encoding="utf-8")
+        env = create_jinja_environment(templates_path, False, tmp_path / "cache")
+        assert precompile_templates(env) == 3